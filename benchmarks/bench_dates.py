@@ -0,0 +1,61 @@
+"""Compare per-row strptime + tzinfo replacement with the memoized day table.
+
+Parses the day keys of a synthetic multi-year history the way the client
+used to (`strptime(...).replace(tzinfo=pytz_tz)`) and the way it does now
+(`dates.parse_day`), cold and warm, and checks the resulting UTC offsets.
+
+    python benchmarks/bench_dates.py [--days 1100] [--rounds 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(
+    0, str(Path(__file__).resolve().parent.parent / "custom_components" / "gazdebordeaux")
+)
+import dates
+
+try:
+    import pytz
+
+    LEGACY_TZ = pytz.timezone("Europe/Paris")
+except ImportError:  # pytz is no longer a requirement; same parse cost either way
+    LEGACY_TZ = dates.PARIS
+
+
+def _legacy(keys: list[str]) -> list[datetime]:
+    return [datetime.strptime(key, "%Y-%m-%d").replace(tzinfo=LEGACY_TZ) for key in keys]
+
+
+def _table(keys: list[str]) -> list[datetime]:
+    return [dates.parse_day(key) for key in keys]
+
+
+def main(days: int, rounds: int) -> None:
+    start = date(2022, 1, 1)
+    keys = [(start + timedelta(days=i)).isoformat() for i in range(days)]
+
+    legacy = timeit.timeit(lambda: _legacy(keys), number=rounds) / rounds
+    dates._midnight.cache_clear()
+    cold = timeit.timeit(lambda: _table(keys), number=1)
+    warm = timeit.timeit(lambda: _table(keys), number=rounds) / rounds
+
+    per_row = 1e6 / days
+    print(f"legacy     {legacy * per_row:6.2f} us/row")
+    print(f"table cold {cold * per_row:6.2f} us/row")
+    print(f"table warm {warm * per_row:6.2f} us/row  ({legacy / warm:.1f}x)")
+    offsets = _legacy(keys[:1])[0].utcoffset(), _table(keys[:1])[0].utcoffset()
+    print(f"offsets    legacy={offsets[0]} table={offsets[1]}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=1100)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+    main(args.days, args.rounds)
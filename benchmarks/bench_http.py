@@ -0,0 +1,127 @@
+"""Compare the shared-session request path with the dedicated, tuned session.
+
+Serves a synthetic multi-year consumption payload from a local aiohttp
+server (with response compression, like the real site) and reports, for
+each variant, the response bytes on the wire and the per-request latency.
+
+    python benchmarks/bench_http.py [--requests 200] [--days 1100]
+
+No Home Assistant and no live account needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from aiohttp import ClientSession, web
+
+sys.path.insert(
+    0, str(Path(__file__).resolve().parent.parent / "custom_components" / "gazdebordeaux")
+)
+from gazdebordeaux import BROWSER_HEADERS, create_session
+
+TOKEN = "bench-token"
+
+
+def _payload(days: int) -> dict:
+    start = date(2022, 1, 1)
+    data: dict = {
+        (start + timedelta(days=i)).isoformat(): {
+            "kwh": 30.5 + i % 7,
+            "volumeOfEnergy": 2.7,
+            "price": 3.41,
+            "ratio": 11.2,
+            "temperature": 9.5,
+        }
+        for i in range(days)
+    }
+    data["total"] = {"kwh": 12345.0, "volumeOfEnergy": 1100.0, "price": 1500.0}
+    return data
+
+
+async def _start_server(days: int) -> tuple[web.AppRunner, str]:
+    body = _payload(days)
+
+    async def handler(request: web.Request) -> web.Response:
+        response = web.json_response(body)
+        response.enable_compression()
+        return response
+
+    app = web.Application()
+    app.router.add_get("/api/houses/bench/consumptions", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    return runner, f"http://127.0.0.1:{port}/api/houses/bench/consumptions"
+
+
+def _legacy_headers() -> dict:
+    # What async_get_data used to build on every call.
+    return {
+        **{k: v for k, v in BROWSER_HEADERS.items() if k != "Accept-Encoding"},
+        "Authorization": "Bearer " + TOKEN,
+        "Connection": "keep-alive",
+        "Content-Type": "application/json",
+    }
+
+
+async def _wire_bytes(url: str, headers: dict) -> tuple[int, str]:
+    # auto_decompress=False exposes the body exactly as it was sent.
+    async with (
+        ClientSession(auto_decompress=False) as session,
+        session.get(url, headers=headers) as response,
+    ):
+        raw = await response.read()
+        return len(raw), response.headers.get("Content-Encoding", "identity")
+
+
+async def _latencies(session: ClientSession, url: str, headers_fn, count: int) -> list[float]:
+    samples = []
+    for _ in range(count):
+        t0 = time.perf_counter()
+        async with session.get(url, headers=headers_fn(), params={"scale": "month"}) as response:
+            await response.json(content_type=None)
+        samples.append((time.perf_counter() - t0) * 1000)
+    return samples
+
+
+def _report(name: str, wire: tuple[int, str], samples: list[float]) -> None:
+    samples.sort()
+    print(
+        f"{name:<10} wire={wire[0]:>8} B ({wire[1]:<8}) "
+        f"mean={statistics.fmean(samples):6.2f} ms "
+        f"p50={samples[len(samples) // 2]:6.2f} ms "
+        f"p95={samples[int(len(samples) * 0.95)]:6.2f} ms"
+    )
+
+
+async def main(count: int, days: int) -> None:
+    runner, url = await _start_server(days)
+    try:
+        prebuilt = {**BROWSER_HEADERS, "Authorization": "Bearer " + TOKEN}
+
+        async with ClientSession() as shared:
+            before = await _latencies(shared, url, _legacy_headers, count)
+        async with create_session() as tuned:
+            after = await _latencies(tuned, url, lambda: prebuilt, count)
+
+        _report("before", await _wire_bytes(url, _legacy_headers()), before)
+        _report("after", await _wire_bytes(url, prebuilt), after)
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--days", type=int, default=1100)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.days))
@@ -0,0 +1,83 @@
+"""Import time of the integration's modules, each in a fresh interpreter.
+
+For every target, spawns `--runs` interpreters that import it and report the
+import wall time and which of the known heavy modules ended up loaded. The
+pure-Python client modules are always measured; the Home Assistant-facing
+ones (package, config flow, coordinator) only when Home Assistant is
+installed.
+
+    python benchmarks/bench_import.py [--runs 15]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE_DIR = ROOT / "custom_components" / "gazdebordeaux"
+
+# Only needed by some code paths; should not load with the client or config flow.
+HEAVY = (
+    "cProfile",
+    "pstats",
+    "tracemalloc",
+    "pytz",
+    "homeassistant.components.recorder.statistics",
+)
+
+PURE_TARGETS = ("gazdebordeaux", "dates", "transport", "profiling")
+HA_TARGETS = (
+    "custom_components.gazdebordeaux",
+    "custom_components.gazdebordeaux.config_flow",
+    "custom_components.gazdebordeaux.coordinator",
+)
+
+CHILD = """
+import importlib, json, sys, time
+sys.path.insert(0, {path!r})
+t0 = time.perf_counter()
+importlib.import_module({target!r})
+elapsed = time.perf_counter() - t0
+print(json.dumps({{"ms": elapsed * 1000, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def _measure(target: str, path: Path, runs: int) -> tuple[list[float], list[str]]:
+    samples: list[float] = []
+    heavy: list[str] = []
+    code = CHILD.format(path=str(path), target=target, heavy=HEAVY)
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(out)
+        samples.append(result["ms"])
+        heavy = result["heavy"]
+    return samples, heavy
+
+
+def main(runs: int) -> None:
+    targets = [(t, PACKAGE_DIR) for t in PURE_TARGETS]
+    if importlib.util.find_spec("homeassistant") is not None:
+        targets += [(t, ROOT) for t in HA_TARGETS]
+    else:
+        print("(Home Assistant not installed: HA-facing modules skipped)")
+    for target, path in targets:
+        samples, heavy = _measure(target, path, runs)
+        print(
+            f"{target:<45} median={statistics.median(samples):7.2f} ms "
+            f"min={min(samples):7.2f} ms heavy={','.join(heavy) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15)
+    args = parser.parse_args()
+    main(args.runs)
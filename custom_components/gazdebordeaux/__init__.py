@@ -2,21 +2,57 @@
 
 from __future__ import annotations
 
+import importlib
+from types import ModuleType
+from typing import TYPE_CHECKING
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN
-from .coordinator import GdbCoordinator
+from .websocket import async_setup_websocket
+
+# The coordinator pulls in the recorder statistics API, and the services the
+# export and profiling modules; they're imported when first needed (in the
+# import executor, not the event loop), so loading the package for the
+# config flow stays light.
+if TYPE_CHECKING:
+    from .coordinator import GdbCoordinator
+
+
+async def _async_import(hass: HomeAssistant, module: str) -> ModuleType:
+    return await hass.async_add_import_executor_job(importlib.import_module, f"{__name__}.{module}")
+
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Gaz de Bordeaux services and websocket commands."""
+    services = await _async_import(hass, "services")
+    services.async_setup_services(hass)
+    async_setup_websocket(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Gaz de Bordeaux from a config entry."""
-
-    coordinator = GdbCoordinator(hass, entry.data)
-    await coordinator.async_config_entry_first_refresh()
+    coordinator_module = await _async_import(hass, "coordinator")
+    coordinator: GdbCoordinator = coordinator_module.GdbCoordinator(
+        hass, entry.data, entry_id=entry.entry_id
+    )
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Setup is retried with a new coordinator: this one's session and
+        # import workers go now.
+        await coordinator.async_shutdown()
+        raise
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -27,6 +63,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: GdbCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the cached data of a removed entry."""
+    coordinator_module = await _async_import(hass, "coordinator")
+    await coordinator_module.async_remove_cache(hass, entry.entry_id)
@@ -8,11 +8,11 @@ from typing import Any
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry, ConfigFlow, ConfigFlowResult
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.core import callback
 
-from .const import DOMAIN
-from .gazdebordeaux import Gazdebordeaux
+from .const import DISCOVERY, DOMAIN, HOUSE
+from .discovery import async_discover, house_data, house_selector
+from .gazdebordeaux import Discovery
 from .option_flow import GazdebordeauxOptionFlow
 
 _LOGGER = logging.getLogger(__name__)
@@ -25,21 +25,6 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
-async def _validate_login(hass: HomeAssistant, login_data: dict[str, str]) -> dict[str, str]:
-    """Validate login data and return any errors."""
-    api = Gazdebordeaux(
-        async_create_clientsession(hass),
-        login_data[CONF_USERNAME],
-        login_data[CONF_PASSWORD],
-    )
-    errors: dict[str, str] = {}
-    try:
-        await api.async_login()
-    except Exception:
-        errors["base"] = "invalid_auth"
-    return errors
-
-
 class GazdebordeauxConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Gazdebordeaux."""
 
@@ -49,27 +34,69 @@ class GazdebordeauxConfigFlow(ConfigFlow, domain=DOMAIN):
         """Initialize a new GazdebordeauxConfigFlow."""
         self.reauth_entry: ConfigEntry | None = None
         self.utility_info: dict[str, Any] | None = None
+        self._login_data: dict[str, Any] = {}
+        self._discovery: Discovery | None = None
 
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
         """Handle the initial step."""
         errors: dict[str, str] = {}
         if user_input is not None:
-            errors = await _validate_login(self.hass, user_input)
-            if not errors:
+            try:
+                self._discovery = await async_discover(self.hass, user_input)
+            except Exception:
+                errors["base"] = "invalid_auth"
+            else:
+                if not self._discovery.contracts:
+                    return self.async_abort(reason="no_contracts")
+                self._login_data = user_input
+                if len(self._discovery.contracts) > 1:
+                    return await self.async_step_house()
                 return self._async_create_gazdebordeaux_entry(user_input)
 
         return self.async_show_form(
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
 
+    async def async_step_house(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
+        """Pick one contract, or none to import every supported one."""
+        assert self._discovery is not None
+        if user_input is not None:
+            return self._async_create_gazdebordeaux_entry(
+                {
+                    **self._login_data,
+                    **house_data(self._discovery.contracts, user_input.get(HOUSE)),
+                }
+            )
+
+        return self.async_show_form(
+            step_id="house",
+            data_schema=vol.Schema(
+                {vol.Optional(HOUSE): house_selector(self._discovery.contracts)}
+            ),
+        )
+
     @callback
     def _async_create_gazdebordeaux_entry(self, data: dict[str, Any]) -> ConfigFlowResult:
-        """Create the config entry."""
+        """Create the config entry.
+
+        The login and house list of the flow are handed over to the setup of
+        the entry, so its first refresh doesn't repeat them.
+        """
+        if self._discovery is not None:
+            self.hass.data.setdefault(DISCOVERY, {})[data[CONF_USERNAME]] = self._discovery
         return self.async_create_entry(
             title=f"({data[CONF_USERNAME]})",
             data=data,
         )
 
+    @callback
+    def async_remove(self) -> None:
+        """Drop the hand-off to the entry setup if the setup didn't take it."""
+        discoveries = self.hass.data.get(DISCOVERY, {})
+        username = self._login_data.get(CONF_USERNAME)
+        if self._discovery is not None and discoveries.get(username) is self._discovery:
+            del discoveries[username]
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry: ConfigEntry):
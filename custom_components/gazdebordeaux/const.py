@@ -3,3 +3,30 @@
 DOMAIN = "gazdebordeaux"
 RESET_STATISTICS = "reset_stats"
 HOUSE = "house"
+# Contract category of the pinned HOUSE, when it was picked from the list.
+CATEGORY = "category"
+TARIFF_KWH_PRICE = "tariff_kwh_price"
+TARIFF_SUBSCRIPTION = "tariff_subscription"
+# First day of the tariff above (ISO date), empty for always; the periods it
+# replaced are kept, before it, in TARIFF_PERIODS (TariffPeriod.as_dict).
+TARIFF_START = "tariff_start"
+TARIFF_PERIODS = "tariff_periods"
+DEDICATED_SESSION = "dedicated_session"
+RECORD_PAYLOADS = "record_payloads"
+# Load profile of the shaped hourly consumption statistic (hourly.PROFILES), "off" for none.
+HOURLY_PROFILE = "hourly_profile"
+# Contract categories the integration imports (coordinator.COMMODITIES).
+SUPPORTED_CATEGORIES = ("gas", "electricity")
+# hass.data key of the config flow's Discovery, by username, until setup takes it.
+DISCOVERY = f"{DOMAIN}_discovery"
+
+SERVICE_IMPORT_RANGE = "import_range"
+ATTR_START = "start"
+ATTR_END = "end"
+SERVICE_PROFILE_REFRESH = "profile_refresh"
+ATTR_TOP = "top"
+SERVICE_EXPORT = "export"
+ATTR_FORMAT = "format"
+EVENT_IMPORT_PROGRESS = f"{DOMAIN}_import_progress"
+# Days written to the daily statistics, one event per contract and refresh/import.
+EVENT_NEW_DATA = f"{DOMAIN}_new_data"
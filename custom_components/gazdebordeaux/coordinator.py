@@ -1,10 +1,16 @@
 """Coordinator to handle Opower connections."""
 
+import asyncio
+import contextlib
+import dataclasses
+import functools
 import logging
-from datetime import datetime, timedelta
+from collections.abc import Callable, Iterable, Mapping
+from datetime import date, datetime, time, timedelta
 from types import MappingProxyType
-from typing import Any, cast
+from typing import Any, TypeVar, cast
 
+from aiohttp import ClientSession
 from homeassistant.components.recorder.models import (
     StatisticData,
     StatisticMeanType,
@@ -26,21 +32,274 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers import aiohttp_client
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, HOUSE, RESET_STATISTICS
-from .gazdebordeaux import DailyUsageRead, Gazdebordeaux, TotalUsageRead
+from .const import (
+    CATEGORY,
+    DEDICATED_SESSION,
+    DISCOVERY,
+    DOMAIN,
+    EVENT_IMPORT_PROGRESS,
+    EVENT_NEW_DATA,
+    HOURLY_PROFILE,
+    HOUSE,
+    RECORD_PAYLOADS,
+    RESET_STATISTICS,
+)
+from .dates import day_start, format_day, local_day
+from .forecast import DegreeDayModel, Folded
+from .gazdebordeaux import (
+    Contract,
+    DailyUsageRead,
+    Discovery,
+    Gazdebordeaux,
+    TotalUsageRead,
+    create_session,
+)
+from .hourly import PROFILES, disaggregate
+from .importer import ImportWorker
+from .policy import (
+    GdbAuthError,
+    GdbCircuitOpenError,
+    GdbError,
+    GdbTransientError,
+    RetryPolicy,
+)
+from .profiling import PhaseTimer, timed
+from .reconcile import Row, SumIndex, Window, find_divergent, month_windows, resum
+from .series import FIELDS, DailySeries, Values
+from .tariff import Tariff
+from .transport import RecordingTransport, SessionTransport
 
 _LOGGER = logging.getLogger(__name__)
+_T = TypeVar("_T")
+
+UPDATE_INTERVAL = timedelta(hours=12)
+# After a failed refresh, try again sooner than the regular interval. Matches
+# the WAF circuit cooldown so a retry never lands while the circuit is open.
+RETRY_INTERVAL = timedelta(seconds=RetryPolicy.waf_cooldown)
+# While the site is unreachable the last good data is served as stale, and
+# refreshes back off from OFFLINE_RETRY_INTERVAL, doubling up to RETRY_INTERVAL.
+OFFLINE_RETRY_INTERVAL = timedelta(minutes=5)
+# Last good totals, persisted so they survive a restart during an outage.
+STORAGE_VERSION = 1
+
+# Wall-clock budget for one refresh. Login and house lookup get a capped
+# share so they can't starve the data windows, which take whatever is left.
+REFRESH_TIMEOUT = timedelta(minutes=15)
+LOGIN_TIMEOUT = timedelta(minutes=3)
+HOUSE_TIMEOUT = timedelta(minutes=3)
+# Reconciliation runs after the statistics are written: running out of time
+# there only postpones it to the next refresh.
+RECONCILE_TIMEOUT = timedelta(minutes=5)
+# Daily history is fetched in windows of this size; each finished window is
+# committed even if a later one runs past the deadline.
+DATA_WINDOW = timedelta(days=92)
+
+# import_range service: smaller windows fetched concurrently, and how far back
+# to look for the sum of the day preceding the range.
+IMPORT_WINDOW = timedelta(days=31)
+IMPORT_CONCURRENCY = 3
+BASELINE_LOOKBACK = timedelta(days=31)
+# An estimated or rejected day is fetched again until it is this far behind
+# the last imported day; then it is kept as it is.
+REFETCH_LIMIT = timedelta(days=31)
+# Time a refresh's import is given past the refresh deadline to write the
+# windows it fetched, before the refresh stops waiting for it.
+WRITE_GRACE = timedelta(minutes=1)
+# Rows handed to the recorder per async_add_external_statistics call.
+IMPORT_BATCH = 500
+# Difference (kWh) between the imported sums and the supplier's totals over
+# a span below which they are considered to agree (rounding of the totals).
+RECONCILE_TOLERANCE = 1.0
+# Days fetched once to fit the forecast when upgrading an existing install.
+FORECAST_HISTORY = timedelta(days=365)
+# The daily series is saved this long after the last change, not per day.
+SERIES_SAVE_DELAY = 60
+# Exchanges kept for diagnostics when RECORD_PAYLOADS is on.
+RECORD_SIZE = 20
+
+
+@dataclasses.dataclass(frozen=True)
+class Commodity:
+    """How contracts of one category map onto external statistics."""
+
+    category: str
+    name: str
+    cost_statistic_id: str
+    consumption_statistic_id: str
+    volume_statistic_id: str | None = None
+
+    @property
+    def fields(self) -> dict[str, str]:
+        """DailyUsageRead attribute behind each statistic, keyed by statistic id."""
+        fields = {
+            self.cost_statistic_id: "price",
+            self.consumption_statistic_id: "amountOfEnergy",
+        }
+        if self.volume_statistic_id is not None:
+            fields[self.volume_statistic_id] = "volumeOfEnergy"
+        return fields
+
+    @property
+    def hourly_statistic_id(self) -> str:
+        """Consumption spread over the hours of each day (see hourly.py)."""
+        return f"{self.consumption_statistic_id}_hourly"
+
+    def metadata(self) -> dict[str, StatisticMetaData]:
+        """External statistic metadata, keyed by statistic id."""
+        metadata = {
+            self.cost_statistic_id: StatisticMetaData(
+                mean_type=StatisticMeanType.NONE,
+                unit_class="monetary",
+                has_sum=True,
+                name=f"{self.name} cost",
+                source=DOMAIN,
+                statistic_id=self.cost_statistic_id,
+                unit_of_measurement=CURRENCY_EURO,
+            ),
+            self.consumption_statistic_id: StatisticMetaData(
+                mean_type=StatisticMeanType.NONE,
+                unit_class="energy",
+                has_sum=True,
+                name=f"{self.name} consumption",
+                source=DOMAIN,
+                statistic_id=self.consumption_statistic_id,
+                unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+            ),
+        }
+        if self.volume_statistic_id is not None:
+            metadata[self.volume_statistic_id] = StatisticMetaData(
+                mean_type=StatisticMeanType.NONE,
+                unit_class="volume",
+                has_sum=True,
+                name=f"{self.name} volume",
+                source=DOMAIN,
+                statistic_id=self.volume_statistic_id,
+                unit_of_measurement=UnitOfVolume.CUBIC_METERS,
+            )
+        metadata[self.hourly_statistic_id] = StatisticMetaData(
+            mean_type=StatisticMeanType.NONE,
+            unit_class="energy",
+            has_sum=True,
+            name=f"{self.name} hourly consumption (estimated)",
+            source=DOMAIN,
+            statistic_id=self.hourly_statistic_id,
+            unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        )
+        return metadata
+
+
+# Keyed by contractType.category. Gas keeps the original statistic ids.
+COMMODITIES: dict[str, Commodity] = {
+    "gas": Commodity(
+        category="gas",
+        name="Gaz de Bordeaux",
+        cost_statistic_id=f"{DOMAIN}:energy_cost",
+        consumption_statistic_id=f"{DOMAIN}:energy_consumption",
+        volume_statistic_id=f"{DOMAIN}:volume",
+    ),
+    "electricity": Commodity(
+        category="electricity",
+        name="Gaz de Bordeaux électricité",
+        cost_statistic_id=f"{DOMAIN}:electricity_cost",
+        consumption_statistic_id=f"{DOMAIN}:electricity_consumption",
+    ),
+}
+
+
+def select_contracts(
+    contracts: Iterable[Contract], house: str | None = None
+) -> dict[str, Contract]:
+    """Map each supported commodity to the house holding its contract.
+
+    With `house`, only that house's contract is kept.
+    """
+    selected: dict[str, Contract] = {}
+    for contract in contracts:
+        if house is not None and contract.house != house:
+            continue
+        if contract.category not in COMMODITIES:
+            _LOGGER.debug("Ignoring unsupported contract %s", contract)
+        elif contract.category in selected:
+            _LOGGER.warning(
+                "Several %s contracts on this account, only %s is imported",
+                contract.category,
+                selected[contract.category].house,
+            )
+        else:
+            selected[contract.category] = contract
+    return selected
 
 
-class GdbCoordinator(DataUpdateCoordinator[TotalUsageRead]):
+def _phase_deadline(deadline: float, budget: timedelta) -> float:
+    """Loop-time deadline for a refresh phase: its own budget, capped by the refresh's."""
+    return min(deadline, asyncio.get_running_loop().time() + budget.total_seconds())
+
+
+def _storage_key(entry_id: str) -> str:
+    return f"{DOMAIN}.{entry_id}"
+
+
+def _series_storage_key(entry_id: str) -> str:
+    return f"{DOMAIN}.{entry_id}.series"
+
+
+async def async_remove_cache(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the persisted last good data and daily series of a removed entry."""
+    for key in (_storage_key(entry_id), _series_storage_key(entry_id)):
+        await Store[dict[str, Any]](hass, STORAGE_VERSION, key).async_remove()
+
+
+# DailyUsageRead attribute behind each series field (series.FIELDS order).
+_SERIES_ATTRIBUTES = ("amountOfEnergy", "volumeOfEnergy", "price", "temperature", "ratio")
+
+
+# Name of each daily statistic's values in EVENT_NEW_DATA, by DailyUsageRead attribute.
+_DELTA_FIELDS = {"amountOfEnergy": "energy", "volumeOfEnergy": "volume", "price": "cost"}
+
+
+def _series_values(read: DailyUsageRead) -> Values:
+    return tuple(getattr(read, attribute) for attribute in _SERIES_ATTRIBUTES)
+
+
+async def _async_update_model(
+    model: DegreeDayModel,
+    reads: list[DailyUsageRead],
+    previous: Mapping[date, Folded | None] | None = None,
+) -> None:
+    """Fold `reads` into `model` IMPORT_BATCH days at a time, yielding in between."""
+    for i in range(0, len(reads), IMPORT_BATCH):
+        if i:
+            await asyncio.sleep(0)
+        model.update(reads[i : i + IMPORT_BATCH], previous)
+
+
+def _folded(values: Values | None) -> Folded | None:
+    """Energy, cost and temperature of a series day, as the forecast folded it in."""
+    if values is None:
+        return None
+    energy, cost, temperature = (values[FIELDS.index(f)] for f in ("energy", "cost", "temperature"))
+    return energy or 0.0, cost or 0.0, temperature
+
+
+def _last_sum(stats: dict[str, list[Any]], statistic_id: str) -> float:
+    """Sum of the latest row of `statistic_id` in a statistics_during_period result."""
+    rows = stats.get(statistic_id)
+    return cast(float, rows[-1]["sum"]) if rows else 0.0
+
+
+class GdbCoordinator(DataUpdateCoordinator[dict[str, TotalUsageRead]]):
     """Handle fetching GazdeBordeaux data, updating sensors and inserting statistics."""
 
     def __init__(
         self,
         hass: HomeAssistant,
         entry_data: MappingProxyType[str, Any],
+        *,
+        entry_id: str | None = None,
     ) -> None:
         """Initialize the data handler."""
         super().__init__(
@@ -49,7 +308,7 @@ class GdbCoordinator(DataUpdateCoordinator[TotalUsageRead]):
             name="gazdebordeaux",
             # Data is updated daily.
             # Refresh every 12h to be at most 12h behind.
-            update_interval=timedelta(hours=12),
+            update_interval=UPDATE_INTERVAL,
         )
 
         # Initialisation de la date de dernière actualisation
@@ -58,14 +317,86 @@ class GdbCoordinator(DataUpdateCoordinator[TotalUsageRead]):
         house: Any = None
         if HOUSE in entry_data:
             house = entry_data[HOUSE]
+        self._house: str | None = house or None
+        self._house_category: str = entry_data.get(CATEGORY) or "gas"
+        # Supported contracts on the account by category, discovered on first refresh.
+        self.contracts: dict[str, Contract] = {}
+        # The config flow just logged in and listed the houses: reuse both
+        # instead of doing it again on the first refresh.
+        discovery: Discovery | None = hass.data.get(DISCOVERY, {}).pop(
+            entry_data[CONF_USERNAME], None
+        )
+        if discovery is not None:
+            self.contracts = select_contracts(discovery.contracts, self._house)
+
+        # Opt-in session owned by the integration (tuned connector, closed on
+        # unload) instead of HA's shared one.
+        self._own_session: ClientSession | None = None
+        if entry_data.get(DEDICATED_SESSION):
+            self._own_session = create_session()
 
+        session = self._own_session or aiohttp_client.async_get_clientsession(hass)
+        # Opt-in: keep the last exchanges (redacted) for the diagnostics download.
+        self.exchanges: RecordingTransport | None = None
+        if entry_data.get(RECORD_PAYLOADS):
+            self.exchanges = RecordingTransport(SessionTransport(session), RECORD_SIZE)
         self.api = Gazdebordeaux(
-            aiohttp_client.async_get_clientsession(hass),
+            session,
             entry_data[CONF_USERNAME],
             entry_data[CONF_PASSWORD],
-            None,
+            discovery.token if discovery is not None else None,
             house,
+            retry=RetryPolicy(),
+            transport=self.exchanges,
         )
+        # Prices days the supplier hasn't priced yet; empty tariff only flags them.
+        self.tariff = Tariff.from_entry(entry_data)
+        # Opt-in: consumption also spread over the hours of the day, in a
+        # statistic of its own; the daily one stays authoritative.
+        profile = entry_data.get(HOURLY_PROFILE)
+        self._hourly_profile: str | None = profile if profile in PROFILES else None
+        # Categories whose hourly statistic is known to have been filled.
+        self._hourly_ready: set[str] = set()
+        # First day to fetch again on the next refresh, per category: the first
+        # one imported without the supplier's price (so the supplier's figure
+        # overwrites ours) or rejected by the parser (quarantined until valid),
+        # up to REFETCH_LIMIT back.
+        self._refetch_from: dict[str, date] = {}
+        # Set when the last refresh hit its deadline before fetching everything.
+        self._partial_import = False
+        # Degraded mode: data is the last good one (fetched at last_update)
+        # because the site couldn't be reached; failed attempts so far.
+        self.stale = False
+        self._offline_retries = 0
+        self._store: Store[dict[str, Any]] | None = None
+        self._series_store: Store[dict[str, Any]] | None = None
+        if entry_id is not None:
+            self._store = Store(hass, STORAGE_VERSION, _storage_key(entry_id))
+            self._series_store = Store(hass, STORAGE_VERSION, _series_storage_key(entry_id))
+        # Freshness, for the diagnostic sensors: latest day in the statistics
+        # per category, and how long the last refresh took.
+        self.latest_day: dict[str, date] = {}
+        # (latest day, year total) each category was last reconciled at: while
+        # neither changes there is nothing new to compare.
+        self._reconciled: dict[str, tuple[date, float]] = {}
+        self.last_refresh_duration: timedelta | None = None
+        # Degree-day forecast per category, updated with each imported day and
+        # persisted with the last good data (see forecast.py).
+        self.forecasts: dict[str, DegreeDayModel] = {}
+        # Imported days per category, served to dashboards (see series.py and
+        # websocket.py), persisted on their own.
+        self.series: dict[str, DailySeries] = {}
+        self._state_loaded = False
+        # Daily rows written since the last EVENT_NEW_DATA, per category and
+        # day: (state, sum) by delta field. Later writes of a day replace it;
+        # a refresh failing after its import hands them to the next success.
+        self._new_data: dict[str, dict[date, dict[str, tuple[float | None, float]]]] = {}
+        # The only writers of each category's statistics (see importer.py).
+        self._workers: dict[str, ImportWorker] = {}
+        # The first refresh skips the login when the config flow handed a token over.
+        self._skip_login = discovery is not None
+        # Set only while profile_refresh runs (see profiling.py).
+        self.phase_timer: PhaseTimer | None = None
         self.reset = False
         if RESET_STATISTICS in entry_data:
             self.reset = bool(entry_data[RESET_STATISTICS])
@@ -76,12 +407,7 @@ class GdbCoordinator(DataUpdateCoordinator[TotalUsageRead]):
                 _LOGGER.debug("Updating config...")
                 self.hass.config_entries.async_update_entry(
                     entries[0],
-                    data={
-                        CONF_USERNAME: entry_data[CONF_USERNAME],
-                        CONF_PASSWORD: entry_data[CONF_PASSWORD],
-                        RESET_STATISTICS: False,
-                        HOUSE: house,
-                    },
+                    data={**entry_data, RESET_STATISTICS: False},
                 )
 
         @callback
@@ -94,97 +420,348 @@ class GdbCoordinator(DataUpdateCoordinator[TotalUsageRead]):
         # _async_update_data not periodically getting called which is needed for _insert_statistics.
         self.async_add_listener(_dummy_listener)
 
+    async def async_shutdown(self) -> None:
+        """Cancel refreshes and close the dedicated session, if any."""
+        await super().async_shutdown()
+        for worker in self._workers.values():
+            await worker.async_stop()
+        if self._own_session is not None:
+            await self._own_session.close()
+
+    async def async_profile_refresh(self, timer: PhaseTimer) -> None:
+        """Run one refresh with its phases timed by `timer`."""
+        self.phase_timer = self.api.phase_timer = timer
+        try:
+            await self.async_refresh()
+        finally:
+            self.phase_timer = self.api.phase_timer = None
+
     async def _async_update_data(
         self,
-    ) -> TotalUsageRead:
+    ) -> dict[str, TotalUsageRead]:
         """Fetch data from API endpoint."""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            return await self._async_refresh_data()
+        finally:
+            self.last_refresh_duration = timedelta(seconds=loop.time() - started)
+
+    async def _async_refresh_data(self) -> dict[str, TotalUsageRead]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + REFRESH_TIMEOUT.total_seconds()
+        self._partial_import = False
+        phase = "login"
         try:
             # Login expires after a few minutes.
             # Given the infrequent updating (every 12h)
             # assume previous session has expired and re-login.
-            await self.api.async_login()
-        except Exception as err:
-            raise ConfigEntryAuthFailed from err
+            if self._skip_login:
+                self._skip_login = False
+            else:
+                async with asyncio.timeout_at(_phase_deadline(deadline, LOGIN_TIMEOUT)):
+                    await self.api.async_login()
+
+            phase = "house lookup"
+            if not self.contracts:
+                async with asyncio.timeout_at(_phase_deadline(deadline, HOUSE_TIMEOUT)):
+                    self.contracts = await self._async_discover_contracts()
 
-        total_usage: TotalUsageRead = await self.api.async_get_total_usage()
+            # Every commodity is fetched concurrently under the same token.
+            phase = "total usage"
+            async with asyncio.timeout_at(deadline):
+                totals = await asyncio.gather(
+                    *(
+                        self.api.async_get_total_usage(contract.house)
+                        for contract in self.contracts.values()
+                    )
+                )
+            total_usage = dict(zip(self.contracts, totals, strict=True))
 
-        # Because Opower provides historical usage/cost with a delay of a couple of days
-        # we need to insert data into statistics.
-        await self._insert_statistics()
+            # Because Opower provides historical usage/cost with a delay of a couple of days
+            # we need to insert data into statistics.
+            phase = "statistics"
+            if not self._state_loaded:
+                await self._async_load_state()
+            await self._insert_statistics(deadline)
+
+            if not self._partial_import:
+                await self._async_reconcile(total_usage, deadline)
+        except GdbAuthError as err:
+            raise ConfigEntryAuthFailed from err
+        except (GdbTransientError, GdbCircuitOpenError) as err:
+            return await self._async_serve_stale(str(err), err)
+        except GdbError as err:
+            self.update_interval = RETRY_INTERVAL
+            raise UpdateFailed(str(err)) from err
+        except TimeoutError as err:
+            return await self._async_serve_stale(f"Refresh deadline exceeded during {phase}", err)
+        # Pick up where a partial import stopped without waiting 12h.
+        self.update_interval = RETRY_INTERVAL if self._partial_import else UPDATE_INTERVAL
+        self.stale = False
+        self._offline_retries = 0
+        self._async_fire_new_data()
 
         # Mise à jour de la date de dernière actualisation
         self.last_update = datetime.now()
         _LOGGER.debug("Last update: %s", self.last_update.strftime("%Y-%m-%d %H:%M:%S"))
 
+        if self._store is not None:
+            await self._store.async_save(
+                {
+                    "last_update": self.last_update.isoformat(),
+                    "contracts": {
+                        category: contract.house for category, contract in self.contracts.items()
+                    },
+                    "totals": {
+                        category: dataclasses.asdict(total)
+                        for category, total in total_usage.items()
+                    },
+                    "forecasts": {
+                        category: model.as_dict() for category, model in self.forecasts.items()
+                    },
+                }
+            )
         return total_usage
 
-    async def _insert_statistics(self) -> None:
-        """Insert gdb statistics."""
-        cost_statistic_id = f"{DOMAIN}:energy_cost"
-        consumption_statistic_id = f"{DOMAIN}:energy_consumption"
-        volume_statistic_id = f"{DOMAIN}:volume"
-        _LOGGER.debug(
-            "Updating Statistics for %s, %s and %s",
-            cost_statistic_id,
-            consumption_statistic_id,
-            volume_statistic_id,
+    @property
+    def data_age(self) -> timedelta | None:
+        """Time since the data was fetched, or None before any success."""
+        if self.last_update is None:
+            return None
+        return datetime.now() - self.last_update
+
+    async def _async_serve_stale(self, message: str, err: Exception) -> dict[str, TotalUsageRead]:
+        """Keep serving the last good data while the site can't be reached.
+
+        Retries back off from OFFLINE_RETRY_INTERVAL up to RETRY_INTERVAL. An
+        open WAF circuit fails locally, so the early retries add no load.
+        """
+        self.update_interval = min(
+            OFFLINE_RETRY_INTERVAL * 2**self._offline_retries, RETRY_INTERVAL
         )
+        self._offline_retries += 1
+        data = self.data or await self._async_load_stale()
+        if not data:
+            raise UpdateFailed(message) from err
+        if not self.stale:
+            _LOGGER.warning(
+                "%s; serving data from %s until the site is reachable again",
+                message,
+                self.last_update,
+            )
+        self.stale = True
+        return data
+
+    async def _async_load_stale(self) -> dict[str, TotalUsageRead]:
+        """Last good totals persisted by a previous run, if any."""
+        stored = await self._store.async_load() if self._store is not None else None
+        if not stored:
+            return {}
+        if not self.contracts:
+            self.contracts = {
+                category: Contract(house=house, category=category)
+                for category, house in stored["contracts"].items()
+                if category in COMMODITIES
+            }
+        self.last_update = datetime.fromisoformat(stored["last_update"])
+        return {
+            category: TotalUsageRead(**total)
+            for category, total in stored["totals"].items()
+            if category in self.contracts
+        }
+
+    async def _async_discover_contracts(self) -> dict[str, Contract]:
+        """Map each supported commodity to the house holding its contract."""
+        if self._house is not None:
+            # A house picked in the config or options flow pins the integration to it.
+            category = self._house_category
+            return {category: Contract(house=self._house, category=category)}
 
+        contracts = select_contracts(await self.api.async_list_contracts())
+        if not contracts:
+            raise GdbError("No gas or electricity contract found on this account")
+        _LOGGER.debug("Importing contracts: %s", contracts)
+        return contracts
+
+    async def _insert_statistics(self, deadline: float | None = None) -> None:
+        """Insert gdb statistics for every contract.
+
+        Data windows still running at `deadline` (loop time) are cancelled;
+        the windows completed before it are imported.
+        """
         if self.reset:
             _LOGGER.debug("Resetting all statistics...")
 
-        last_stat = await get_instance(self.hass).async_add_executor_job(
+        # The import stops fetching at `deadline` and writes what it has; the
+        # grace also bounds the wait behind another job (a long import_range).
+        grace = None if deadline is None else deadline + WRITE_GRACE.total_seconds()
+        async with asyncio.timeout_at(grace):
+            await asyncio.gather(
+                *(
+                    self._import_worker(category).request_refresh(deadline)
+                    for category in self.contracts
+                )
+            )
+
+    def _import_worker(self, category: str) -> ImportWorker:
+        """The worker running every statistics write of `category`, one at a time."""
+        worker = self._workers.get(category)
+        if worker is None:
+            commodity, house = COMMODITIES[category], self.contracts[category].house
+            worker = self._workers[category] = ImportWorker(
+                category,
+                functools.partial(self._insert_commodity_statistics, commodity, house),
+                functools.partial(self._async_import_commodity_range, commodity, house),
+                get_instance(self.hass).async_block_till_done,
+            )
+        return worker
+
+    async def _insert_commodity_statistics(
+        self, commodity: Commodity, house: str, deadline: float | None
+    ) -> None:
+        """Insert the statistics of one commodity."""
+        consumption_statistic_id = commodity.consumption_statistic_id
+        _LOGGER.debug("Updating Statistics for %s", ", ".join(sorted(commodity.fields)))
+
+        last_stat = await self._async_recorder_job(
             get_last_statistics, self.hass, 1, consumption_statistic_id, True, set()
         )
+        since: date | None = None
+        sums = (0.0, 0.0, 0.0)
         if not last_stat:
             _LOGGER.debug("Updating statistic for the first time")
-            usage_reads = await self._async_get_all_data()
-            cost_sum = 0.0
-            consumption_sum = 0.0
-            volume_sum = 0.0
-            last_stat_ts = None
+            usage_reads = await self._async_get_all_data(deadline, house)
+            first_rejected = self._pop_rejected(commodity, house, since)
         else:
-            last_stat_ts = last_stat[consumption_statistic_id][0]["start"]  # type: ignore
-            last_stat_date = datetime.fromtimestamp(last_stat_ts)
-            _LOGGER.debug("Last stat found for %s...", last_stat_date.strftime("%Y-%m-%d"))
-            usage_reads = await self._async_get_recent_usage_reads(last_stat_ts)
+            since = local_day(last_stat[consumption_statistic_id][0]["start"])  # type: ignore
+            await self._async_resume(commodity, since)
+            since = self._refetch_start(commodity.category, since)
+            _LOGGER.debug("Last stat found for %s...", since.isoformat())
+            usage_reads = await self._async_get_recent_usage_reads(since, deadline, house)
+            first_rejected = self._pop_rejected(commodity, house, since)
             if not usage_reads:
                 _LOGGER.debug("No recent usage/cost data. Skipping update")
+                if first_rejected is not None:
+                    self._refetch_from[commodity.category] = first_rejected
                 return
+            sums = await self._async_last_sums(commodity, since)
 
-            stats = await get_instance(self.hass).async_add_executor_job(
-                statistics_during_period,
-                self.hass,
-                usage_reads[0].date,
-                None,
-                {cost_statistic_id, consumption_statistic_id, volume_statistic_id},
-                "day",
-                None,
-                {"state", "sum"},
+        # One read per local calendar day; each day is written at its local
+        # midnight, so importing it again overwrites the same recorder row.
+        by_day = {read.date.date(): read for read in usage_reads}
+        days = sorted(day for day in by_day if since is None or day > since)
+        usage_reads = [by_day[day] for day in days]
+        if days:
+            self.latest_day[commodity.category] = max(
+                days[-1], self.latest_day.get(commodity.category, days[-1])
             )
-            # s:StatisticsRow =stats[cost_statistic_id][0]
 
-            cost_sum = cast(float, stats[cost_statistic_id][0]["sum"])  # type: ignore
-            consumption_sum = cast(float, stats[consumption_statistic_id][0]["sum"])  # type: ignore
-            volume_sum = cast(float, stats[volume_statistic_id][0]["sum"])  # type: ignore
-            # last_stat_ts = stats[cost_statistic_id][0]["start"]  # type: ignore
+        estimated = self.tariff.apply(usage_reads)
+        if estimated:
+            _LOGGER.debug("%d day(s) without supplier price, estimated locally", estimated)
+        await self._async_update_forecast(commodity, house, since, usage_reads, deadline)
+        self._async_update_series(commodity.category, usage_reads)
+
+        rows = await self._async_statistics_rows(commodity, days, usage_reads, sums)
+        # Estimated, or a 0 placeholder without a tariff: fetched again.
+        first_estimated = next(
+            (day for day, read in zip(days, usage_reads, strict=True) if read.estimated), None
+        )
+        refetch = [day for day in (first_estimated, first_rejected) if day is not None]
+        if refetch:
+            self._refetch_from[commodity.category] = min(refetch)
+        else:
+            self._refetch_from.pop(commodity.category, None)
 
+        if self._hourly_profile is not None:
+            rows[commodity.hourly_statistic_id] = await self._async_hourly_rows(
+                commodity,
+                [
+                    (day, row["state"], row["sum"])
+                    for day, row in zip(days, rows[consumption_statistic_id], strict=True)
+                ],
+            )
+            self._hourly_ready.add(commodity.category)
+        await self._async_add_statistics(commodity, rows)
+
+    async def _async_resume(self, commodity: Commodity, since: date) -> None:
+        """Catch up on what a refresh resuming after `since` relies on."""
+        if commodity.category not in self.series:
+            await self._async_seed_series(commodity)
+        if self._hourly_profile is not None:
+            await self._async_backfill_hourly(commodity)
+        self.latest_day[commodity.category] = since
+
+    def _refetch_start(self, category: str, since: date) -> date:
+        """The day a refresh resuming after `since` fetches from.
+
+        It goes back to the day before the first unpriced or rejected day
+        still to fetch again, unless that day is more than REFETCH_LIMIT old.
+        """
+        refetch_from = self._refetch_from.get(category)
+        if refetch_from is None:
+            return since
+        if refetch_from < since - REFETCH_LIMIT:
+            _LOGGER.info(
+                "%s data from %s is still unpriced or invalid; no longer fetching it again",
+                category,
+                refetch_from,
+            )
+            self._refetch_from.pop(category)
+            return since
+        # Restart from the day before the first day to fetch again so its
+        # sum is the baseline and every later day gets re-imported.
+        return min(since, refetch_from - timedelta(days=1))
+
+    async def _async_last_sums(
+        self, commodity: Commodity, since: date
+    ) -> tuple[float, float, float]:
+        """The cost, consumption and volume running sums at the end of `since`.
+
+        They come from the last row on or before that day, so a gap in the
+        recorder doesn't restart them from 0.
+        """
+        statistic_ids = {commodity.cost_statistic_id, commodity.consumption_statistic_id}
+        if commodity.volume_statistic_id is not None:
+            statistic_ids.add(commodity.volume_statistic_id)
+        stats = await self._async_recorder_job(
+            statistics_during_period,
+            self.hass,
+            day_start(since) - BASELINE_LOOKBACK,
+            day_start(since + timedelta(days=1)),
+            statistic_ids,
+            "hour",
+            None,
+            {"sum"},
+        )
+        volume_sum = 0.0
+        if commodity.volume_statistic_id is not None:
+            volume_sum = _last_sum(stats, commodity.volume_statistic_id)
+        return (
+            _last_sum(stats, commodity.cost_statistic_id),
+            _last_sum(stats, commodity.consumption_statistic_id),
+            volume_sum,
+        )
+
+    async def _async_statistics_rows(
+        self,
+        commodity: Commodity,
+        days: list[date],
+        usage_reads: list[DailyUsageRead],
+        sums: tuple[float, float, float],
+    ) -> dict[str, list[StatisticData]]:
+        """Daily rows of `usage_reads`, keyed on statistic id, summed on from `sums`."""
+        cost_sum, consumption_sum, volume_sum = sums
         cost_statistics = []
         consumption_statistics = []
         volume_statistics = []
-
-        for usage_read in usage_reads:
-            start = usage_read.date
-            if last_stat_ts is not None:
-                if start.timestamp() <= last_stat_ts:
-                    _LOGGER.debug("Skipping data for %s (timestamp)", start.strftime("%Y-%m-%d"))
-                    continue
-                # Same day, skip regardless of time (avoid multiple runs for the same day).
-                if start.date() == last_stat_date.date():
-                    _LOGGER.debug("Skipping data for %s (same date)", start.strftime("%Y-%m-%d"))
-                    continue
-
-            _LOGGER.debug("Importing data for %s...", start.strftime("%Y-%m-%d"))
+        for i, (day, usage_read) in enumerate(zip(days, usage_reads, strict=True)):
+            if i and not i % IMPORT_BATCH:
+                # A first import is years of days: let the loop breathe.
+                await asyncio.sleep(0)
+            start = day_start(day)
+            _LOGGER.debug("Importing data for %s...", day.isoformat())
 
             cost_sum += usage_read.price
             consumption_sum += usage_read.amountOfEnergy
@@ -198,59 +775,574 @@ class GdbCoordinator(DataUpdateCoordinator[TotalUsageRead]):
                 StatisticData(start=start, state=usage_read.volumeOfEnergy, sum=volume_sum)
             )
 
-        name_prefix = " ".join(("Gaz de Bordeaux",))
+        rows = {
+            commodity.cost_statistic_id: cost_statistics,
+            commodity.consumption_statistic_id: consumption_statistics,
+        }
+        if commodity.volume_statistic_id is not None:
+            rows[commodity.volume_statistic_id] = volume_statistics
+        return rows
 
-        cost_metadata = StatisticMetaData(
-            mean_type=StatisticMeanType.NONE,
-            unit_class="monetary",
-            has_sum=True,
-            name=f"{name_prefix} cost",
-            source=DOMAIN,
-            statistic_id=cost_statistic_id,
-            unit_of_measurement=CURRENCY_EURO,
+    async def _async_load_state(self) -> None:
+        """Restore the forecast fits and daily series saved by a previous run."""
+        self._state_loaded = True
+        stored = await self._store.async_load() if self._store is not None else None
+        for category, data in ((stored or {}).get("forecasts") or {}).items():
+            self.forecasts[category] = DegreeDayModel.from_dict(data)
+        if self._series_store is not None:
+            for category, data in (await self._series_store.async_load() or {}).items():
+                self.series[category] = DailySeries.from_dict(data)
+
+    @callback
+    def _async_update_series(self, category: str, reads: Iterable[DailyUsageRead]) -> None:
+        """Copy imported days into the in-memory series; save it a bit later."""
+        series = self.series.setdefault(category, DailySeries())
+        changed = series.upsert((read.date.date(), _series_values(read)) for read in reads)
+        if changed and self._series_store is not None:
+            self._series_store.async_delay_save(
+                lambda: {name: daily.as_dict() for name, daily in self.series.items()},
+                SERIES_SAVE_DELAY,
+            )
+
+    async def _async_seed_series(self, commodity: Commodity) -> None:
+        """Fill the series of statistics imported before it existed, once, from the recorder.
+
+        The recorder has no temperatures, so those days have none.
+        """
+        history = await self._async_recorder_job(
+            statistics_during_period,
+            self.hass,
+            dt_util.utc_from_timestamp(0),
+            None,
+            set(commodity.fields),
+            "hour",
+            None,
+            {"state"},
         )
-        consumption_metadata = StatisticMetaData(
-            mean_type=StatisticMeanType.NONE,
-            unit_class="energy",
-            has_sum=True,
-            name=f"{name_prefix} consumption",
-            source=DOMAIN,
-            statistic_id=consumption_statistic_id,
-            unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        days: dict[date, list[float | None]] = {}
+        for statistic_id, attribute in commodity.fields.items():
+            index = _SERIES_ATTRIBUTES.index(attribute)
+            for row in history.get(statistic_id, []):
+                values = days.setdefault(local_day(row["start"]), [None] * len(FIELDS))
+                values[index] = row.get("state")
+        series = self.series.setdefault(commodity.category, DailySeries())
+        series.upsert((day, tuple(values)) for day, values in days.items())
+        _LOGGER.debug("Seeded %s series with %d days", commodity.category, len(series))
+
+    async def _async_hourly_rows(
+        self, commodity: Commodity, days: list[tuple[date, float, float]]
+    ) -> list[StatisticData]:
+        """Hourly rows of the (day, kWh, sum at end of day) in `days`.
+
+        Days are spread IMPORT_BATCH at a time, yielding in between; the
+        temperature profile takes each day's temperature from the series.
+        """
+        series = self.series.get(commodity.category)
+        temperature = FIELDS.index("temperature")
+        statistics: list[StatisticData] = []
+        for i in range(0, len(days), IMPORT_BATCH):
+            if i:
+                await asyncio.sleep(0)
+            batch = days[i : i + IMPORT_BATCH]
+            temperatures = [
+                values[temperature]
+                if series is not None and (values := series.get(day)) is not None
+                else None
+                for day, _, _ in batch
+            ]
+            statistics.extend(
+                StatisticData(start=start, state=state, sum=total)
+                for start, state, total in disaggregate(
+                    [day for day, _, _ in batch],
+                    [amount for _, amount, _ in batch],
+                    [total for _, _, total in batch],
+                    temperatures,
+                    cast(str, self._hourly_profile),
+                )
+            )
+        return statistics
+
+    async def _async_backfill_hourly(self, commodity: Commodity) -> None:
+        """Spread every recorded day into the hourly statistic if it is empty, once.
+
+        Covers the statistics imported before the option was turned on.
+        """
+        if commodity.category in self._hourly_ready:
+            return
+        self._hourly_ready.add(commodity.category)
+        last_hourly = await self._async_recorder_job(
+            get_last_statistics, self.hass, 1, commodity.hourly_statistic_id, True, set()
         )
-        volume_metadata = StatisticMetaData(
-            mean_type=StatisticMeanType.NONE,
-            unit_class="volume",
-            has_sum=True,
-            name=f"{name_prefix} volume",
-            source=DOMAIN,
-            statistic_id=volume_statistic_id,
-            unit_of_measurement=UnitOfVolume.CUBIC_METERS,
+        if last_hourly:
+            return
+        history = await self._async_recorder_job(
+            statistics_during_period,
+            self.hass,
+            dt_util.utc_from_timestamp(0),
+            None,
+            {commodity.consumption_statistic_id},
+            "hour",
+            None,
+            {"state", "sum"},
+        )
+        days = [
+            (local_day(row["start"]), row["state"], row["sum"])
+            for row in history.get(commodity.consumption_statistic_id, [])
+            if row.get("state") is not None and row.get("sum") is not None
+        ]
+        _LOGGER.debug("Spreading %d recorded %s days over hours", len(days), commodity.category)
+        await self._async_add_statistics(
+            commodity,
+            {commodity.hourly_statistic_id: await self._async_hourly_rows(commodity, days)},
+        )
+
+    async def _async_update_forecast(
+        self,
+        commodity: Commodity,
+        house: str,
+        since: date | None,
+        usage_reads: list[DailyUsageRead],
+        deadline: float | None,
+    ) -> None:
+        """Fold the new and revised days into the forecast of `commodity`."""
+        model = self.forecasts.setdefault(commodity.category, DegreeDayModel())
+        if not model and since is not None:
+            # Statistics imported before the forecast existed: fit it on the
+            # past year, once, instead of waiting a year for enough days.
+            history = await self._async_get_windows(
+                datetime.combine(since - FORECAST_HISTORY, time.min),
+                datetime.combine(since, time.min),
+                deadline,
+                house,
+            )
+            # Only the forecast and the series see these; the statistics have
+            # them already. The series keeps the temperatures the forecast
+            # was fitted on, for the days revised later.
+            self.api.pop_rejected(house)
+            self.tariff.apply(history)
+            await _async_update_model(model, history)
+            self._async_update_series(commodity.category, history)
+        await self._async_fold_forecast(model, commodity.category, usage_reads)
+
+    async def _async_fold_forecast(
+        self, model: DegreeDayModel, category: str, reads: list[DailyUsageRead]
+    ) -> None:
+        """Fold `reads` into `model`; to be called before they go into the series.
+
+        Days already folded in come back when revised or published late: the
+        series still has what the forecast saw of them, which is taken back.
+        """
+        series = self.series.get(category)
+        previous = {
+            day: _folded(series.get(day) if series is not None else None)
+            for day in (read.date.date() for read in reads)
+            if model.last_day is not None and day <= model.last_day
+        }
+        await _async_update_model(model, reads, previous)
+
+    def _pop_rejected(self, commodity: Commodity, house: str, since: date | None) -> date | None:
+        """Log the days the parser rejected for `house`; return the first one after `since`."""
+        days: list[date] = []
+        for key, reason in self.api.pop_rejected(house).items():
+            _LOGGER.warning("Skipping invalid %s data for %s: %s", commodity.category, key, reason)
+            with contextlib.suppress(ValueError):
+                days.append(date.fromisoformat(key))
+        return min((day for day in days if since is None or day > since), default=None)
+
+    async def _async_recorder_job(self, target: Callable[..., _T], *args: Any) -> _T:
+        """Run a recorder query in the recorder's executor."""
+        with timed(self.phase_timer, "recorder"):
+            return await get_instance(self.hass).async_add_executor_job(target, *args)
+
+    async def _async_add_statistics(
+        self, commodity: Commodity, rows: dict[str, list[StatisticData]]
+    ) -> None:
+        """Queue rows for the recorder, IMPORT_BATCH rows per statistic at a time.
+
+        Each batch is validated on the event loop, so the loop gets a turn
+        between batches.
+        """
+        metadata = commodity.metadata()
+        self._record_new_data(commodity, rows)
+        for statistic_id, statistics in rows.items():
+            for i in range(0, max(len(statistics), 1), IMPORT_BATCH):
+                if i:
+                    await asyncio.sleep(0)
+                with timed(self.phase_timer, "recorder"):
+                    async_add_external_statistics(
+                        self.hass, metadata[statistic_id], statistics[i : i + IMPORT_BATCH]
+                    )
+
+    def _record_new_data(self, commodity: Commodity, rows: dict[str, list[StatisticData]]) -> None:
+        """Remember the daily rows in `rows` for the next EVENT_NEW_DATA."""
+        by_day = self._new_data.setdefault(commodity.category, {})
+        for statistic_id, attribute in commodity.fields.items():
+            name = _DELTA_FIELDS[attribute]
+            for row in rows.get(statistic_id, []):
+                day = local_day(row["start"].timestamp())
+                by_day.setdefault(day, {})[name] = (row.get("state"), cast(float, row["sum"]))
+
+    @callback
+    def _async_fire_new_data(self) -> None:
+        """Fire one EVENT_NEW_DATA per contract with the days written since the last one.
+
+        The values are columns: `days`, then for each statistic its daily
+        values and their running sums (`energy`, `energy_sum`, ...).
+        """
+        for category, by_day in self._new_data.items():
+            if not by_day:
+                continue
+            days = sorted(by_day)
+            contract = self.contracts.get(category)
+            data: dict[str, Any] = {
+                "category": category,
+                "house": contract.house if contract is not None else None,
+                "days": [day.isoformat() for day in days],
+            }
+            for name in _DELTA_FIELDS.values():
+                if any(name in by_day[day] for day in days):
+                    values = [by_day[day].get(name, (None, None)) for day in days]
+                    data[name] = [state for state, _ in values]
+                    data[f"{name}_sum"] = [total for _, total in values]
+            self.hass.bus.async_fire(EVENT_NEW_DATA, data)
+        self._new_data.clear()
+
+    async def async_import_range(self, start: date, end: date, house: str | None = None) -> None:
+        """Re-import the days from `start` to `end` (inclusive) for one or every contract.
+
+        The sums inside the range are recomputed from the day before it, and
+        every later day is shifted by the resulting difference so the series
+        stays continuous. Progress is reported with EVENT_IMPORT_PROGRESS and
+        the rewritten days with EVENT_NEW_DATA.
+        """
+        categories = [
+            category
+            for category, contract in self.contracts.items()
+            if house is None or contract.house == house
+        ]
+        if not categories:
+            raise GdbError(f"No contract found for house {house!r}")
+        try:
+            await asyncio.gather(
+                *(
+                    self._import_worker(category).request_range(start, end)
+                    for category in categories
+                )
+            )
+        finally:
+            # Whatever was written, even if a contract failed.
+            self._async_fire_new_data()
+            for category in categories:
+                # The rewritten sums are compared again on the next refresh.
+                self._reconciled.pop(category, None)
+
+    async def _async_import_commodity_range(
+        self, commodity: Commodity, house: str, start: date, end: date
+    ) -> None:
+        windows: list[tuple[datetime, datetime]] = []
+        window_start = datetime.combine(start, time.min)
+        # Whether the API's endDate is inclusive or not, `end` is fetched;
+        # the day after it is dropped below.
+        range_end = datetime.combine(end + timedelta(days=1), time.min)
+        while True:
+            window_end = min(window_start + IMPORT_WINDOW, range_end)
+            windows.append((window_start, window_end))
+            if window_end >= range_end:
+                break
+            window_start = window_end
+
+        semaphore = asyncio.Semaphore(IMPORT_CONCURRENCY)
+        fetched = 0
+
+        async def fetch(window: tuple[datetime, datetime]) -> list[DailyUsageRead]:
+            nonlocal fetched
+            async with semaphore:
+                reads = await self.api.async_get_daily_usage(*window, house)
+            fetched += 1
+            self._fire_import_progress(commodity, house, "fetch", fetched, len(windows))
+            return reads
+
+        by_day: dict[date, DailyUsageRead] = {}
+        for batch in await asyncio.gather(*(fetch(window) for window in windows)):
+            for read in batch:
+                if start <= read.date.date() <= end:
+                    by_day[read.date.date()] = read
+        usage_reads = [by_day[day] for day in sorted(by_day)]
+        self._refetch_rejected(commodity, house, start - timedelta(days=1))
+        if not usage_reads:
+            _LOGGER.debug("No %s data between %s and %s", commodity.category, start, end)
+            self._fire_import_progress(commodity, house, "done", 0, 0)
+            return
+        self.tariff.apply(usage_reads)
+
+        days = sorted(by_day)
+        await self._async_rewrite_days(commodity, by_day)
+        if commodity.category in self.latest_day:
+            self.latest_day[commodity.category] = max(days[-1], self.latest_day[commodity.category])
+        self._fire_import_progress(commodity, house, "done", len(usage_reads), len(usage_reads))
+
+    def _refetch_rejected(self, commodity: Commodity, house: str, since: date) -> None:
+        """Have the next refresh fetch again from the first day rejected after `since`."""
+        first_rejected = self._pop_rejected(commodity, house, since)
+        if first_rejected is not None:
+            # Like unpriced days, until the supplier sends a valid row.
+            refetch_from = self._refetch_from.get(commodity.category, first_rejected)
+            self._refetch_from[commodity.category] = min(refetch_from, first_rejected)
+
+    async def _async_history(self, commodity: Commodity, first: date) -> dict[str, list[Row]]:
+        """Recorded rows of every statistic of `commodity` from before `first` on.
+
+        Rows are keyed on their local day rather than their exact start, so
+        rows written by older versions at another time of day still match.
+        """
+        history = await self._async_recorder_job(
+            statistics_during_period,
+            self.hass,
+            day_start(first) - BASELINE_LOOKBACK,
+            None,
+            set(commodity.fields),
+            "hour",
+            None,
+            {"state", "sum"},
+        )
+        return {
+            statistic_id: [
+                Row(
+                    day=local_day(row["start"]),
+                    state=row.get("state"),
+                    sum=cast(float, row["sum"]),
+                    start=row["start"],
+                )
+                for row in history.get(statistic_id, [])
+            ]
+            for statistic_id in commodity.fields
+        }
+
+    async def _async_rewrite_days(
+        self,
+        commodity: Commodity,
+        by_day: dict[date, DailyUsageRead],
+        history: dict[str, list[Row]] | None = None,
+    ) -> None:
+        """Overwrite the recorded days in `by_day` and shift the sums after them.
+
+        The existing rows of those days are overwritten in place; later rows
+        keep their daily values with sums moved by the difference.
+        """
+        if history is None:
+            history = await self._async_history(commodity, min(by_day))
+        # The forecast follows the rewritten days too; one not fitted yet is
+        # fitted on the past year by the next refresh instead.
+        if model := self.forecasts.get(commodity.category):
+            await self._async_fold_forecast(
+                model, commodity.category, [by_day[day] for day in sorted(by_day)]
+            )
+        self._async_update_series(commodity.category, by_day.values())
+        rows: dict[str, list[StatisticData]] = {}
+        for statistic_id, field in commodity.fields.items():
+            values = {day: getattr(read, field) for day, read in by_day.items()}
+            resummed = resum(history.get(statistic_id, []), values)
+            rows[statistic_id] = [
+                StatisticData(
+                    start=(
+                        dt_util.utc_from_timestamp(row.start)
+                        if row.start is not None
+                        else day_start(row.day)
+                    ),
+                    state=row.state,
+                    sum=row.sum,
+                )
+                for row in resummed
+            ]
+            if (
+                statistic_id == commodity.consumption_statistic_id
+                and self._hourly_profile is not None
+            ):
+                # Every rewritten day moved, so its hours move with it.
+                rows[commodity.hourly_statistic_id] = await self._async_hourly_rows(
+                    commodity,
+                    [(row.day, row.state, row.sum) for row in resummed if row.state is not None],
+                )
+        await self._async_add_statistics(commodity, rows)
+
+    async def _async_reconcile(
+        self, total_usage: dict[str, TotalUsageRead], deadline: float | None = None
+    ) -> None:
+        """Compare this year's imported sums with the year totals; repair drifting months.
+
+        Failures are logged: the refresh itself already succeeded. So is
+        running out of time: reconciliation has RECONCILE_TIMEOUT, capped by
+        the refresh's `deadline`, and what's left is done next time. The year
+        total covers the current year only: until its first day is imported
+        (January 1st-2nd), there is nothing to compare it with. A category
+        is compared again only once its latest day or its year total changed:
+        a total counting days not published day by day yet stays off until
+        they are, and would otherwise be bisected again on every refresh.
+        """
+        year = datetime.now().year
+        contracts = {
+            category: contract
+            for category, contract in self.contracts.items()
+            if category in self.latest_day and self.latest_day[category].year == year
+        }
+        until = _phase_deadline(float("inf") if deadline is None else deadline, RECONCILE_TIMEOUT)
+        for category, contract in contracts.items():
+            state = (self.latest_day[category], total_usage[category].amountOfEnergy)
+            if self._reconciled.get(category) == state:
+                continue
+            try:
+                # After the import: the worker commits its rows before they are read back.
+                async with asyncio.timeout_at(until):
+                    await self._import_worker(category).run(
+                        functools.partial(
+                            self._async_reconcile_commodity,
+                            COMMODITIES[category],
+                            contract.house,
+                            total_usage[category],
+                        )
+                    )
+            except TimeoutError:
+                _LOGGER.warning(
+                    "Out of time reconciling %s statistics; trying again on the next refresh",
+                    category,
+                )
+                return
+            except GdbError as err:
+                _LOGGER.warning("Could not reconcile %s statistics: %s", category, err)
+            else:
+                self._reconciled[category] = state
+
+    async def _async_reconcile_commodity(
+        self, commodity: Commodity, house: str, total: TotalUsageRead
+    ) -> None:
+        last = self.latest_day[commodity.category]
+        first = date(last.year, 1, 1)
+        history = await self._async_history(commodity, first)
+        recorded = SumIndex(history[commodity.consumption_statistic_id])
+        # Monthly reads fetched by the bisection, reused for the repair.
+        months: dict[Window, dict[date, DailyUsageRead]] = {}
+
+        async def fetch(window: Window) -> dict[date, DailyUsageRead]:
+            if window not in months:
+                reads = await self.api.async_get_daily_usage(
+                    datetime.combine(window[0], time.min),
+                    datetime.combine(window[1], time.min),
+                    house,
+                )
+                months[window] = {
+                    read.date.date(): read
+                    for read in reads
+                    if window[0] <= read.date.date() <= window[1]
+                }
+            return months[window]
+
+        async def supplier(window: Window) -> float:
+            return sum(read.amountOfEnergy for read in (await fetch(window)).values())
+
+        suspects = await find_divergent(
+            month_windows(first, last),
+            total.amountOfEnergy,
+            recorded.change,
+            supplier,
+            RECONCILE_TOLERANCE,
+        )
+        # A month found by subtraction only is checked against its own reads:
+        # the year total may also count days not published day by day yet.
+        by_day: dict[date, DailyUsageRead] = {}
+        repaired: list[str] = []
+        for window in suspects:
+            if abs(await supplier(window) - recorded.change(window)) > RECONCILE_TOLERANCE:
+                by_day.update(await fetch(window))
+                repaired.append(window[0].strftime("%Y-%m"))
+        self._refetch_rejected(commodity, house, first - timedelta(days=1))
+        if not by_day:
+            if suspects:
+                _LOGGER.debug(
+                    "%s year total differs from the daily data, but no month does",
+                    commodity.category,
+                )
+            return
+        _LOGGER.warning(
+            "%s statistics drifted from the supplier's data in %s; re-importing those months",
+            commodity.category,
+            ", ".join(repaired),
         )
+        self.tariff.apply(list(by_day.values()))
+        await self._async_rewrite_days(commodity, by_day, history)
 
-        async_add_external_statistics(self.hass, cost_metadata, cost_statistics)
-        async_add_external_statistics(self.hass, consumption_metadata, consumption_statistics)
-        async_add_external_statistics(self.hass, volume_metadata, volume_statistics)
+    @callback
+    def _fire_import_progress(
+        self, commodity: Commodity, house: str, stage: str, done: int, total: int
+    ) -> None:
+        self.hass.bus.async_fire(
+            EVENT_IMPORT_PROGRESS,
+            {
+                "category": commodity.category,
+                "house": house,
+                "stage": stage,
+                "done": done,
+                "total": total,
+            },
+        )
 
-    async def _async_get_all_data(self) -> list[DailyUsageRead]:
+    async def _async_get_all_data(
+        self, deadline: float | None = None, house: str | None = None
+    ) -> list[DailyUsageRead]:
         """Get all cost reads since account activation, at different resolutions by age.
 
         - month resolution for all years (since account activation)
         - day resolution for past 3 years (if account's read resolution supports it)
         - hour resolution for past 2 months (if account's read resolution supports it)
         """
-        usage_reads = []
-
         # if start=None it will only default to beginning of current year, let's import 1 year more
         start = datetime(datetime.today().year - 1, 1, 1)
         end = datetime.now()
-        usage_reads = await self.api.async_get_daily_usage(start, end)
-        return usage_reads
+        return await self._async_get_windows(start, end, deadline, house)
 
-    async def _async_get_recent_usage_reads(self, last_stat_time: float) -> list[DailyUsageRead]:
-        """Get cost reads within the past 30 days to allow corrections in data from utilities."""
-        return await self.api.async_get_daily_usage(
-            # datetime.fromtimestamp(last_stat_time) - timedelta(days=30),
-            datetime.fromtimestamp(last_stat_time),
+    async def _async_get_recent_usage_reads(
+        self, since: date, deadline: float | None = None, house: str | None = None
+    ) -> list[DailyUsageRead]:
+        """Get cost reads from the last imported day (included) up to now."""
+        return await self._async_get_windows(
+            datetime.combine(since, time.min),
             datetime.now(),
+            deadline,
+            house,
         )
+
+    async def _async_get_windows(
+        self,
+        start: datetime,
+        end: datetime,
+        deadline: float | None,
+        house: str | None = None,
+    ) -> list[DailyUsageRead]:
+        """Fetch [start, end] in DATA_WINDOW chunks, oldest first.
+
+        Stops cleanly at `deadline` and returns the windows completed so far,
+        which are always a contiguous prefix of the range. Consecutive windows
+        share their boundary day so it is covered whether the API treats
+        endDate as inclusive or not; each window's rows are sorted and the
+        duplicates dropped here.
+        """
+        usage_reads: list[DailyUsageRead] = []
+        window_start = start
+        try:
+            async with asyncio.timeout_at(deadline):
+                while True:
+                    window_end = min(window_start + DATA_WINDOW, end)
+                    reads = await self.api.async_get_daily_usage(window_start, window_end, house)
+                    for read in sorted(reads, key=lambda read: read.date):
+                        if not usage_reads or read.date > usage_reads[-1].date:
+                            usage_reads.append(read)
+                    if window_end >= end:
+                        break
+                    window_start = window_end
+        except TimeoutError:
+            self._partial_import = True
+            _LOGGER.warning(
+                "Refresh deadline reached while fetching %s; importing data up to %s",
+                format_day(window_start),
+                format_day(usage_reads[-1].date) if usage_reads else "nothing",
+            )
+        return usage_reads
@@ -0,0 +1,47 @@
+"""Calendar-day helpers for the Europe/Paris days the API reports on.
+
+The API keys its daily rows by ISO day ("2024-03-31"); they are turned into
+aware local midnights here, through a table memoized by day ordinal, so the
+thousands of rows of a full history cost a dict lookup each after the first
+refresh. zoneinfo gives the real CET/CEST offset of each day (pytz's
+`replace(tzinfo=...)` attached the +00:09 LMT offset instead).
+
+Statistics are keyed on the local calendar day: a day always maps to the
+same UTC start, so importing a day twice overwrites the same recorder row
+instead of adding a second one.
+"""
+
+from __future__ import annotations
+
+import functools
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+PARIS = ZoneInfo("Europe/Paris")
+DAY_FORMAT = "%Y-%m-%d"
+
+
+@functools.lru_cache(maxsize=8192)
+def _midnight(ordinal: int) -> datetime:
+    day = date.fromordinal(ordinal)
+    return datetime(day.year, day.month, day.day, tzinfo=PARIS)
+
+
+def day_start(day: date) -> datetime:
+    """Local midnight of `day` in Paris (23:00 or 22:00 UTC the day before)."""
+    return _midnight(day.toordinal())
+
+
+def parse_day(key: str) -> datetime:
+    """Local midnight of an ISO day key; ValueError if it isn't one."""
+    return _midnight(date.fromisoformat(key).toordinal())
+
+
+def format_day(day: date) -> str:
+    """ISO day key of a date (or of the date part of a datetime)."""
+    return day.strftime(DAY_FORMAT)
+
+
+def local_day(timestamp: float) -> date:
+    """The Paris calendar day a recorder `start` timestamp falls on."""
+    return datetime.fromtimestamp(timestamp, PARIS).date()
@@ -0,0 +1,37 @@
+"""Diagnostics support for Gaz de Bordeaux."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import GdbCoordinator
+
+TO_REDACT = {CONF_USERNAME, CONF_PASSWORD}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: GdbCoordinator = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "contracts": {
+            category: contract.house for category, contract in coordinator.contracts.items()
+        },
+        "last_update": coordinator.last_update,
+        "stale": coordinator.stale,
+        "latest_day": coordinator.latest_day,
+        # Already redacted when recorded; None unless the option is on.
+        "exchanges": (
+            coordinator.exchanges.to_har() if coordinator.exchanges is not None else None
+        ),
+    }
@@ -0,0 +1,61 @@
+"""House discovery shared by the config and options flows.
+
+The config flow hands its Discovery (login token and contracts) over to the
+entry setup through hass.data, so adding an account costs one login and one
+house listing in total. A hand-off the setup didn't take is dropped when
+the flow ends.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.selector import (
+    SelectOptionDict,
+    SelectSelector,
+    SelectSelectorConfig,
+)
+
+from .const import CATEGORY, HOUSE, SUPPORTED_CATEGORIES
+from .gazdebordeaux import Contract, Discovery, Gazdebordeaux
+
+
+async def async_discover(hass: HomeAssistant, login_data: dict[str, Any]) -> Discovery:
+    """Log in and list the supported contracts of the account.
+
+    The houses are fetched concurrently. Raises on bad credentials or if the
+    site can't be reached.
+    """
+    # HA's shared session: a flow may try several times, each one used to
+    # leave a session of its own behind.
+    api = Gazdebordeaux(
+        async_get_clientsession(hass),
+        login_data[CONF_USERNAME],
+        login_data[CONF_PASSWORD],
+    )
+    await api.async_login()
+    contracts = await api.async_list_contracts()
+    return Discovery(
+        token=api.token or "",
+        contracts=tuple(c for c in contracts if c.category in SUPPORTED_CATEGORIES),
+    )
+
+
+def house_selector(contracts: tuple[Contract, ...]) -> SelectSelector:
+    """Dropdown of the contracts, labelled by category and address."""
+    return SelectSelector(
+        SelectSelectorConfig(
+            options=[SelectOptionDict(value=c.house, label=c.label) for c in contracts]
+        )
+    )
+
+
+def house_data(contracts: tuple[Contract, ...], house: str | None) -> dict[str, Any]:
+    """Entry data pinning `house`, with its category; empty for every contract."""
+    for contract in contracts:
+        if contract.house == house:
+            return {HOUSE: house, CATEGORY: contract.category}
+    return {}
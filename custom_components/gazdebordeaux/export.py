@@ -0,0 +1,235 @@
+"""Export of the imported daily series to CSV or Parquet, for analysis outside HA.
+
+Exports append: a file already holding days up to some date only gets the
+days after it, so a scheduled export writes just the new days. Days the
+supplier revises later are not picked up that way; an export given a
+`start` on or before its last day writes every day from `start` on again,
+revised values and the running totals after them included (the days of an
+EVENT_NEW_DATA make that start). Rows are
+produced one at a time from a snapshot of the series and written in
+batches of EXPORT_BATCH, so memory stays flat whatever the history. Every
+function here is blocking and meant for an executor.
+
+A Parquet file can't be appended to, so a Parquet export is a directory
+holding one file per run (`<first day>_<last day>.parquet`), which pyarrow,
+pandas or DuckDB read as a single dataset. pyarrow is not a requirement of
+the integration; it has to be installed for Parquet exports.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import csv
+import dataclasses
+import itertools
+import os
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+from .series import FIELDS, Values
+
+FORMATS = ("csv", "parquet")
+# Series fields also exported as running totals.
+SUMMED = ("energy", "volume", "cost")
+COLUMNS = ("day", *FIELDS, *(f"{field}_sum" for field in SUMMED))
+EXPORT_BATCH = 1000
+# Bytes read from the end of a CSV export to find its last day.
+TAIL_SIZE = 4096
+
+
+class ExportError(Exception):
+    """The export could not be written."""
+
+
+@dataclasses.dataclass(frozen=True)
+class ExportResult:
+    path: Path
+    rows: int
+    first: date | None = None
+    last: date | None = None
+
+
+def export_name(category: str, fmt: str) -> str:
+    """File (CSV) or directory (Parquet) name of a category's export."""
+    return f"gazdebordeaux_{category}.{fmt}"
+
+
+def export_rows(
+    days: Iterable[tuple[date, Values]],
+    after: date | None = None,
+    start: date | None = None,
+    end: date | None = None,
+) -> Iterator[tuple[Any, ...]]:
+    """COLUMNS rows of the days between `start` and `end` that come after `after`.
+
+    `days` is the whole series in day order: the running totals start on
+    its first day, whatever part of it is exported.
+    """
+    indexes = [FIELDS.index(field) for field in SUMMED]
+    sums = [0.0] * len(SUMMED)
+    for day, values in days:
+        if end is not None and day > end:
+            return
+        for k, index in enumerate(indexes):
+            sums[k] += values[index] or 0.0
+        if (after is not None and day <= after) or (start is not None and day < start):
+            continue
+        yield (day, *values, *(round(total, 3) for total in sums))
+
+
+def _batches(rows: Iterable[tuple[Any, ...]]) -> Iterator[list[tuple[Any, ...]]]:
+    iterator = iter(rows)
+    while batch := list(itertools.islice(iterator, EXPORT_BATCH)):
+        yield batch
+
+
+def last_csv_day(path: Path) -> date | None:
+    """Last day of a CSV export, read from its tail; None if there is none."""
+    if not path.exists():
+        return None
+    with path.open("rb") as file:
+        file.seek(max(0, file.seek(0, os.SEEK_END) - TAIL_SIZE))
+        lines = file.read().splitlines()
+    for line in reversed(lines):
+        with contextlib.suppress(ValueError):
+            return date.fromisoformat(line.split(b",", 1)[0].decode())
+    return None
+
+
+def _truncate_csv(path: Path, day: date) -> None:
+    """Cut the CSV at `path` before its first row on or after `day`."""
+    with path.open("r+b") as file:
+        offset = 0
+        for line in file:
+            with contextlib.suppress(ValueError):
+                if date.fromisoformat(line.split(b",", 1)[0].decode()) >= day:
+                    break
+            offset += len(line)
+        file.truncate(offset)
+
+
+def write_csv(path: Path, rows: Iterable[tuple[Any, ...]]) -> ExportResult:
+    """Append `rows` to the CSV at `path`, with a header if it is new."""
+    new = not path.exists() or path.stat().st_size == 0
+    count = 0
+    first = last = None
+    with path.open("a", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        if new:
+            writer.writerow(COLUMNS)
+        for batch in _batches(rows):
+            writer.writerows(batch)
+            count += len(batch)
+            first = first or batch[0][0]
+            last = batch[-1][0]
+    return ExportResult(path, count, first, last)
+
+
+def _parquet_parts(directory: Path) -> dict[Path, tuple[date, date]]:
+    """Files of a Parquet export with the first and last day in their name."""
+    parts = {}
+    for part in directory.glob("*.parquet"):
+        with contextlib.suppress(ValueError):
+            first, last = part.stem.split("_")
+            parts[part] = (date.fromisoformat(first), date.fromisoformat(last))
+    return parts
+
+
+def last_parquet_day(directory: Path) -> date | None:
+    """Last day of a Parquet export, from its file names; None if there is none."""
+    return max((last for _, last in _parquet_parts(directory).values()), default=None)
+
+
+def write_parquet(directory: Path, rows: Iterable[tuple[Any, ...]]) -> ExportResult:
+    """Write `rows` as a new file of the Parquet dataset at `directory`."""
+    try:
+        import pyarrow as pa  # noqa: PLC0415
+        import pyarrow.parquet as pq  # noqa: PLC0415
+    except ImportError as err:
+        raise ExportError("Parquet export needs the pyarrow package") from err
+
+    schema = pa.schema(
+        [pa.field("day", pa.date32()), *(pa.field(name, pa.float64()) for name in COLUMNS[1:])]
+    )
+    directory.mkdir(exist_ok=True)
+    partial = directory / ".export.parquet.partial"
+    count = 0
+    first = last = None
+    try:
+        with pq.ParquetWriter(partial, schema) as writer:
+            for batch in _batches(rows):
+                columns: Sequence[tuple[Any, ...]] = list(zip(*batch, strict=True))
+                writer.write_table(
+                    pa.Table.from_arrays(
+                        [
+                            pa.array(column, type=field.type)
+                            for column, field in zip(columns, schema, strict=True)
+                        ],
+                        schema=schema,
+                    )
+                )
+                count += len(batch)
+                first = first or batch[0][0]
+                last = batch[-1][0]
+        if count:
+            partial.rename(directory / f"{first}_{last}.parquet")
+    finally:
+        partial.unlink(missing_ok=True)
+    return ExportResult(directory, count, first, last)
+
+
+def export(
+    path: Path,
+    fmt: str,
+    days: Sequence[tuple[date, Values]],
+    start: date | None = None,
+    end: date | None = None,
+) -> ExportResult:
+    """Write the days of `days` between `start` and `end` to the export at `path`.
+
+    Without `start` only the days after the last exported one are appended.
+    A `start` on or before it writes the days from `start` on again, through
+    the last exported day at least, in place of the exported ones. An `end`
+    before the last exported day without a `start` has nothing to append
+    and raises ExportError. An export with no day to write leaves the files
+    as they are.
+    """
+    parquet = fmt == "parquet"
+    try:
+        last = last_parquet_day(path) if parquet else last_csv_day(path)
+        after = last
+        stale: list[Path] = []
+        truncate: date | None = None
+        if last is not None and start is not None and start <= last:
+            after = None
+            end = None if end is None else max(end, last)
+            if parquet:
+                # Parts holding days from `start` on are replaced, whole.
+                parts = _parquet_parts(path)
+                stale = [part for part, (_, part_last) in parts.items() if part_last >= start]
+                start = min([start, *(parts[part][0] for part in stale)])
+            else:
+                truncate = start
+        elif last is not None and end is not None and end < last:
+            raise ExportError(
+                f"Days up to {last} are already exported; give a start to export them again"
+            )
+        rows = export_rows(days, after, start, end)
+        first = next(rows, None)
+        if first is None:
+            # Nothing to write: the exported days, if any, stay as they are.
+            return ExportResult(path, 0, None, None)
+        rows = itertools.chain([first], rows)
+        if not parquet:
+            if truncate is not None:
+                _truncate_csv(path, truncate)
+            return write_csv(path, rows)
+        result = write_parquet(path, rows)
+        for part in stale:
+            if part.name != f"{result.first}_{result.last}.parquet":
+                part.unlink()
+        return result
+    except OSError as err:
+        raise ExportError(str(err)) from err
@@ -0,0 +1,288 @@
+"""End-of-month and end-of-year projections from heating degree days.
+
+Daily consumption is regressed on heating degree days (HDD: how far the
+day's mean temperature is below HDD_BASE), and daily cost on consumption
+(subscription plus rate). Remaining days are predicted from the average HDD
+of their calendar month in the history, and added to what was actually used
+so far.
+
+Both fits only keep weighted sums (n, Σx, Σy, Σx², Σxy, Σy²). A batch of
+days is folded in with one pass over its columns, and a refresh that brings
+two new days costs two rows, not a refit of the whole history. Older days
+weigh less (half-life HALF_LIFE_DAYS) so a tariff change or new heating
+shows up within a season. A day revised after it was folded in is taken
+back with the values it was folded in with, then added again; a day
+published late is added at its age.
+"""
+
+from __future__ import annotations
+
+import calendar
+import dataclasses
+import math
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import date, datetime, timedelta
+from typing import Any, Protocol
+
+# French DJU convention (degrés-jours unifiés).
+HDD_BASE = 18.0
+HALF_LIFE_DAYS = 365
+DECAY = 0.5 ** (1 / HALF_LIFE_DAYS)
+# No projection before this many days with a temperature.
+MIN_FIT_DAYS = 14
+
+
+class _DailyRead(Protocol):
+    date: datetime
+    amountOfEnergy: float  # noqa: N815 - mirrors DailyUsageRead
+    price: float
+    temperature: float | None
+
+
+# Energy, cost and temperature of a day, as it was folded in.
+Folded = tuple[float, float, float | None]
+
+
+def degree_days(temperature: float) -> float:
+    return max(0.0, HDD_BASE - temperature)
+
+
+@dataclasses.dataclass
+class LinearFit:
+    """Weighted least squares of y on x, from running sums."""
+
+    w: float = 0.0
+    x: float = 0.0
+    y: float = 0.0
+    xx: float = 0.0
+    xy: float = 0.0
+    yy: float = 0.0
+
+    def extend(self, xs: Sequence[float], ys: Sequence[float], ages: Sequence[int]) -> None:
+        """Add points in one pass; `ages[i]` is how many days older than the newest it is.
+
+        The existing sums must already be aged to the newest point (`age`).
+        """
+        self._add([DECAY**age for age in ages], xs, ys)
+
+    def retract(self, xs: Sequence[float], ys: Sequence[float], ages: Sequence[int]) -> None:
+        """Take back points added by `extend`, at their current age."""
+        self._add([-(DECAY**age) for age in ages], xs, ys)
+
+    def _add(self, weights: Sequence[float], xs: Sequence[float], ys: Sequence[float]) -> None:
+        self.w += math.fsum(weights)
+        self.x += math.fsum(w * x for w, x in zip(weights, xs, strict=True))
+        self.y += math.fsum(w * y for w, y in zip(weights, ys, strict=True))
+        self.xx += math.fsum(w * x * x for w, x in zip(weights, xs, strict=True))
+        self.xy += math.fsum(w * x * y for w, x, y in zip(weights, xs, ys, strict=True))
+        self.yy += math.fsum(w * y * y for w, y in zip(weights, ys, strict=True))
+
+    def age(self, days: int) -> None:
+        """Weigh every point so far as if `days` more had passed."""
+        factor = DECAY**days
+        for field in dataclasses.fields(self):
+            setattr(self, field.name, getattr(self, field.name) * factor)
+
+    @property
+    def _sxx(self) -> float:
+        return self.w * self.xx - self.x * self.x
+
+    @property
+    def slope(self) -> float:
+        sxx = self._sxx
+        return (self.w * self.xy - self.x * self.y) / sxx if sxx > 1e-9 else 0.0
+
+    @property
+    def intercept(self) -> float:
+        return (self.y - self.slope * self.x) / self.w if self.w else 0.0
+
+    @property
+    def r2(self) -> float | None:
+        """Coefficient of determination; None when x or y never varied."""
+        syy = self.w * self.yy - self.y * self.y
+        sxx = self._sxx
+        if sxx <= 1e-9 or syy <= 1e-9:
+            return None
+        sxy = self.w * self.xy - self.x * self.y
+        return sxy * sxy / (sxx * syy)
+
+    def predict(self, x: float) -> float:
+        return self.intercept + self.slope * x
+
+
+@dataclasses.dataclass(frozen=True)
+class Projection:
+    """Expected totals at the end of the month and year of `as_of`."""
+
+    as_of: date
+    month_energy: float
+    month_cost: float
+    year_energy: float
+    year_cost: float
+
+
+@dataclasses.dataclass
+class DegreeDayModel:
+    """Consumption-on-HDD and cost-on-consumption fits, updated day by day."""
+
+    energy: LinearFit = dataclasses.field(default_factory=LinearFit)
+    cost: LinearFit = dataclasses.field(default_factory=LinearFit)
+    # Days folded in; days with a temperature (fitted).
+    days: int = 0
+    fitted_days: int = 0
+    last_day: date | None = None
+    # HDD total and day count per calendar month (1-12), for the remaining days.
+    month_hdd: list[float] = dataclasses.field(default_factory=lambda: [0.0] * 12)
+    month_count: list[int] = dataclasses.field(default_factory=lambda: [0] * 12)
+    # Actual energy and cost since the first of last_day's month and year.
+    month_energy: float = 0.0
+    month_cost: float = 0.0
+    year_energy: float = 0.0
+    year_cost: float = 0.0
+
+    def __bool__(self) -> bool:
+        return self.days > 0
+
+    def update(
+        self, reads: Iterable[_DailyRead], previous: Mapping[date, Folded | None] | None = None
+    ) -> int:
+        """Fold in `reads` in one pass; return how many days changed the model.
+
+        Days after `last_day` are added. Days up to it are revised if they are
+        in `previous`, with the values they were folded in with (None if they
+        never were, as a day published late), and skipped otherwise.
+        """
+        by_day = {read.date.date(): read for read in reads}
+        revised = 0
+        if self.last_day is not None:
+            for day in sorted(day for day in by_day if day <= self.last_day):
+                read = by_day.pop(day)
+                if previous is not None and day in previous:
+                    revised += self._revise(day, previous[day], read)
+        days = sorted(by_day)
+        if not days:
+            return revised
+        newest = days[-1]
+        if self.last_day is not None:
+            self.energy.age((newest - self.last_day).days)
+            self.cost.age((newest - self.last_day).days)
+
+        hdd: list[float] = []
+        energy: list[float] = []
+        energy_ages: list[int] = []
+        for day in days:
+            read = by_day[day]
+            if read.temperature is not None:
+                dd = degree_days(read.temperature)
+                hdd.append(dd)
+                energy.append(read.amountOfEnergy)
+                energy_ages.append((newest - day).days)
+                self.month_hdd[day.month - 1] += dd
+                self.month_count[day.month - 1] += 1
+            self._add_actual(day, read.amountOfEnergy, read.price)
+        self.energy.extend(hdd, energy, energy_ages)
+        self.cost.extend(
+            [by_day[day].amountOfEnergy for day in days],
+            [by_day[day].price for day in days],
+            [(newest - day).days for day in days],
+        )
+        self.days += len(days)
+        self.fitted_days += len(hdd)
+        return revised + len(days)
+
+    def _revise(self, day: date, old: Folded | None, read: _DailyRead) -> int:
+        """Replace what `day` brought to the model (`old`, None if nothing) with `read`."""
+        new = (read.amountOfEnergy, read.price, read.temperature)
+        if old == new:
+            return 0
+        if old is None:
+            self.days += 1
+        else:
+            self._fold_day(day, old, -1)
+        self._fold_day(day, new, 1)
+        return 1
+
+    def _fold_day(self, day: date, values: Folded, sign: int) -> None:
+        """Add (sign 1) or take back (sign -1) a day up to `last_day`, at its age."""
+        last = self.last_day
+        assert last is not None
+        energy, cost, temperature = values
+        ages = [(last - day).days]
+        if temperature is not None:
+            dd = degree_days(temperature)
+            (self.energy.extend if sign > 0 else self.energy.retract)([dd], [energy], ages)
+            self.month_hdd[day.month - 1] += sign * dd
+            self.month_count[day.month - 1] += sign
+            self.fitted_days += sign
+        (self.cost.extend if sign > 0 else self.cost.retract)([energy], [cost], ages)
+        if day.year == last.year:
+            self.year_energy += sign * energy
+            self.year_cost += sign * cost
+            if day.month == last.month:
+                self.month_energy += sign * energy
+                self.month_cost += sign * cost
+
+    def _add_actual(self, day: date, energy: float, cost: float) -> None:
+        last = self.last_day
+        if last is None or day.year != last.year:
+            self.year_energy = self.year_cost = 0.0
+        if last is None or (day.year, day.month) != (last.year, last.month):
+            self.month_energy = self.month_cost = 0.0
+        self.month_energy += energy
+        self.month_cost += cost
+        self.year_energy += energy
+        self.year_cost += cost
+        self.last_day = day
+
+    def _expected_hdd(self, month: int) -> float:
+        if self.month_count[month - 1]:
+            return self.month_hdd[month - 1] / self.month_count[month - 1]
+        return math.fsum(self.month_hdd) / max(sum(self.month_count), 1)
+
+    def projection(self) -> Projection | None:
+        """Totals expected at the end of last_day's month and year, if fitted enough."""
+        last = self.last_day
+        if last is None or self.fitted_days < MIN_FIT_DAYS:
+            return None
+        month_end = date(last.year, last.month, calendar.monthrange(last.year, last.month)[1])
+        month_energy, month_cost = self.month_energy, self.month_cost
+        year_energy, year_cost = self.year_energy, self.year_cost
+        day = last + timedelta(days=1)
+        while day.year == last.year:
+            energy = max(0.0, self.energy.predict(self._expected_hdd(day.month)))
+            cost = max(0.0, self.cost.predict(energy))
+            if day <= month_end:
+                month_energy += energy
+                month_cost += cost
+            year_energy += energy
+            year_cost += cost
+            day += timedelta(days=1)
+        return Projection(last, month_energy, month_cost, year_energy, year_cost)
+
+    def quality(self) -> dict[str, Any]:
+        """Fit quality, for sensor attributes."""
+        r2 = self.energy.r2
+        return {
+            "r2": None if r2 is None else round(r2, 3),
+            "fitted_days": self.fitted_days,
+            "kwh_per_degree_day": round(self.energy.slope, 3),
+            "base_kwh_per_day": round(self.energy.intercept, 3),
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """JSON-serializable state, for the coordinator's Store."""
+        data = dataclasses.asdict(self)
+        data["last_day"] = None if self.last_day is None else self.last_day.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DegreeDayModel:
+        last_day = data.get("last_day")
+        return cls(
+            **{
+                **data,
+                "energy": LinearFit(**data["energy"]),
+                "cost": LinearFit(**data["cost"]),
+                "last_day": None if last_day is None else date.fromisoformat(last_day),
+            }
+        )
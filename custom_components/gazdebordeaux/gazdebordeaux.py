@@ -1,17 +1,45 @@
+import asyncio
 import dataclasses
+import functools
+import json
 import logging
+from collections.abc import Iterable, Mapping
 from datetime import datetime
 from json.decoder import JSONDecodeError
-from typing import Any
-
-import pytz
-from aiohttp import ClientSession
+from types import MappingProxyType
+from typing import Any, cast
+
+from aiohttp import (
+    ClientConnectionError,
+    ClientPayloadError,
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+)
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from .dates import format_day, parse_day
+from .policy import (
+    NO_RETRY,
+    CircuitBreaker,
+    GdbAuthError,
+    GdbError,
+    GdbTransientError,
+    GdbWafBlockedError,
+    RetryPolicy,
+)
+from .profiling import PhaseTimer, timed
+from .transport import SessionTransport, Transport
+
+try:
+    from aiohttp.compression_utils import HAS_BROTLI
+except ImportError:  # pragma: no cover - very old aiohttp
+    HAS_BROTLI = False
 
 DATA_URL = "https://life.gazdebordeaux.fr{0}/consumptions"
 LOGIN_URL = "https://life.gazdebordeaux.fr/api/login_check"
 ME_URL = "https://life.gazdebordeaux.fr/api/users/me"
 
-INPUT_DATE_FORMAT = "%Y-%m-%d"
 
 # Browser-like headers. The WAF on life.gazdebordeaux.fr rejects requests that
 # don't look like the SPA (same-origin fetch from the web app).
@@ -21,6 +49,8 @@ BROWSER_HEADERS = {
         " (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
     ),
     "Accept": "application/json",
+    # Only advertise br when aiohttp can actually decode it (Brotli installed).
+    "Accept-Encoding": "gzip, deflate, br" if HAS_BROTLI else "gzip, deflate",
     "Accept-Language": "fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7",
     "Origin": "https://life.gazdebordeaux.fr",
     "Referer": "https://life.gazdebordeaux.fr/",
@@ -32,7 +62,23 @@ BROWSER_HEADERS = {
     "Sec-Ch-Ua-Platform": '"macOS"',
 }
 
-paris_tz = pytz.timezone("Europe/Paris")
+# Connector tuning for the integration-owned session (see create_session).
+# A refresh talks to a single host a handful of times, so a small keep-alive
+# pool and a long DNS cache cover it; the shared HA session is sized for
+# every integration at once.
+CONNECTOR_LIMIT = 4
+DNS_CACHE_TTL = 3600
+KEEPALIVE_TIMEOUT = 60
+# Per-request cap, so one stalled connection can't hang a refresh.
+REQUEST_TIMEOUT = ClientTimeout(total=60, sock_connect=15)
+
+# Daily payloads are parsed this many rows at a time, yielding to the event
+# loop in between, so a multi-year response doesn't stall it in one go.
+PARSE_CHUNK = 500
+
+# Parts of a structured house address, in display order.
+ADDRESS_KEYS = ("streetNumber", "street", "zipCode", "city")
+
 Logger = logging.getLogger(__name__)
 
 
@@ -50,8 +96,199 @@ class DailyUsageRead:
     amountOfEnergy: float
     volumeOfEnergy: float
     price: float
-    ratio: float
-    temperature: float
+    # Optional in the payload (missing or null on some days).
+    ratio: float | None
+    temperature: float | None
+    # True when `price` wasn't provided by the supplier yet (see tariff.py).
+    estimated: bool = False
+    # False when the supplier sent no price at all (null or missing): `price`
+    # is then a 0 placeholder, not a real 0.
+    priced: bool = True
+
+
+@dataclasses.dataclass(frozen=True)
+class Contract:
+    """One house on the account and the commodity its contract is for."""
+
+    house: str
+    # contractType.category: "gas", "electricity", ...
+    category: str | None
+    # Human-readable address, when the house payload has one.
+    address: str | None = dataclasses.field(default=None, compare=False)
+
+    @property
+    def label(self) -> str:
+        return f"{self.category or '?'} - {self.address or self.house}"
+
+
+@dataclasses.dataclass(frozen=True)
+class Discovery:
+    """A fresh login and the account's contracts, handed from the config flow to setup."""
+
+    token: str
+    contracts: tuple[Contract, ...]
+
+
+@dataclasses.dataclass(frozen=True)
+class DataRequest:
+    """Consumption request template, precomputed per (house, scale) and token.
+
+    Its headers and static params are sent as they are; the dates are added
+    per call.
+    """
+
+    house: str
+    url: str
+    headers: CIMultiDictProxy[str]
+    params: Mapping[str, str]
+
+
+# ----------------------------------------------------------------------------
+@functools.lru_cache(maxsize=8)
+def data_url(house: str) -> str:
+    """Return the consumption URL for a house path.
+
+    selectedHouse can be "/houses/{uuid}" or "/api/houses/{uuid}" depending
+    on the account; normalize to always include the /api prefix exactly once.
+    """
+    if not house.startswith("/api/"):
+        if not house.startswith("/"):
+            house = "/" + house
+        house = "/api" + house
+    return DATA_URL.format(house)
+
+
+def create_session() -> ClientSession:
+    """Create a session dedicated to life.gazdebordeaux.fr.
+
+    The caller owns the session and must close it.
+    """
+    connector = TCPConnector(
+        limit=CONNECTOR_LIMIT,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+    )
+    return ClientSession(
+        connector=connector,
+        headers=BROWSER_HEADERS,
+    )
+
+
+# ----------------------------------------------------------------------------
+# Payload parsing: one pass per payload, optional fields may be missing or
+# null. A bad daily row is reported with its reason instead of failing the
+# whole response.
+def _number(row: Mapping[str, Any], key: str, *, required: bool = False) -> float | None:
+    value = row.get(key)
+    if value is None:
+        if required:
+            raise ValueError(f"missing {key!r}")
+        return None
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        raise ValueError(f"{key!r} is not a number: {value!r}")
+    return float(value)
+
+
+def _object(payload: Any, what: str) -> dict[str, Any]:
+    if payload is None:
+        raise GdbError(f"{what} response was None (likely login/auth failure)")
+    if not isinstance(payload, dict):
+        raise GdbError(
+            f"Unexpected {what.lower()} response type={type(payload).__name__} value={payload!r}"
+        )
+    return payload
+
+
+def parse_total_usage(payload: Any) -> TotalUsageRead:
+    data = _object(payload, "Total usage")
+    total = data.get("total")
+    if not isinstance(total, dict):
+        raise GdbError(f"Total usage response missing 'total' key. Keys present: {list(data)}")
+    try:
+        return TotalUsageRead(
+            amountOfEnergy=cast(float, _number(total, "kwh", required=True)),
+            # Electricity contracts have no volume.
+            volumeOfEnergy=_number(total, "volumeOfEnergy") or 0.0,
+            price=cast(float, _number(total, "price", required=True)),
+        )
+    except ValueError as err:
+        raise GdbError(f"Invalid total usage: {err}") from err
+
+
+def parse_daily_usage(payload: Any) -> tuple[list[DailyUsageRead], dict[str, str]]:
+    """The valid days, and why each rejected one (by day key) was rejected."""
+    reads: list[DailyUsageRead] = []
+    rejected: dict[str, str] = {}
+    _parse_daily_rows(_object(payload, "Daily usage").items(), reads, rejected)
+    return reads, rejected
+
+
+async def async_parse_daily_usage(payload: Any) -> tuple[list[DailyUsageRead], dict[str, str]]:
+    """parse_daily_usage, PARSE_CHUNK rows at a time with a yield to the loop between."""
+    items = list(_object(payload, "Daily usage").items())
+    reads: list[DailyUsageRead] = []
+    rejected: dict[str, str] = {}
+    for i in range(0, len(items), PARSE_CHUNK):
+        if i:
+            await asyncio.sleep(0)
+        _parse_daily_rows(items[i : i + PARSE_CHUNK], reads, rejected)
+    return reads, rejected
+
+
+def _parse_daily_rows(
+    items: Iterable[tuple[str, Any]], reads: list[DailyUsageRead], rejected: dict[str, str]
+) -> None:
+    for key, row in items:
+        if key == "total":
+            continue
+        try:
+            if not isinstance(row, dict):
+                raise ValueError(f"row is {type(row).__name__}, not an object")
+            price = _number(row, "price")
+            reads.append(
+                DailyUsageRead(
+                    date=parse_day(key),
+                    amountOfEnergy=cast(float, _number(row, "kwh", required=True)),
+                    volumeOfEnergy=_number(row, "volumeOfEnergy") or 0.0,
+                    # Unpriced days are filled in by the tariff.
+                    price=price or 0.0,
+                    ratio=_number(row, "ratio"),
+                    temperature=_number(row, "temperature"),
+                    priced=price is not None,
+                )
+            )
+        except ValueError as err:
+            rejected[key] = str(err)
+
+
+def parse_user(payload: Any) -> tuple[str | None, list[str]]:
+    """selectedHouse and the houses list of /users/me."""
+    data = _object(payload, "User")
+    selected = data.get("selectedHouse") or None
+    houses = data.get("houses") or []
+    if (selected is not None and not isinstance(selected, str)) or not (
+        isinstance(houses, list) and all(isinstance(h, str) for h in houses)
+    ):
+        raise GdbError(f"Unexpected user response: {data!r}")
+    return selected, houses
+
+
+def parse_house_category(payload: Any) -> str | None:
+    """contractType.category of a house, None when it has no contract type."""
+    contract_type = _object(payload, "House").get("contractType") or {}
+    category = contract_type.get("category") if isinstance(contract_type, dict) else None
+    if category is not None and not isinstance(category, str):
+        raise GdbError(f"Unexpected house contract type: {contract_type!r}")
+    return category
+
+
+def parse_house_address(payload: Any) -> str | None:
+    """One-line address of a house, None when the payload has none."""
+    address = _object(payload, "House").get("address")
+    if isinstance(address, dict):
+        parts = [str(address[key]) for key in ADDRESS_KEYS if address.get(key)]
+        return " ".join(parts) or None
+    return address if isinstance(address, str) and address else None
 
 
 # ----------------------------------------------------------------------------
@@ -63,159 +300,119 @@ class Gazdebordeaux:
         password: str,
         token=None,
         house=None,
+        *,
+        retry: RetryPolicy = NO_RETRY,
+        transport: Transport | None = None,
     ):
-        self._session = session
+        # The session is only used through the transport; recording or replay
+        # transports wrap or replace it.
+        self._transport: Transport = (
+            transport if transport is not None else SessionTransport(session)
+        )
         self._username = username
         self._password = password
         self._token: str | None = token
         self._selectedHouse: str | None = house
+        # Headers are rebuilt only when the token changes, not per request.
+        self._headers_token: str | None = None
+        self._headers: CIMultiDictProxy[str] | None = None
+        # One template per (house, scale), so commodities fetched concurrently
+        # don't evict each other.
+        self._requests: dict[tuple[str, str], DataRequest] = {}
+        self._retry = retry
+        # Set by the coordinator while a refresh is profiled.
+        self.phase_timer: PhaseTimer | None = None
+        # Invalid daily rows per house, kept until the caller collects them.
+        self._rejected: dict[str, dict[str, str]] = {}
+        self._breaker = CircuitBreaker(retry.waf_threshold, retry.waf_cooldown)
+
+    @property
+    def selected_house(self) -> str | None:
+        return self._selectedHouse
+
+    @property
+    def token(self) -> str | None:
+        return self._token
+
+    @property
+    def transport(self) -> Transport:
+        return self._transport
 
     async def async_login(self):
         Logger.debug("Loging in...")
-        async with self._session.post(
+        token = await self._request_json(
+            "POST",
             LOGIN_URL,
-            headers=BROWSER_HEADERS,
+            "Login",
+            authenticated=False,
             json={"email": self._username, "password": self._password},
-        ) as response:
-            body = await response.text()
-            Logger.debug(
-                "Login response status=%s content-type=%s body=%s",
-                response.status,
-                response.headers.get("Content-Type"),
-                body,
-            )
-            try:
-                token = await response.json(content_type=None)
-            except JSONDecodeError as err:
-                raise Exception(
-                    f"Login response was not JSON "
-                    f"(status={response.status}, "
-                    f"content-type={response.headers.get('Content-Type')}): {body}"
-                ) from err
-
-            if token["token"] is None:
-                raise Exception("invalid auth" + body)
-            Logger.debug("Login response OK")
-            self._token = token["token"]
+        )
+        if not isinstance(token, dict) or token.get("token") is None:
+            raise GdbAuthError(f"invalid auth {token!r}")
+        Logger.debug("Login response OK")
+        self._token = token["token"]
 
     # ------------------------------------------------------
-    async def async_get_total_usage(self):
-        monthly_data = await self.async_get_data(None, None, "year")
+    async def async_get_total_usage(self, house: str | None = None):
+        monthly_data = await self.async_get_data(None, None, "year", house)
         Logger.debug("Total usage raw response: %s", monthly_data)
-
-        if monthly_data is None:
-            raise Exception("Total usage response was None (likely login/auth failure)")
-        if not isinstance(monthly_data, dict):
-            raise Exception(
-                f"Unexpected total usage response "
-                f"type={type(monthly_data).__name__} value={monthly_data!r}"
-            )
-        if "total" not in monthly_data:
-            keys = list(monthly_data.keys())
-            Logger.error(
-                "Total usage response missing 'total' key. Keys: %s. Full response: %s",
-                keys,
-                monthly_data,
-            )
-            raise Exception(f"Total usage response missing 'total' key. Keys present: {keys}")
-
-        d = monthly_data["total"]
-        return TotalUsageRead(
-            amountOfEnergy=d["kwh"],
-            volumeOfEnergy=d["volumeOfEnergy"],
-            price=d["price"],
-        )
+        with timed(self.phase_timer, "parse"):
+            return parse_total_usage(monthly_data)
 
     async def async_get_daily_usage(
-        self, start: datetime | None, end: datetime | None
+        self, start: datetime | None, end: datetime | None, house: str | None = None
     ) -> list[DailyUsageRead]:
-        daily_data = await self.async_get_data(start, end, "month")
+        daily_data = await self.async_get_data(start, end, "month", house)
         Logger.debug("Daily usage raw response: %s", daily_data)
 
-        if daily_data is None:
-            raise Exception("Daily usage response was None (likely login/auth failure)")
-        if not isinstance(daily_data, dict):
-            raise Exception(
-                f"Unexpected daily usage response "
-                f"type={type(daily_data).__name__} value={daily_data!r}"
-            )
-
-        usage_reads: list[DailyUsageRead] = []
-
-        for d in daily_data:
-            if d == "total":
-                continue
-            usage_reads.append(
-                DailyUsageRead(
-                    date=datetime.strptime(d, INPUT_DATE_FORMAT).replace(tzinfo=paris_tz),
-                    amountOfEnergy=daily_data[d]["kwh"],
-                    volumeOfEnergy=daily_data[d]["volumeOfEnergy"],
-                    price=daily_data[d]["price"],
-                    ratio=daily_data[d]["ratio"],
-                    temperature=daily_data[d]["temperature"],
-                )
-            )
-
+        with timed(self.phase_timer, "parse"):
+            usage_reads, rejected = await async_parse_daily_usage(daily_data)
+        if rejected:
+            Logger.debug("Rejected days: %s", rejected)
+            house = house or self._selectedHouse or ""
+            self._rejected.setdefault(house, {}).update(rejected)
         return usage_reads
 
-    async def async_get_data(self, start: datetime | None, end: datetime | None, scale: str) -> Any:
-        try:
-            if self._token is None:
-                await self.async_login()
-            if self._token is None:
-                return None
+    def pop_rejected(self, house: str) -> dict[str, str]:
+        """Days of `house` rejected since the last call, with the reason."""
+        return self._rejected.pop(house, {})
 
+    async def async_get_data(
+        self,
+        start: datetime | None,
+        end: datetime | None,
+        scale: str,
+        house: str | None = None,
+    ) -> Any:
+        """Fetch consumptions for `house`, or the selected house if not given."""
+        if self._token is None:
+            await self.async_login()
+        if self._token is None:
+            return None
+
+        if house is None:
             if self._selectedHouse is None:
                 await self.loadHouse()
                 Logger.debug("Loading last selected house")
+            house = self._selectedHouse or ""
 
-            Logger.debug("Loaded house info: %s", self._selectedHouse)
+        Logger.debug("Loaded house info: %s", house)
 
-            headers = {
-                **BROWSER_HEADERS,
-                "Authorization": "Bearer " + self._token,
-                "Connection": "keep-alive",
-                "Content-Type": "application/json",
-            }
-            payload = {"email": self._username, "password": self._password}
-            params = {"scale": scale}
+        request = self._data_request(house, scale)
+        params = request.params
+        if start is not None or end is not None:
+            params = dict(params)
             if start is not None:
-                params["startDate"] = start.strftime("%Y-%m-%d")
+                params["startDate"] = format_day(start)
             if end is not None:
-                params["endDate"] = end.strftime("%Y-%m-%d")
+                params["endDate"] = format_day(end)
 
-            # selectedHouse can be "/houses/{uuid}" or "/api/houses/{uuid}" depending
-            # on the account; normalize to always include the /api prefix exactly once.
-            house = self._selectedHouse or ""
-            if not house.startswith("/api/"):
-                if not house.startswith("/"):
-                    house = "/" + house
-                house = "/api" + house
-
-            url = DATA_URL.format(house)
-            Logger.debug("Fetching data url=%s params=%s", url, params)
-            async with self._session.get(
-                url, headers=headers, json=payload, params=params
-            ) as response:
-                body = await response.text()
-                Logger.debug(
-                    "Data response status=%s content-type=%s body=%s",
-                    response.status,
-                    response.headers.get("Content-Type"),
-                    body,
-                )
-                try:
-                    return await response.json(content_type=None)
-                except JSONDecodeError as err:
-                    raise Exception(
-                        f"Data response was not JSON "
-                        f"(status={response.status}, "
-                        f"content-type={response.headers.get('Content-Type')}): {body}"
-                    ) from err
-
-        except Exception:
-            Logger.error("An unexpected error occured while loading the data", exc_info=True)
-            raise
+        Logger.debug("Fetching data url=%s params=%s", request.url, params)
+        # Data calls are authenticated by the bearer token alone; don't send
+        # the credentials along with them.
+        return await self._request_json(
+            "GET", request.url, "Data", headers=request.headers, params=params
+        )
 
     async def loadHouse(self):
         if self._token is None:
@@ -226,23 +423,18 @@ class Gazdebordeaux:
         Logger.debug("Loading house info...")
 
         # querying House id
-        async with self._session.get(ME_URL, headers=self._authenticated_headers()) as response:
-            try:
-                data = await response.json()
-                Logger.debug("Loaded house info: %s", data)
-            except JSONDecodeError:
-                Logger.error("An unexpected error occured while loading the house", exc_info=True)
-                raise
-
-        if data.get("selectedHouse"):
-            self._selectedHouse = data["selectedHouse"]
+        data = await self._request_json("GET", ME_URL, "User")
+        Logger.debug("Loaded house info: %s", data)
+        selected, houses = parse_user(data)
+
+        if selected:
+            self._selectedHouse = selected
             return
 
         # Multi-contract accounts (e.g. gas + electricity) come back with no
         # selectedHouse. Iterate the houses list and pick the first gas one.
-        houses = data.get("houses") or []
         if not houses:
-            raise Exception("No houses found on this account")
+            raise GdbError("No houses found on this account")
 
         Logger.debug(
             "No selectedHouse; iterating over %d houses to find a gas contract",
@@ -250,8 +442,7 @@ class Gazdebordeaux:
         )
         seen: list[tuple[str, str | None]] = []
         for path in houses:
-            house = await self._fetch_house(path)
-            category = (house.get("contractType") or {}).get("category")
+            category = parse_house_category(await self._fetch_house(path))
             seen.append((path, category))
             Logger.debug("House %s category=%s", path, category)
             if category == "gas":
@@ -259,18 +450,155 @@ class Gazdebordeaux:
                 self._selectedHouse = path
                 return
 
-        raise Exception(f"No gas contract found among {len(houses)} houses: {seen}")
+        raise GdbError(f"No gas contract found among {len(houses)} houses: {seen}")
+
+    async def async_list_contracts(self) -> list[Contract]:
+        """Return every house on the account with its contract category.
 
-    def _authenticated_headers(self) -> dict:
-        return {
-            **BROWSER_HEADERS,
-            "Authorization": "Bearer " + (self._token or ""),
-            "Connection": "keep-alive",
-            "Content-Type": "application/json",
-        }
+        The house details are fetched concurrently; one login serves them all.
+        """
+        if self._token is None:
+            await self.async_login()
+
+        data = await self._request_json("GET", ME_URL, "User")
+        Logger.debug("Loaded house info: %s", data)
+        selected, houses = parse_user(data)
+        if not houses and selected:
+            houses = [selected]
+        if not houses:
+            raise GdbError("No houses found on this account")
+
+        details = await asyncio.gather(*(self._fetch_house(path) for path in houses))
+        contracts = [
+            Contract(
+                house=path,
+                category=parse_house_category(house),
+                address=parse_house_address(house),
+            )
+            for path, house in zip(houses, details, strict=True)
+        ]
+        Logger.debug("Contracts on this account: %s", contracts)
+        return contracts
+
+    def _data_request(self, house: str, scale: str = "day") -> DataRequest:
+        """The template of `house`'s consumption requests, rebuilt when the token changes."""
+        headers = self._authenticated_headers()
+        request = self._requests.get((house, scale))
+        if request is None or request.headers is not headers:
+            request = DataRequest(
+                house=house,
+                url=data_url(house),
+                headers=headers,
+                params=MappingProxyType({"scale": scale}),
+            )
+            self._requests[house, scale] = request
+        return request
+
+    def _authenticated_headers(self) -> CIMultiDictProxy[str]:
+        if self._headers is None or self._headers_token != self._token:
+            self._headers = CIMultiDictProxy(
+                CIMultiDict(
+                    {
+                        **BROWSER_HEADERS,
+                        "Authorization": "Bearer " + (self._token or ""),
+                        "Connection": "keep-alive",
+                        "Content-Type": "application/json",
+                    }
+                )
+            )
+            self._headers_token = self._token
+        return self._headers
 
     async def _fetch_house(self, path: str) -> Any:
         url = "https://life.gazdebordeaux.fr" + path
         Logger.debug("Fetching house %s", url)
-        async with self._session.get(url, headers=self._authenticated_headers()) as response:
-            return await response.json(content_type=None)
+        return await self._request_json("GET", url, "House")
+
+    async def _request_json(
+        self,
+        method: str,
+        url: str,
+        what: str,
+        *,
+        authenticated: bool = True,
+        headers: Mapping[str, str] | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Send a request under the retry policy and return the decoded JSON body.
+
+        `headers` (those of a DataRequest) are sent until a re-login replaces
+        the token they carry. A 401 on an authenticated call triggers a
+        single re-login. Transient failures are retried with backoff until
+        the policy's attempts or time budget run out; WAF blocks also feed
+        the circuit breaker, which fails fast once open instead of sending
+        more requests.
+        """
+        self._breaker.check()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._retry.budget
+        attempt = 0
+        relogged = False
+        while True:
+            if relogged or headers is None:
+                headers = self._authenticated_headers() if authenticated else BROWSER_HEADERS
+            try:
+                result = await self._send(method, url, what, headers=headers, **kwargs)
+            except GdbAuthError:
+                if not authenticated or relogged:
+                    raise
+                Logger.debug("%s: token rejected, logging in again", what)
+                relogged = True
+                await self.async_login()
+                continue
+            except GdbTransientError as err:
+                if isinstance(err, GdbWafBlockedError):
+                    self._breaker.record_failure()
+                    if self._breaker.is_open:
+                        self._breaker.check()
+                delay = self._retry.delay(attempt, err.retry_after)
+                attempt += 1
+                if attempt >= self._retry.attempts or loop.time() + delay > deadline:
+                    raise
+                Logger.debug("%s failed (%s); retry %d in %.1fs", what, err, attempt, delay)
+                await asyncio.sleep(delay)
+                continue
+            self._breaker.record_success()
+            return result
+
+    async def _send(
+        self, method: str, url: str, what: str, *, headers: Mapping[str, str], **kwargs: Any
+    ) -> Any:
+        """Perform one request and classify the outcome."""
+        try:
+            with timed(self.phase_timer, "network"):
+                response = await self._transport.send(
+                    method, url, headers=headers, request_timeout=REQUEST_TIMEOUT, **kwargs
+                )
+        except (TimeoutError, ClientConnectionError, ClientPayloadError) as err:
+            raise GdbTransientError(f"{what} request failed: {err!r}") from err
+        body = response.body
+        status = response.status
+        content_type = response.content_type
+        retry_after = response.retry_after
+        Logger.debug(
+            "%s response status=%s content-type=%s body=%s", what, status, content_type, body
+        )
+
+        if status == 401:
+            raise GdbAuthError(f"{what} request unauthorized (status=401): {body}")
+        if status == 429 or status >= 500:
+            raise GdbTransientError(
+                f"{what} request failed (status={status})",
+                float(retry_after) if retry_after and retry_after.isdigit() else None,
+            )
+        try:
+            with timed(self.phase_timer, "parse"):
+                return json.loads(body)
+        except JSONDecodeError as err:
+            message = (
+                f"{what} response was not JSON "
+                f"(status={status}, content-type={content_type}): {body}"
+            )
+            if status == 403:
+                raise GdbWafBlockedError(message) from err
+            raise GdbError(message) from err
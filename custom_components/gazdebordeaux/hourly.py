@@ -0,0 +1,87 @@
+"""Spread daily consumption over the hours of the day, for an hourly statistic.
+
+The API only has daily totals, which land on local midnight: the Energy
+dashboard's hourly view shows one spike a day. An hourly statistic, kept
+next to the authoritative daily one, spreads each day's kWh over its hours
+along a load profile. Its running sum meets the daily sum at the end of
+every day, so the two never disagree over a whole day.
+
+Days are split along their real local hours, 23 or 25 on DST changes. With
+the "temperature" profile, the colder the day the more its shape follows
+the heating schedule rather than hot water and cooking.
+"""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Sequence
+from datetime import UTC, date, datetime, timedelta
+
+from .dates import PARIS, day_start
+from .forecast import degree_days
+
+# Relative weight of each local hour (0-23). Hot water and cooking: morning
+# and evening peaks. Heating: night setback, morning ramp-up, evening plateau.
+RESIDENTIAL = (
+    0.4, 0.3, 0.3, 0.3, 0.3, 0.5, 1.2, 2.0, 1.6, 1.0, 0.8, 0.9,
+    1.2, 1.0, 0.8, 0.8, 1.0, 1.3, 1.8, 2.0, 1.6, 1.1, 0.7, 0.5,
+)  # fmt: skip
+HEATING = (
+    0.6, 0.5, 0.5, 0.5, 0.6, 1.0, 1.6, 1.7, 1.4, 1.1, 1.0, 0.9,
+    0.9, 0.9, 0.9, 1.0, 1.1, 1.3, 1.4, 1.4, 1.3, 1.2, 1.0, 0.8,
+)  # fmt: skip
+FLAT = (1.0,) * 24
+# Degree days from which a day is shaped by heating alone.
+FULL_HEATING_HDD = 10.0
+
+PROFILES = ("flat", "residential", "temperature")
+
+
+@functools.lru_cache(maxsize=4096)
+def day_hours(ordinal: int) -> tuple[tuple[datetime, ...], tuple[int, ...]]:
+    """UTC start and local hour of every hour of a Paris day (23 to 25 of them)."""
+    day = date.fromordinal(ordinal)
+    start = day_start(day).astimezone(UTC)
+    end = day_start(day + timedelta(days=1)).astimezone(UTC)
+    starts = tuple(start + timedelta(hours=k) for k in range((end - start) // timedelta(hours=1)))
+    return starts, tuple(s.astimezone(PARIS).hour for s in starts)
+
+
+def _shape(profile: str, temperature: float | None) -> Sequence[float]:
+    if profile == "residential":
+        return RESIDENTIAL
+    if profile == "temperature":
+        share = (
+            0.0 if temperature is None else min(1.0, degree_days(temperature) / FULL_HEATING_HDD)
+        )
+        return [share * h + (1 - share) * r for h, r in zip(HEATING, RESIDENTIAL, strict=True)]
+    return FLAT
+
+
+def disaggregate(
+    days: Sequence[date],
+    amounts: Sequence[float],
+    end_sums: Sequence[float],
+    temperatures: Sequence[float | None],
+    profile: str,
+) -> list[tuple[datetime, float, float]]:
+    """(start, kWh, running sum) for every hour of `days`, in one pass.
+
+    `end_sums[i]` is the daily statistic's sum at the end of `days[i]`; the
+    hourly sum starts the day at `end_sums[i] - amounts[i]` and ends on it.
+    """
+    rows: list[tuple[datetime, float, float]] = []
+    for day, amount, end_sum, temperature in zip(
+        days, amounts, end_sums, temperatures, strict=True
+    ):
+        starts, hours = day_hours(day.toordinal())
+        shape = _shape(profile, temperature)
+        weights = [shape[hour] for hour in hours]
+        scale = amount / sum(weights)
+        running = end_sum - amount
+        for start, weight in zip(starts[:-1], weights, strict=False):
+            running += weight * scale
+            rows.append((start, weight * scale, running))
+        # The last hour closes on the daily sum exactly, without rounding drift.
+        rows.append((starts[-1], end_sum - running, end_sum))
+    return rows
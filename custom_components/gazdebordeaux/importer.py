@@ -0,0 +1,183 @@
+"""One import worker per commodity, so statistics writes never overlap.
+
+Every write computes sums from what the recorder already holds: a refresh
+from the last imported day, a range import from the day before the range,
+a reconciliation from the months it repairs. Two of them interleaving
+(scheduled refresh, manual refresh, import_range service) would each start
+from sums the other is rewriting. The worker runs them one at a time.
+
+Requests queued while a job runs are merged into the next one: any number
+of refresh triggers become a single incremental import, and range imports
+are merged into contiguous ranges. Each caller waits for the job that
+covers its request and gets that job's error, if any.
+
+Writes are queued in the recorder, not committed when a job returns; the
+worker flushes them before the next job reads the sums back.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import date, timedelta
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def merge_ranges(ranges: Iterable[tuple[date, date]]) -> list[tuple[date, date]]:
+    """Overlapping or adjacent (start, end) day ranges merged, in day order."""
+    merged: list[tuple[date, date]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + timedelta(days=1):
+            merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _settle(futures: Iterable[asyncio.Future[Any]], err: BaseException | None, result: Any) -> None:
+    for future in futures:
+        if future.done():  # the caller gave up (cancelled)
+            continue
+        if err is None:
+            future.set_result(result)
+        else:
+            future.set_exception(err)
+
+
+class ImportWorker:
+    """Serializes the imports of one commodity; see the module docstring.
+
+    `incremental(deadline)` imports the days since the last imported one;
+    `ranged(start, end)` re-imports a range. Merged refreshes get the
+    earliest deadline of their callers, so none of them waits past its own.
+    `flush()` commits what the previous job wrote.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        incremental: Callable[[float | None], Awaitable[None]],
+        ranged: Callable[[date, date], Awaitable[None]],
+        flush: Callable[[], Awaitable[None]] | None = None,
+    ) -> None:
+        self.name = name
+        self._incremental = incremental
+        self._ranged = ranged
+        self._flush = flush
+        # A job ran since the last flush.
+        self._dirty = False
+        self._refreshes: list[tuple[float | None, asyncio.Future[None]]] = []
+        self._ranges: list[tuple[date, date, asyncio.Future[None]]] = []
+        self._jobs: list[tuple[Callable[[], Awaitable[Any]], asyncio.Future[Any]]] = []
+        self._task: asyncio.Task[None] | None = None
+        # Jobs run so far, by kind ("refresh", "range", "job").
+        self.runs: dict[str, int] = {"refresh": 0, "range": 0, "job": 0}
+
+    def request_refresh(self, deadline: float | None = None) -> asyncio.Future[None]:
+        """Import the new days; merged with the other refreshes pending."""
+        future = self._future()
+        self._refreshes.append((deadline, future))
+        return future
+
+    def request_range(self, start: date, end: date) -> asyncio.Future[None]:
+        """Re-import `start` to `end`; merged with the overlapping ranges pending."""
+        future = self._future()
+        self._ranges.append((start, end, future))
+        return future
+
+    def run(self, job: Callable[[], Awaitable[Any]]) -> asyncio.Future[Any]:
+        """Run `job` on its own, between the imports."""
+        future = self._future()
+        self._jobs.append((job, future))
+        return future
+
+    async def async_stop(self) -> None:
+        """Cancel the running job and drop the pending ones."""
+        pending = [f for _, f in self._refreshes] + [f for *_, f in self._ranges]
+        pending += [f for _, f in self._jobs]
+        self._refreshes, self._ranges, self._jobs = [], [], []
+        for future in pending:
+            future.cancel()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    def _future(self) -> asyncio.Future[Any]:
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._async_drain(), name=f"import {self.name}")
+        return loop.create_future()
+
+    async def _async_drain(self) -> None:
+        # Let the triggers of the same loop turn join the first job.
+        await asyncio.sleep(0)
+        while self._ranges or self._jobs or self._refreshes:
+            if self._ranges:
+                ranges, self._ranges = self._ranges, []
+                for start, end in merge_ranges((s, e) for s, e, _ in ranges):
+                    waiting = [f for s, e, f in ranges if start <= s and e <= end]
+                    await self._async_step("range", waiting, self._ranged, start, end)
+            elif self._jobs:
+                job, future = self._jobs.pop(0)
+                await self._async_step("job", [future], job)
+            else:
+                refreshes, self._refreshes = self._refreshes, []
+                await self._async_step(
+                    "refresh",
+                    [f for _, f in refreshes],
+                    self._incremental,
+                    min((d for d, _ in refreshes if d is not None), default=None),
+                )
+
+    async def _async_step(
+        self,
+        kind: str,
+        waiting: list[asyncio.Future[Any]],
+        target: Callable[..., Awaitable[Any]],
+        *args: Any,
+    ) -> None:
+        if all(future.done() for future in waiting):
+            return
+        self.runs[kind] += 1
+        _LOGGER.debug("Running %s %s import (%d request(s))", self.name, kind, len(waiting))
+        if self._dirty and self._flush is not None:
+            try:
+                await self._flush()
+            except asyncio.CancelledError:
+                for future in waiting:
+                    future.cancel()
+                raise
+            except Exception as err:
+                _settle(waiting, err, None)
+                return
+        self._dirty = True
+        job = asyncio.ensure_future(target(*args))
+
+        def abandon(_: asyncio.Future[Any]) -> None:
+            # Every caller gave up (timed out, cancelled): so does the job.
+            if all(future.cancelled() for future in waiting):
+                job.cancel()
+
+        for future in waiting:
+            future.add_done_callback(abandon)
+        try:
+            await asyncio.wait([job])
+        except asyncio.CancelledError:
+            # Stopped (async_stop): the job's callers were already taken off
+            # the queues, so they are cancelled here.
+            job.cancel()
+            for future in waiting:
+                future.cancel()
+            raise
+        if job.cancelled():
+            # Abandoned by its callers, or cancelled from inside: either way
+            # none of them may be left waiting.
+            for future in waiting:
+                future.cancel()
+            return
+        # Handed to the callers of this job; the next jobs still run.
+        error = job.exception()
+        _settle(waiting, error, None if error is not None else job.result())
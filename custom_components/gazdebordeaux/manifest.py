@@ -1,3 +1,4 @@
+import functools
 import json
 import os
 
@@ -6,7 +7,9 @@ import os
 class Manifest:
     # ---------------------------------
     @staticmethod
+    @functools.cache
     def version():
+        # manifest.json doesn't change while HA runs; read it once.
         manifestFilePath = f"{os.path.dirname(__file__)}/manifest.json"
 
         with open(manifestFilePath) as jsonFile:
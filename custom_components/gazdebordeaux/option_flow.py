@@ -3,34 +3,34 @@
 from __future__ import annotations
 
 import logging
+from datetime import date
+from typing import Any
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry, ConfigFlowResult, OptionsFlow
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
-
-from .const import HOUSE, RESET_STATISTICS
-from .gazdebordeaux import Gazdebordeaux
+from homeassistant.helpers.selector import DateSelector
+
+from .const import (
+    CATEGORY,
+    DEDICATED_SESSION,
+    HOURLY_PROFILE,
+    HOUSE,
+    RECORD_PAYLOADS,
+    RESET_STATISTICS,
+    TARIFF_KWH_PRICE,
+    TARIFF_PERIODS,
+    TARIFF_START,
+    TARIFF_SUBSCRIPTION,
+)
+from .discovery import async_discover, house_data, house_selector
+from .gazdebordeaux import Contract
+from .hourly import PROFILES
+from .tariff import Tariff
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def _validate_login(hass: HomeAssistant, login_data: dict[str, str]) -> dict[str, str]:
-    """Validate login data and return any errors."""
-    api = Gazdebordeaux(
-        async_create_clientsession(hass),
-        login_data[CONF_USERNAME],
-        login_data[CONF_PASSWORD],
-    )
-    errors: dict[str, str] = {}
-    try:
-        await api.async_login()
-    except Exception:
-        errors["base"] = "invalid_auth"
-    return errors
-
-
 class GazdebordeauxOptionFlow(OptionsFlow):
     """Handle an options flow for Gazdebordeaux."""
 
@@ -41,10 +41,21 @@ class GazdebordeauxOptionFlow(OptionsFlow):
         # Ne PAS faire self.config_entry = config_entry
         # HA le gère en interne via la classe parente
         self._user_inputs: dict = {}  # Attribut d'instance
+        # Contrats du compte, pour la liste des maisons (vide si indisponible)
+        self._contracts: tuple[Contract, ...] = ()
 
     async def async_step_init(self, user_input: dict | None = None) -> ConfigFlowResult:
         """Gestion de l'étape 'init'."""
 
+        if user_input is None:
+            try:
+                discovery = await async_discover(self.hass, dict(self.config_entry.data))
+                self._contracts = discovery.contracts
+            except Exception:
+                # Site injoignable : la maison reste un champ texte
+                _LOGGER.debug("Impossible de lister les maisons", exc_info=True)
+
+        house_field: Any = house_selector(self._contracts) if self._contracts else str
         option_form = vol.Schema(
             {
                 vol.Required(
@@ -62,7 +73,33 @@ class GazdebordeauxOptionFlow(OptionsFlow):
                 vol.Optional(
                     HOUSE,
                     description={"suggested_value": self.config_entry.data.get(HOUSE, "")},
-                ): str,
+                ): house_field,
+                vol.Optional(
+                    TARIFF_KWH_PRICE,
+                    description={"suggested_value": self.config_entry.data.get(TARIFF_KWH_PRICE)},
+                ): vol.Coerce(float),
+                vol.Optional(
+                    TARIFF_SUBSCRIPTION,
+                    description={
+                        "suggested_value": self.config_entry.data.get(TARIFF_SUBSCRIPTION)
+                    },
+                ): vol.Coerce(float),
+                vol.Optional(
+                    TARIFF_START,
+                    description={"suggested_value": self.config_entry.data.get(TARIFF_START)},
+                ): DateSelector(),
+                vol.Optional(
+                    DEDICATED_SESSION,
+                    default=self.config_entry.data.get(DEDICATED_SESSION, False),
+                ): bool,
+                vol.Optional(
+                    RECORD_PAYLOADS,
+                    default=self.config_entry.data.get(RECORD_PAYLOADS, False),
+                ): bool,
+                vol.Optional(
+                    HOURLY_PROFILE,
+                    default=self.config_entry.data.get(HOURLY_PROFILE, "off"),
+                ): vol.In(("off", *PROFILES)),
             }
         )
 
@@ -77,6 +114,20 @@ class GazdebordeauxOptionFlow(OptionsFlow):
         _LOGGER.debug("option_flow step user (2). Valeurs reçues: %s", user_input)
         # On mémorise les user_input
         self._user_inputs.update(user_input)
+        # Catégorie de la maison choisie, gardée si la maison n'a pas changé
+        house = user_input.get(HOUSE)
+        category = house_data(self._contracts, house).get(CATEGORY)
+        if category is None and house and house == self.config_entry.data.get(HOUSE):
+            category = self.config_entry.data.get(CATEGORY)
+        if category is not None:
+            self._user_inputs[CATEGORY] = category
+        # Le tarif remplacé reste en vigueur avant la date du nouveau
+        start = user_input.get(TARIFF_START)
+        previous = Tariff.from_entry(self.config_entry.data)
+        self._user_inputs[TARIFF_PERIODS] = [
+            period.as_dict()
+            for period in previous.periods_before(date.fromisoformat(start) if start else None)
+        ]
 
         # On appelle le step de fin pour enregistrer les modifications
         return await self.async_end()
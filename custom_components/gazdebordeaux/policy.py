@@ -0,0 +1,109 @@
+"""Error classification, retry and circuit-breaker policy for the API client.
+
+life.gazdebordeaux.fr sits behind a WAF that answers blocked requests with
+an HTML 403 page. Hammering it while it blocks us only prolongs the block,
+so repeated WAF answers open a circuit that fails fast until a cooldown has
+passed; transient failures (timeouts, 429, 5xx) are retried with jittered
+exponential backoff inside a bounded time budget.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import random
+import time
+from collections.abc import Callable
+
+
+# ----------------------------------------------------------------------------
+class GdbError(Exception):
+    """Base class for errors raised by the Gaz de Bordeaux client."""
+
+
+class GdbAuthError(GdbError):
+    """Credentials were rejected, or the token expired (HTTP 401)."""
+
+
+class GdbTransientError(GdbError):
+    """Timeout, connection error, 429 or 5xx: worth retrying."""
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class GdbWafBlockedError(GdbTransientError):
+    """The WAF answered with its HTML 403 page instead of the API."""
+
+
+class GdbCircuitOpenError(GdbError):
+    """Too many WAF blocks in a row; requests are suspended for a while."""
+
+
+# ----------------------------------------------------------------------------
+@dataclasses.dataclass(frozen=True)
+class RetryPolicy:
+    """How hard the client tries before giving up on a request."""
+
+    attempts: int = 5
+    base_delay: float = 2.0
+    max_delay: float = 60.0
+    # Total wall-clock time a single request may spend retrying.
+    budget: float = 300.0
+    # Consecutive WAF blocks before the circuit opens, and for how long.
+    waf_threshold: int = 3
+    waf_cooldown: float = 1800.0
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """Backoff before retry number `attempt` (0-based), with equal jitter."""
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        cap = min(self.max_delay, self.base_delay * 2**attempt)
+        return cap / 2 + random.uniform(0, cap / 2)
+
+
+NO_RETRY = RetryPolicy(attempts=1)
+
+
+# ----------------------------------------------------------------------------
+class CircuitBreaker:
+    """Open after `threshold` consecutive failures, half-open after `cooldown`."""
+
+    def __init__(
+        self,
+        threshold: int,
+        cooldown: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._threshold = threshold
+        self._cooldown = cooldown
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None and self.remaining > 0
+
+    @property
+    def remaining(self) -> float:
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self._cooldown - self._clock())
+
+    def check(self) -> None:
+        """Raise if requests are currently suspended."""
+        if self.is_open:
+            raise GdbCircuitOpenError(
+                f"Suspended after {self._failures} WAF blocks, retrying in {self.remaining:.0f}s"
+            )
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._failures >= self._threshold:
+            # Also re-opens immediately when the half-open trial fails.
+            self._opened_at = self._clock()
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
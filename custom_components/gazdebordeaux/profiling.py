@@ -0,0 +1,123 @@
+"""Profiling of a single refresh: cProfile, tracemalloc and per-phase timers.
+
+Phase timers add up the time spent in each phase (network, parse, recorder)
+across every call, so with concurrent commodities their sum can exceed the
+wall-clock time. cProfile only sees the event loop thread: recorder queries
+run in executor threads and show up as time waiting on their futures.
+
+The timers are used on every refresh path, so cProfile, pstats and
+tracemalloc are only imported once a profile is actually taken.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import io
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import cProfile
+    import tracemalloc
+
+# Stack depth kept per allocation; deeper is slower and rarely more telling.
+TRACEMALLOC_FRAMES = 5
+# Functions listed in the summary, by cumulative time.
+TOP_FUNCTIONS = 30
+
+
+class PhaseTimer:
+    """Accumulates wall-clock time and call counts per phase name."""
+
+    def __init__(self) -> None:
+        self.totals: dict[str, float] = defaultdict(float)
+        self.counts: dict[str, int] = defaultdict(int)
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.totals[name] += time.perf_counter() - t0
+            self.counts[name] += 1
+
+
+def timed(timer: PhaseTimer | None, name: str) -> contextlib.AbstractContextManager[None]:
+    """`timer.phase(name)`, or a no-op outside of a profiled refresh."""
+    return contextlib.nullcontext() if timer is None else timer.phase(name)
+
+
+@dataclasses.dataclass
+class ProfileResult:
+    wall: float
+    timer: PhaseTimer
+    profiler: cProfile.Profile
+    allocations: list[tracemalloc.Statistic]
+    peak: int
+
+    def summary(self) -> str:
+        import pstats  # noqa: PLC0415
+
+        lines = [f"Refresh: {self.wall:.3f} s, peak traced memory {self.peak / 1024:.0f} KiB", ""]
+        lines.append("Phases (summed over calls):")
+        for name, total in sorted(self.timer.totals.items(), key=lambda item: -item[1]):
+            lines.append(f"  {name:<10} {total:8.3f} s  {self.timer.counts[name]:5d} calls")
+        lines += ["", f"Top {len(self.allocations)} allocations:"]
+        lines += [f"  {stat}" for stat in self.allocations]
+        out = io.StringIO()
+        pstats.Stats(self.profiler, stream=out).sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+        lines += ["", out.getvalue()]
+        return "\n".join(lines)
+
+    def write(self, directory: str | Path, stem: str) -> tuple[Path, Path]:
+        """Write `<stem>.prof` (pstats) and `<stem>.txt` (summary). Blocking."""
+        profile_path = Path(directory) / f"{stem}.prof"
+        summary_path = Path(directory) / f"{stem}.txt"
+        self.profiler.dump_stats(profile_path)
+        summary_path.write_text(self.summary(), encoding="utf-8")
+        return profile_path, summary_path
+
+
+async def async_profile(
+    run: Callable[[PhaseTimer], Awaitable[object]], top: int = 25
+) -> ProfileResult:
+    """Await `run(timer)` under cProfile and tracemalloc.
+
+    Raises ValueError if another profiler is already active.
+    """
+    import cProfile  # noqa: PLC0415
+    import tracemalloc  # noqa: PLC0415
+
+    timer = PhaseTimer()
+    profiler = cProfile.Profile()
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+    tracemalloc.reset_peak()
+    t0 = time.perf_counter()
+    try:
+        profiler.enable()
+        try:
+            await run(timer)
+        finally:
+            profiler.disable()
+        wall = time.perf_counter() - t0
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return ProfileResult(
+        wall=wall,
+        timer=timer,
+        profiler=profiler,
+        allocations=snapshot.statistics("lineno")[:top],
+        peak=peak,
+    )
@@ -0,0 +1,123 @@
+"""Drift checks between the imported daily sums and the supplier's totals.
+
+The statistics keep their own running sums, built day by day. A day skipped
+or corrected upstream after it was imported makes them drift from what the
+supplier reports, silently. Once a refresh, the current year's consumption
+sum is compared with the year-to-date total; when they disagree, the months
+responsible are found by bisection: only the left half of each span is
+fetched, the right half's total is what's left of the parent's. Monthly
+reads are cached for one reconciliation, so no month is fetched twice by
+it; they are not kept across refreshes, which would hide later revisions.
+The coordinator reconciles again only when the last imported day or the
+year total changed.
+
+`resum` then rewrites the sums from the first repaired day on, replacing the
+values of the repaired days and keeping the increments of the others.
+"""
+
+from __future__ import annotations
+
+import bisect
+import dataclasses
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from datetime import date, timedelta
+
+# A (first day, last day) calendar month, clipped to the compared period.
+Window = tuple[date, date]
+
+
+@dataclasses.dataclass(frozen=True)
+class Row:
+    """One daily statistic row: its local day, value and running sum."""
+
+    day: date
+    state: float | None
+    sum: float
+    # Recorder `start` timestamp; None for a day not in the recorder yet.
+    start: float | None = None
+
+
+def month_windows(first: date, last: date) -> list[Window]:
+    """Calendar months covering `first`..`last`, the ends clipped to them."""
+    windows: list[Window] = []
+    start = first
+    while start <= last:
+        next_month = date(start.year + start.month // 12, start.month % 12 + 1, 1)
+        windows.append((start, min(next_month - timedelta(days=1), last)))
+        start = next_month
+    return windows
+
+
+class SumIndex:
+    """Running sum at the end of any day, from rows sorted by day."""
+
+    def __init__(self, rows: Sequence[Row]) -> None:
+        self._days = [row.day for row in rows]
+        self._sums = [row.sum for row in rows]
+
+    def through(self, day: date) -> float:
+        """Sum of the last row on or before `day`; 0 before the first row."""
+        i = bisect.bisect_right(self._days, day)
+        return self._sums[i - 1] if i else 0.0
+
+    def change(self, window: Window) -> float:
+        """What the rows added over `window`."""
+        return self.through(window[1]) - self.through(window[0] - timedelta(days=1))
+
+
+async def find_divergent(
+    windows: Sequence[Window],
+    expected: float,
+    recorded: Callable[[Window], float],
+    supplier: Callable[[Window], Awaitable[float]],
+    tolerance: float,
+) -> list[Window]:
+    """Months whose supplier total may differ from what was recorded.
+
+    `expected` is the supplier's total over all of `windows` (contiguous);
+    `supplier` returns it for one month and should cache. A month found
+    through subtraction alone was never fetched: callers should check it
+    against its own reads before repairing it.
+    """
+    span = (windows[0][0], windows[-1][1])
+    if abs(expected - recorded(span)) <= tolerance:
+        return []
+    if len(windows) == 1:
+        return list(windows)
+    mid = len(windows) // 2
+    left = 0.0
+    for window in windows[:mid]:
+        left += await supplier(window)
+    return [
+        *await find_divergent(windows[:mid], left, recorded, supplier, tolerance),
+        *await find_divergent(windows[mid:], expected - left, recorded, supplier, tolerance),
+    ]
+
+
+def resum(existing: Sequence[Row], values: Mapping[date, float]) -> list[Row]:
+    """Rows to write so the days in `values` take those values.
+
+    Sums restart from the last row before the first replaced day; every
+    later row keeps its own increment, so the series stays continuous.
+    Replaced days missing from `existing` are added.
+    """
+    first = min(values)
+    by_day = {row.day: row for row in existing if row.day >= first}
+    before = [row for row in existing if row.day < first]
+    running = before[-1].sum if before else 0.0
+    old_previous = running
+    rows: list[Row] = []
+    for day in sorted(by_day.keys() | values.keys()):
+        row = by_day.get(day)
+        if day in values:
+            state: float | None = values[day]
+            increment = values[day]
+        else:
+            assert row is not None
+            state = row.state
+            increment = row.sum - old_previous
+        if row is not None:
+            old_previous = row.sum
+        running += increment
+        rows.append(Row(day, state, running, row.start if row is not None else None))
+    return rows
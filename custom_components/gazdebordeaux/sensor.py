@@ -4,12 +4,13 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
+from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
 from homeassistant.components.sensor.const import SensorDeviceClass, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfEnergy, UnitOfVolume
+from homeassistant.const import EntityCategory, UnitOfEnergy, UnitOfTime, UnitOfVolume
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -19,6 +20,8 @@ from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
 from .coordinator import GdbCoordinator
+from .dates import PARIS
+from .forecast import Projection
 from .gazdebordeaux import TotalUsageRead
 
 
@@ -30,6 +33,8 @@ class GdbEntityDescription(SensorEntityDescription):  # type: ignore[override]
     """Class describing Gaz de Bordeaux sensor entities."""
 
     value_fn: Callable[[TotalUsageRead], str | float]
+    # Key into the coordinator data (contractType.category).
+    commodity: str = "gas"
 
 
 # suggested_display_precision=0 for all sensors since
@@ -68,6 +73,80 @@ GAS_SENSORS: tuple[GdbEntityDescription, ...] = (
     ),
 )
 
+ELECTRICITY_SENSORS: tuple[GdbEntityDescription, ...] = (
+    GdbEntityDescription(
+        key="electricity_energy_to_date",
+        name="Current electricity usage to date",
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        suggested_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        state_class=SensorStateClass.TOTAL,
+        suggested_display_precision=0,
+        value_fn=lambda data: data.amountOfEnergy,
+        commodity="electricity",
+    ),
+    GdbEntityDescription(
+        key="electricity_cost_to_date",
+        name="Current bill electricity cost to date",
+        device_class=SensorDeviceClass.MONETARY,
+        native_unit_of_measurement="€",
+        state_class=SensorStateClass.TOTAL,
+        suggested_display_precision=0,
+        value_fn=lambda data: data.price,
+        commodity="electricity",
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class GdbForecastEntityDescription(SensorEntityDescription):  # type: ignore[override]
+    """Class describing Gaz de Bordeaux forecast sensor entities."""
+
+    value_fn: Callable[[Projection], float]
+
+
+# Same for every commodity; the device name tells them apart.
+FORECAST_SENSORS: tuple[GdbForecastEntityDescription, ...] = (
+    GdbForecastEntityDescription(
+        key="forecast_month_energy",
+        name="Forecast energy end of month",
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        suggested_display_precision=0,
+        value_fn=lambda projection: projection.month_energy,
+    ),
+    GdbForecastEntityDescription(
+        key="forecast_month_cost",
+        name="Forecast cost end of month",
+        device_class=SensorDeviceClass.MONETARY,
+        native_unit_of_measurement="€",
+        suggested_display_precision=0,
+        value_fn=lambda projection: projection.month_cost,
+    ),
+    GdbForecastEntityDescription(
+        key="forecast_year_energy",
+        name="Forecast energy end of year",
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        suggested_display_precision=0,
+        value_fn=lambda projection: projection.year_energy,
+    ),
+    GdbForecastEntityDescription(
+        key="forecast_year_cost",
+        name="Forecast cost end of year",
+        device_class=SensorDeviceClass.MONETARY,
+        native_unit_of_measurement="€",
+        suggested_display_precision=0,
+        value_fn=lambda projection: projection.year_cost,
+    ),
+)
+
+# Per commodity: (device id, device name, model, sensors).
+COMMODITY_DEVICES: dict[str, tuple[str, str, str, tuple[GdbEntityDescription, ...]]] = {
+    "gas": ("gazpar", "Gaz de Bordeaux", "gazpar", GAS_SENSORS),
+    "electricity": ("linky", "Gaz de Bordeaux électricité", "linky", ELECTRICITY_SENSORS),
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -75,30 +154,38 @@ async def async_setup_entry(
     """Set up the Gdb sensor."""
 
     coordinator: GdbCoordinator = hass.data[DOMAIN][entry.entry_id]
-    entities: list[GdbSensor | GdbLastUpdateSensor] = []
-
-    device_id = "gazpar"
-    device = DeviceInfo(
-        identifiers={(DOMAIN, device_id)},
-        name="Gaz de Bordeaux",
-        manufacturer="Regaz",
-        model="gazpar",
-        entry_type=DeviceEntryType.SERVICE,
-    )
-    sensors: tuple[GdbEntityDescription, ...] = GAS_SENSORS
-    for sensor in sensors:
-        entities.append(
-            GdbSensor(
-                coordinator,
-                sensor,
-                "",
-                device,
-                device_id,
-            )
+    entities: list[SensorEntity] = []
+
+    devices: list[tuple[DeviceInfo, str]] = []
+    for commodity in coordinator.contracts:
+        device_id, device_name, model, sensors = COMMODITY_DEVICES[commodity]
+        device = DeviceInfo(
+            identifiers={(DOMAIN, device_id)},
+            name=device_name,
+            manufacturer="Regaz",
+            model=model,
+            entry_type=DeviceEntryType.SERVICE,
         )
+        devices.append((device, device_id))
+        entities.append(GdbLatestDaySensor(coordinator, device, device_id, commodity))
+        entities.append(GdbDataLagSensor(coordinator, device, device_id, commodity))
+        for forecast in FORECAST_SENSORS:
+            entities.append(GdbForecastSensor(coordinator, forecast, device, device_id, commodity))
+        for sensor in sensors:
+            entities.append(
+                GdbSensor(
+                    coordinator,
+                    sensor,
+                    "",
+                    device,
+                    device_id,
+                )
+            )
 
     # Ajout du sensor de dernière actualisation
+    device, device_id = devices[0]
     entities.append(GdbLastUpdateSensor(coordinator, device, device_id))
+    entities.append(GdbRefreshDurationSensor(coordinator, device, device_id))
 
     async_add_entities(entities)
 
@@ -126,9 +213,21 @@ class GdbSensor(CoordinatorEntity[GdbCoordinator], SensorEntity):
     @property
     def native_value(self) -> StateType:
         """Return the state."""
-        if self.coordinator.data is not None:
-            return self.entity_description.value_fn(self.coordinator.data)
-        return None
+        if self.coordinator.data is None:
+            return None
+        data = self.coordinator.data.get(self.entity_description.commodity)
+        if data is None:
+            return None
+        return self.entity_description.value_fn(data)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Whether the value is the last good one kept during an outage, and its age."""
+        age = self.coordinator.data_age
+        return {
+            "stale": self.coordinator.stale,
+            "data_age_hours": None if age is None else round(age.total_seconds() / 3600, 1),
+        }
 
 
 # Nouveau sensor de dernière actualisation
@@ -157,3 +256,131 @@ class GdbLastUpdateSensor(CoordinatorEntity[GdbCoordinator], SensorEntity):
             return None
         # HA exige un datetime avec timezone pour SensorDeviceClass.TIMESTAMP
         return dt_util.as_local(self.coordinator.last_update)
+
+
+class GdbFreshnessSensor(CoordinatorEntity[GdbCoordinator], SensorEntity):
+    """Diagnostic sensor about the data of one commodity, from coordinator state."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _key: str
+    _label: str
+
+    def __init__(
+        self,
+        coordinator: GdbCoordinator,
+        device: DeviceInfo,
+        device_id: str,
+        commodity: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{device_id}_{self._key}"
+        self._attr_name = f"{device['name']} {self._label}"
+        self._attr_device_info = device
+        self._commodity = commodity
+
+    @property
+    def _latest_day(self) -> date | None:
+        return self.coordinator.latest_day.get(self._commodity)
+
+
+class GdbLatestDaySensor(GdbFreshnessSensor):
+    """Latest consumption day imported into the statistics."""
+
+    _attr_device_class = SensorDeviceClass.DATE
+    _attr_icon = "mdi:calendar-check"
+    _key = "latest_day"
+    _label = "Latest Data Day"
+
+    @property
+    def native_value(self) -> date | None:
+        """Return the latest imported day."""
+        return self._latest_day
+
+
+class GdbDataLagSensor(GdbFreshnessSensor):
+    """Days between today (Paris) and the latest imported day."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.DAYS
+    _attr_icon = "mdi:calendar-clock"
+    _key = "data_lag"
+    _label = "Data Lag"
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the lag in days."""
+        if self._latest_day is None:
+            return None
+        return (datetime.now(PARIS).date() - self._latest_day).days
+
+
+class GdbForecastSensor(CoordinatorEntity[GdbCoordinator], SensorEntity):
+    """Projected total at the end of the month or year, from degree days."""
+
+    entity_description: GdbForecastEntityDescription
+    _attr_icon = "mdi:chart-bell-curve-cumulative"
+
+    def __init__(
+        self,
+        coordinator: GdbCoordinator,
+        description: GdbForecastEntityDescription,
+        device: DeviceInfo,
+        device_id: str,
+        commodity: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{device_id}_{description.key}"
+        self._attr_name = f"{device['name']} {description.name}"
+        self._attr_device_info = device
+        self._commodity = commodity
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the projected total."""
+        model = self.coordinator.forecasts.get(self._commodity)
+        projection = model.projection() if model is not None else None
+        if projection is None:
+            return None
+        return self.entity_description.value_fn(projection)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Fit quality, and the last day the projection starts from."""
+        model = self.coordinator.forecasts.get(self._commodity)
+        if model is None:
+            return {}
+        return {**model.quality(), "as_of": model.last_day}
+
+
+class GdbRefreshDurationSensor(CoordinatorEntity[GdbCoordinator], SensorEntity):
+    """How long the last refresh took, login to statistics."""
+
+    _attr_name = "Gaz de Bordeaux Last Refresh Duration"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_suggested_display_precision = 1
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:timer-outline"
+
+    def __init__(
+        self,
+        coordinator: GdbCoordinator,
+        device: DeviceInfo,
+        device_id: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{device_id}_last_refresh_duration"
+        self._attr_device_info = device
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the duration in seconds."""
+        if self.coordinator.last_refresh_duration is None:
+            return None
+        return self.coordinator.last_refresh_duration.total_seconds()
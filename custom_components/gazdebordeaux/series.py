@@ -0,0 +1,187 @@
+"""In-memory copy of the imported daily series, for dashboard range queries.
+
+Charting cards ask for a field (energy, volume, cost, temperature, ratio) over a
+period, by day, week or month. Answering from the recorder means a
+statistics query over years of rows on every card load; here the same days
+live in memory, keyed by day ordinal. Each bucket size gets a table of its
+pre-aggregated values, built in one pass the first time it is asked for and
+kept until imported days change the series. A query is then two bisections
+and a slice; only a first or last bucket reaching past the queried range is
+aggregated again, from its days within the range.
+"""
+
+from __future__ import annotations
+
+import bisect
+import dataclasses
+import math
+from collections.abc import Iterable, Sequence
+from datetime import date, timedelta
+from typing import Any
+
+FIELDS = ("energy", "volume", "cost", "temperature", "ratio")
+# Averaged over a bucket instead of summed (ratio is the kWh per m³ factor).
+MEAN_FIELDS = frozenset({"temperature", "ratio"})
+BUCKETS = ("day", "week", "month")
+
+# One day: its values in FIELDS order, None where the API had none.
+Values = tuple[float | None, ...]
+
+
+def bucket_start(day: date, bucket: str) -> date:
+    """First day of the bucket holding `day` (weeks start on Monday)."""
+    if bucket == "week":
+        return day - timedelta(days=day.weekday())
+    if bucket == "month":
+        return day.replace(day=1)
+    return day
+
+
+def bucket_end(start: date, bucket: str) -> date:
+    """Last day of the bucket starting on `start`."""
+    if bucket == "week":
+        return start + timedelta(days=6)
+    if bucket == "month":
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+    return start
+
+
+@dataclasses.dataclass(frozen=True)
+class BucketTable:
+    """Aggregated values per bucket, buckets sorted by start ordinal."""
+
+    starts: list[int]
+    values: dict[str, list[float | None]]
+
+    def query(self, start: date | None, end: date | None, bucket: str) -> slice:
+        lo = (
+            0
+            if start is None
+            else bisect.bisect_left(self.starts, bucket_start(start, bucket).toordinal())
+        )
+        hi = len(self.starts) if end is None else bisect.bisect_right(self.starts, end.toordinal())
+        return slice(lo, hi)
+
+
+def _aggregate(field: str, values: list[float]) -> float | None:
+    if not values:
+        return None
+    total = math.fsum(values)
+    return round(total / len(values) if field in MEAN_FIELDS else total, 3)
+
+
+class DailySeries:
+    """Daily values of one contract, with cached per-bucket aggregates."""
+
+    def __init__(self) -> None:
+        self._rows: dict[int, Values] = {}
+        self._ordinals: list[int] = []
+        self._tables: dict[str, BucketTable] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def items(self) -> list[tuple[date, Values]]:
+        """Every day with its values, in day order (a copy)."""
+        return [(date.fromordinal(ordinal), self._rows[ordinal]) for ordinal in self._ordinals]
+
+    def get(self, day: date) -> Values | None:
+        """Values of one day, None if it wasn't imported."""
+        return self._rows.get(day.toordinal())
+
+    def upsert(self, rows: Iterable[tuple[date, Values]]) -> int:
+        """Add or replace days; return how many changed. Cached tables drop on change."""
+        changed = 0
+        for day, values in rows:
+            ordinal = day.toordinal()
+            if self._rows.get(ordinal) != values:
+                self._rows[ordinal] = values
+                changed += 1
+        if changed:
+            self._ordinals = sorted(self._rows)
+            self._tables.clear()
+        return changed
+
+    def table(self, bucket: str) -> BucketTable:
+        """The bucket table, built on first use after a change."""
+        table = self._tables.get(bucket)
+        if table is None:
+            table = self._tables[bucket] = self._build(bucket)
+        return table
+
+    def _build(self, bucket: str) -> BucketTable:
+        starts: list[int] = []
+        columns: list[list[list[float]]] = [[] for _ in FIELDS]
+        for ordinal in self._ordinals:
+            start = bucket_start(date.fromordinal(ordinal), bucket).toordinal()
+            if not starts or starts[-1] != start:
+                starts.append(start)
+                for column in columns:
+                    column.append([])
+            for column, value in zip(columns, self._rows[ordinal], strict=True):
+                if value is not None:
+                    column[-1].append(value)
+        return BucketTable(
+            starts=starts,
+            values={
+                field: [_aggregate(field, values) for values in column]
+                for field, column in zip(FIELDS, columns, strict=True)
+            },
+        )
+
+    def _aggregate_days(self, first: date, last: date, fields: Sequence[str]) -> dict[str, Any]:
+        """Values of `fields` aggregated over the days from `first` to `last`."""
+        ordinals = self._ordinals[
+            bisect.bisect_left(self._ordinals, first.toordinal()) : bisect.bisect_right(
+                self._ordinals, last.toordinal()
+            )
+        ]
+        aggregates = {}
+        for field in fields:
+            index = FIELDS.index(field)
+            values = [self._rows[o][index] for o in ordinals]
+            aggregates[field] = _aggregate(field, [v for v in values if v is not None])
+        return aggregates
+
+    def query(
+        self,
+        bucket: str,
+        fields: Sequence[str],
+        start: date | None = None,
+        end: date | None = None,
+    ) -> dict[str, list[Any]]:
+        """Columns of `fields` per bucket between `start` and `end`, with each bucket's start.
+
+        The first and last buckets only cover their days between `start` and
+        `end`; they keep the bucket's first day as their start.
+        """
+        table = self.table(bucket)
+        window = table.query(start, end, bucket)
+        starts = [date.fromordinal(o) for o in table.starts[window]]
+        result: dict[str, list[Any]] = {"start": [day.isoformat() for day in starts]}
+        for field in fields:
+            result[field] = table.values[field][window]
+        for i in {0, len(starts) - 1} if starts else ():
+            first, last = starts[i], bucket_end(starts[i], bucket)
+            clipped = (max(first, start or first), min(last, end or last))
+            if clipped != (first, last):
+                for field, value in self._aggregate_days(*clipped, fields).items():
+                    result[field][i] = value
+        return result
+
+    def as_dict(self) -> dict[str, list[Any]]:
+        """Columnar JSON-serializable copy, for a Store."""
+        data: dict[str, list[Any]] = {"days": list(self._ordinals)}
+        for i, field in enumerate(FIELDS):
+            data[field] = [self._rows[ordinal][i] for ordinal in self._ordinals]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, list[Any]]) -> DailySeries:
+        series = cls()
+        columns = [data.get(field) or [None] * len(data["days"]) for field in FIELDS]
+        series.upsert(
+            (date.fromordinal(ordinal), tuple(column[i] for column in columns))
+            for i, ordinal in enumerate(data["days"])
+        )
+        return series
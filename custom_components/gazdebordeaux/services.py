@@ -0,0 +1,185 @@
+"""Services for the Gaz de Bordeaux integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_END,
+    ATTR_FORMAT,
+    ATTR_START,
+    ATTR_TOP,
+    CATEGORY,
+    DOMAIN,
+    HOUSE,
+    SERVICE_EXPORT,
+    SERVICE_IMPORT_RANGE,
+    SERVICE_PROFILE_REFRESH,
+    SUPPORTED_CATEGORIES,
+)
+from .export import FORMATS, ExportError, export, export_name
+from .policy import GdbError
+from .profiling import PhaseTimer, async_profile
+
+if TYPE_CHECKING:
+    from .coordinator import GdbCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _start_not_after_end(data: dict[str, Any]) -> dict[str, Any]:
+    if ATTR_START in data and ATTR_END in data and data[ATTR_START] > data[ATTR_END]:
+        raise vol.Invalid("start must not be after end")
+    return data
+
+
+IMPORT_RANGE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_START): cv.date,
+            vol.Required(ATTR_END): cv.date,
+            vol.Optional(HOUSE): cv.string,
+        }
+    ),
+    _start_not_after_end,
+)
+
+PROFILE_REFRESH_SCHEMA = vol.Schema(
+    {vol.Optional(ATTR_TOP, default=25): vol.All(vol.Coerce(int), vol.Range(min=1, max=500))}
+)
+
+EXPORT_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_FORMAT, default="csv"): vol.In(FORMATS),
+            vol.Optional(CATEGORY, default="gas"): vol.In(SUPPORTED_CATEGORIES),
+            vol.Optional(ATTR_START): cv.date,
+            vol.Optional(ATTR_END): cv.date,
+        }
+    ),
+    _start_not_after_end,
+)
+
+
+def _coordinators(hass: HomeAssistant) -> list[GdbCoordinator]:
+    coordinators = list(hass.data.get(DOMAIN, {}).values())
+    if not coordinators:
+        raise ServiceValidationError("Gaz de Bordeaux is not set up")
+    return coordinators
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+
+    async def _async_import_range(call: ServiceCall) -> None:
+        house = call.data.get(HOUSE)
+        coordinators = [
+            coordinator
+            for coordinator in _coordinators(hass)
+            if house is None or any(c.house == house for c in coordinator.contracts.values())
+        ]
+        if not coordinators:
+            raise ServiceValidationError(f"No contract found for house {house}")
+        _LOGGER.debug(
+            "Importing %s to %s (house=%s)", call.data[ATTR_START], call.data[ATTR_END], house
+        )
+        try:
+            for coordinator in coordinators:
+                await coordinator.async_import_range(
+                    call.data[ATTR_START], call.data[ATTR_END], house
+                )
+        except GdbError as err:
+            raise HomeAssistantError(f"Import failed: {err}") from err
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_IMPORT_RANGE, _async_import_range, schema=IMPORT_RANGE_SCHEMA
+    )
+
+    profiling = asyncio.Lock()
+
+    async def _async_profile_refresh(call: ServiceCall) -> ServiceResponse:
+        coordinators = _coordinators(hass)
+        if profiling.locked():
+            raise ServiceValidationError("A refresh is already being profiled")
+
+        def run(timer: PhaseTimer) -> asyncio.Future[list[None]]:
+            return asyncio.gather(
+                *(coordinator.async_profile_refresh(timer) for coordinator in coordinators)
+            )
+
+        async with profiling:
+            try:
+                result = await async_profile(run, call.data[ATTR_TOP])
+            except ValueError as err:  # another profiler is active
+                raise HomeAssistantError(f"Profiling failed: {err}") from err
+            stem = f"{DOMAIN}_profile_{dt_util.now().strftime('%Y%m%d_%H%M%S')}"
+            profile_path, summary_path = await hass.async_add_executor_job(
+                result.write, hass.config.path(), stem
+            )
+        _LOGGER.info("Refresh profile written to %s and %s", profile_path, summary_path)
+        return {
+            "profile": str(profile_path),
+            "summary": str(summary_path),
+            "duration": round(result.wall, 3),
+            "phases": {name: round(total, 3) for name, total in result.timer.totals.items()},
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE_REFRESH,
+        _async_profile_refresh,
+        schema=PROFILE_REFRESH_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    exporting = asyncio.Lock()
+
+    async def _async_export(call: ServiceCall) -> ServiceResponse:
+        category = call.data[CATEGORY]
+        series = next(
+            (c.series[category] for c in _coordinators(hass) if category in c.series), None
+        )
+        if series is None:
+            raise ServiceValidationError(f"No {category} series imported")
+        fmt = call.data[ATTR_FORMAT]
+        path = Path(hass.config.path(export_name(category, fmt)))
+        # Taken on the event loop: refreshes keep updating the series meanwhile.
+        days = series.items()
+        async with exporting:
+            try:
+                result = await hass.async_add_executor_job(
+                    export, path, fmt, days, call.data.get(ATTR_START), call.data.get(ATTR_END)
+                )
+            except ExportError as err:
+                raise HomeAssistantError(f"Export failed: {err}") from err
+        _LOGGER.info("Exported %d %s days to %s", result.rows, category, result.path)
+        return {
+            "path": str(result.path),
+            "rows": result.rows,
+            "first": result.first.isoformat() if result.first else None,
+            "last": result.last.isoformat() if result.last else None,
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT,
+        _async_export,
+        schema=EXPORT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
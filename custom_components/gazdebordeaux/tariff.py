@@ -0,0 +1,149 @@
+"""Local tariff model used to price daily reads the supplier hasn't priced yet.
+
+The consumption endpoint sometimes returns the kWh for a day before its
+`price` (null, or 0 for a day that used energy). Rather than leaving a hole
+in the cost statistic, we price those days locally (0 without a tariff) and
+flag them as estimated; the coordinator then re-fetches them on the next
+refreshes so the supplier's figure replaces ours. A day without
+consumption priced 0 is a real 0, not a missing price.
+
+The tariff set in the options flow applies from its start date; the periods
+it replaced stay in force before it, so a rate change doesn't reprice the
+days before it.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import date, datetime
+from typing import Any, Protocol
+
+from .const import TARIFF_KWH_PRICE, TARIFF_PERIODS, TARIFF_START, TARIFF_SUBSCRIPTION
+
+DAYS_PER_YEAR = 365
+
+
+class _PricedRead(Protocol):
+    date: datetime
+    amountOfEnergy: float  # noqa: N815 - mirrors DailyUsageRead
+    price: float
+    estimated: bool
+    priced: bool
+
+
+def price_missing(read: _PricedRead) -> bool:
+    """Whether the supplier has not priced `read`: no price, or 0 for a day that used energy."""
+    if read.price is None or not read.priced:
+        return True
+    return not read.price and read.amountOfEnergy > 0
+
+
+# ----------------------------------------------------------------------------
+@dataclasses.dataclass(frozen=True)
+class TariffPeriod:
+    """Rates in force from `start` (inclusive) until the next period starts."""
+
+    start: date
+    kwh_price: float
+    subscription_per_day: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """JSON-serializable copy, for the config entry."""
+        return {**dataclasses.asdict(self), "start": self.start.isoformat()}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> TariffPeriod:
+        return cls(**{**data, "start": date.fromisoformat(data["start"])})
+
+
+# ----------------------------------------------------------------------------
+class Tariff:
+    """A piecewise-constant tariff: subscription plus per-kWh rate by date."""
+
+    def __init__(self, periods: Iterable[TariffPeriod] = ()) -> None:
+        self._periods = sorted(periods, key=lambda p: p.start)
+        self._starts = [p.start for p in self._periods]
+
+    @classmethod
+    def flat(
+        cls,
+        kwh_price: float | None,
+        yearly_subscription: float | None,
+        start: date | None = None,
+        earlier: Iterable[TariffPeriod] = (),
+    ) -> Tariff:
+        """Build the tariff of the options flow values, in force from `start` (always if None).
+
+        The `earlier` periods it replaced apply before `start`.
+        """
+        if not kwh_price:
+            return cls()
+        current = TariffPeriod(
+            start=start or date.min,
+            kwh_price=kwh_price,
+            subscription_per_day=(yearly_subscription or 0.0) / DAYS_PER_YEAR,
+        )
+        return cls([*(p for p in earlier if p.start < current.start), current])
+
+    @classmethod
+    def from_entry(cls, data: Mapping[str, Any]) -> Tariff:
+        """The tariff stored in config entry data by the options flow."""
+        start = data.get(TARIFF_START)
+        return cls.flat(
+            data.get(TARIFF_KWH_PRICE),
+            data.get(TARIFF_SUBSCRIPTION),
+            date.fromisoformat(start) if start else None,
+            (TariffPeriod.from_dict(period) for period in data.get(TARIFF_PERIODS) or ()),
+        )
+
+    def periods_before(self, start: date | None) -> list[TariffPeriod]:
+        """Periods starting before `start`, kept when a tariff replaces this one from then on."""
+        if start is None:
+            return []
+        return [p for p in self._periods if p.start < start]
+
+    def __bool__(self) -> bool:
+        return bool(self._periods)
+
+    def period_for(self, day: date) -> TariffPeriod | None:
+        """Return the period in force on `day`, or None if it predates all periods."""
+        idx = bisect_right(self._starts, day) - 1
+        return self._periods[idx] if idx >= 0 else None
+
+    def cost(self, day: date, kwh: float) -> float | None:
+        period = self.period_for(day)
+        if period is None:
+            return None
+        return period.subscription_per_day + kwh * period.kwh_price
+
+    def apply(self, reads: Sequence[_PricedRead]) -> int:
+        """Fill in missing prices on `reads` in place and return how many were flagged.
+
+        A read is missing its price as decided by `price_missing`. Such reads
+        are always flagged `estimated`; they are priced from the tariff when a
+        period covers their day, otherwise their price is set to 0.
+
+        The reads are walked once in date order alongside the sorted periods,
+        so a batch of N days against P periods costs O(N log N + P) instead of
+        a lookup per day.
+        """
+        flagged = 0
+        order = sorted(range(len(reads)), key=lambda i: reads[i].date)
+        idx = -1
+        for i in order:
+            read = reads[i]
+            day = read.date.date()
+            while idx + 1 < len(self._starts) and self._starts[idx + 1] <= day:
+                idx += 1
+            if not price_missing(read):
+                continue
+            flagged += 1
+            read.estimated = True
+            if idx < 0:
+                read.price = 0.0
+                continue
+            period = self._periods[idx]
+            read.price = period.subscription_per_day + read.amountOfEnergy * period.kwh_price
+        return flagged
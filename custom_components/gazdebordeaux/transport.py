@@ -0,0 +1,278 @@
+"""HTTP transports for the API client: live, recording and replay.
+
+The client only needs a status, a few headers and the body text of each
+response, so that is what a transport returns. RecordingTransport keeps the
+last N exchanges in a bounded ring, already redacted, and exports them as a
+HAR 1.2 log (the format browsers' dev tools save). ReplayTransport serves
+such a log back, which turns captured production payloads into fixtures for
+tests and benchmarks without a live account.
+"""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import json
+import time
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Protocol
+
+from aiohttp import ClientConnectionError, ClientSession, ClientTimeout
+
+REDACTED = "**REDACTED**"
+# Request/response headers and JSON keys (at any depth) never kept in a recording.
+REDACT_HEADERS = frozenset({"authorization", "cookie", "set-cookie"})
+REDACT_KEYS = frozenset(
+    {
+        # Credentials.
+        "username",
+        "password",
+        "token",
+        "refresh_token",
+        # The customer: contact details, name, and the contract's address.
+        "email",
+        "phone",
+        "mobile",
+        "firstName",
+        "lastName",
+        "name",
+        "fullName",
+        "address",
+        "streetNumber",
+        "street",
+        "zipCode",
+        "city",
+    }
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class RawResponse:
+    """What the client reads from a response."""
+
+    status: int
+    body: str
+    content_type: str | None = None
+    retry_after: str | None = None
+
+
+class Transport(Protocol):
+    """Sends one request; raises TimeoutError/aiohttp errors like a session would."""
+
+    async def send(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str],
+        request_timeout: ClientTimeout,
+        params: Mapping[str, str] | None = None,
+        json: Any = None,
+    ) -> RawResponse: ...
+
+
+# ----------------------------------------------------------------------------
+class SessionTransport:
+    """Sends requests through an aiohttp session."""
+
+    def __init__(self, session: ClientSession) -> None:
+        self._session = session
+
+    async def send(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str],
+        request_timeout: ClientTimeout,
+        params: Mapping[str, str] | None = None,
+        json: Any = None,
+    ) -> RawResponse:
+        kwargs: dict[str, Any] = {}
+        if params is not None:
+            kwargs["params"] = params
+        if json is not None:
+            kwargs["json"] = json
+        async with self._session.request(
+            method, url, headers=headers, timeout=request_timeout, **kwargs
+        ) as response:
+            return RawResponse(
+                status=response.status,
+                body=await response.text(),
+                content_type=response.headers.get("Content-Type"),
+                retry_after=response.headers.get("Retry-After"),
+            )
+
+
+# ----------------------------------------------------------------------------
+def redact(value: Any) -> Any:
+    """Copy of a decoded JSON value with REDACT_KEYS masked at any depth."""
+    if isinstance(value, dict):
+        return {k: REDACTED if k in REDACT_KEYS else redact(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [redact(v) for v in value]
+    return value
+
+
+def _dumps(value: Any) -> str:
+    # For methods whose `json` argument shadows the module.
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _redact_body(body: str) -> str:
+    try:
+        return _dumps(redact(json.loads(body)))
+    except ValueError:
+        return body
+
+
+def _har_headers(headers: Mapping[str, str]) -> list[dict[str, str]]:
+    return [
+        {"name": name, "value": REDACTED if name.lower() in REDACT_HEADERS else value}
+        for name, value in headers.items()
+    ]
+
+
+class RecordingTransport:
+    """Wraps a transport and keeps the last `size` exchanges, redacted, as HAR entries."""
+
+    def __init__(self, inner: Transport, size: int = 20) -> None:
+        self._inner = inner
+        self._entries: collections.deque[dict[str, Any]] = collections.deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def send(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str],
+        request_timeout: ClientTimeout,
+        params: Mapping[str, str] | None = None,
+        json: Any = None,
+    ) -> RawResponse:
+        started = datetime.now(UTC)
+        t0 = time.perf_counter()
+        request: dict[str, Any] = {
+            "method": method,
+            "url": url,
+            "httpVersion": "HTTP/1.1",
+            "headers": _har_headers(headers),
+            "queryString": [{"name": k, "value": v} for k, v in (params or {}).items()],
+        }
+        if json is not None:
+            request["postData"] = {
+                "mimeType": "application/json",
+                "text": _dumps(redact(json)),
+            }
+        try:
+            response = await self._inner.send(
+                method,
+                url,
+                headers=headers,
+                request_timeout=request_timeout,
+                params=params,
+                json=json,
+            )
+        except Exception as err:
+            # HAR's convention for a request that got no response.
+            self._append(started, t0, request, RawResponse(0, "", None), repr(err))
+            raise
+        self._append(started, t0, request, response, "")
+        return response
+
+    def _append(
+        self,
+        started: datetime,
+        t0: float,
+        request: dict[str, Any],
+        response: RawResponse,
+        status_text: str,
+    ) -> None:
+        headers = {
+            "Content-Type": response.content_type,
+            "Retry-After": response.retry_after,
+        }
+        self._entries.append(
+            {
+                "startedDateTime": started.isoformat(),
+                "time": round((time.perf_counter() - t0) * 1000, 1),
+                "request": request,
+                "response": {
+                    "status": response.status,
+                    "statusText": status_text,
+                    "httpVersion": "HTTP/1.1",
+                    "headers": [{"name": k, "value": v} for k, v in headers.items() if v],
+                    "content": {
+                        "size": len(response.body),
+                        "mimeType": response.content_type or "",
+                        "text": _redact_body(response.body),
+                    },
+                },
+            }
+        )
+
+    def to_har(self) -> dict[str, Any]:
+        """The recorded exchanges, oldest first, as a HAR 1.2 log."""
+        return {
+            "log": {
+                "version": "1.2",
+                "creator": {"name": "gazdebordeaux", "version": "1"},
+                "entries": list(self._entries),
+            }
+        }
+
+
+# ----------------------------------------------------------------------------
+def _replay_key(method: str, url: str, params: Mapping[str, str] | None) -> tuple:
+    return method.upper(), url, tuple(sorted((params or {}).items()))
+
+
+class ReplayTransport:
+    """Serves the responses of a HAR log instead of reaching the network.
+
+    Requests are matched on method, URL and query parameters; matching
+    entries are served in recorded order and the last one is repeated once
+    they run out. Status 0 entries raise ClientConnectionError, as the
+    recorded request did.
+    """
+
+    def __init__(self, har: Mapping[str, Any]) -> None:
+        self._responses: dict[tuple, collections.deque[dict[str, Any]]] = {}
+        for entry in har["log"]["entries"]:
+            request = entry["request"]
+            params = {q["name"]: q["value"] for q in request.get("queryString", [])}
+            key = _replay_key(request["method"], request["url"], params)
+            self._responses.setdefault(key, collections.deque()).append(entry["response"])
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> ReplayTransport:
+        return cls(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    async def send(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str],
+        request_timeout: ClientTimeout,
+        params: Mapping[str, str] | None = None,
+        json: Any = None,
+    ) -> RawResponse:
+        queue = self._responses.get(_replay_key(method, url, params))
+        if not queue:
+            raise LookupError(f"No recorded response for {method} {url} {dict(params or {})}")
+        response = queue.popleft() if len(queue) > 1 else queue[0]
+        if response["status"] == 0:
+            raise ClientConnectionError(response.get("statusText") or "recorded failure")
+        headers_out = {h["name"].lower(): h["value"] for h in response.get("headers", [])}
+        return RawResponse(
+            status=response["status"],
+            body=response["content"].get("text", ""),
+            content_type=headers_out.get("content-type") or response["content"].get("mimeType"),
+            retry_after=headers_out.get("retry-after"),
+        )
@@ -0,0 +1,65 @@
+"""Websocket API answering range queries from the in-memory daily series."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+
+from .const import DOMAIN, SUPPORTED_CATEGORIES
+from .series import BUCKETS, FIELDS
+
+if TYPE_CHECKING:
+    from .coordinator import GdbCoordinator
+
+
+@callback
+def async_setup_websocket(hass: HomeAssistant) -> None:
+    """Register the integration's websocket commands."""
+    websocket_api.async_register_command(hass, ws_series)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/series",
+        vol.Optional("category", default="gas"): vol.In(SUPPORTED_CATEGORIES),
+        vol.Optional("fields", default=["energy"]): vol.All(
+            cv.ensure_list, vol.Length(min=1), [vol.In(FIELDS)]
+        ),
+        vol.Optional("bucket", default="day"): vol.In(BUCKETS),
+        vol.Optional("start"): cv.date,
+        vol.Optional("end"): cv.date,
+        vol.Optional("entry_id"): cv.string,
+    }
+)
+@callback
+def ws_series(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Aggregated daily values of one contract, by day, week or month.
+
+    The result is columnar: `start` holds each bucket's first day, and each
+    requested field its sum (its mean for temperature) over the bucket.
+    The first and last buckets only count their days between start and end.
+    """
+    coordinators: dict[str, GdbCoordinator] = hass.data.get(DOMAIN, {})
+    if "entry_id" in msg:
+        coordinator = coordinators.get(msg["entry_id"])
+        candidates = [coordinator] if coordinator is not None else []
+    else:
+        candidates = list(coordinators.values())
+    series = next(
+        (c.series[msg["category"]] for c in candidates if msg["category"] in c.series), None
+    )
+    if series is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"No {msg['category']} series imported"
+        )
+        return
+    connection.send_result(
+        msg["id"],
+        series.query(msg["bucket"], msg["fields"], msg.get("start"), msg.get("end")),
+    )
@@ -1,7 +1,9 @@
 """Shared pytest fixtures for the gazdebordeaux integration tests.
 
-The pure-Python API client tests at this level don't need Home Assistant.
-Tests that *do* need HA fixtures live under `tests/integration/` and pull
+The pure-Python tests at this level use no Home Assistant fixtures. They
+import the modules from the `custom_components.gazdebordeaux` package, found
+from the repository root that the root conftest puts on `sys.path`. Tests
+that *do* need HA fixtures live under `tests/integration/` and pull
 in `pytest_homeassistant_custom_component` via that subdirectory's
 conftest.
 """
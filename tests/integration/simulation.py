@@ -0,0 +1,304 @@
+"""Simulated clock, site and recorder to replay months of coordinator refreshes.
+
+`Simulation` drives a real GdbCoordinator:
+- A virtual clock stands in for the coordinator's `datetime.now()`.
+- `SimulatedSite` serves the login, user, house and consumption endpoints
+  through the client's transport. Each day is published two days later,
+  and revisions, late days, unpriced days, days without consumption and
+  outages are scheduled on the virtual clock.
+- `FakeRecorder` keeps the external statistics in memory in place of the
+  recorder's statistics API.
+
+After every refresh the clock moves on by the coordinator's own
+`update_interval`, as its scheduler would. A year of 12-hour polls then
+runs in seconds.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import dataclasses
+import json
+import math
+import time as walltime
+from collections.abc import Iterator, Mapping
+from datetime import date, datetime, time, timedelta
+from types import MappingProxyType
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from custom_components.gazdebordeaux.const import TARIFF_KWH_PRICE
+from custom_components.gazdebordeaux.coordinator import GdbCoordinator
+from custom_components.gazdebordeaux.dates import PARIS
+from custom_components.gazdebordeaux.gazdebordeaux import LOGIN_URL, ME_URL, data_url
+from custom_components.gazdebordeaux.policy import NO_RETRY
+from custom_components.gazdebordeaux.transport import RawResponse
+
+HOUSE = "/api/houses/simulated"
+HOUSE_URL = "https://life.gazdebordeaux.fr" + HOUSE
+DATA_URL = data_url(HOUSE)
+# A day is published this long after its local midnight.
+PUBLICATION_DELAY = timedelta(days=2, hours=6)
+RATIO = 11.2
+KWH_PRICE = 0.12
+COORDINATOR = "custom_components.gazdebordeaux.coordinator"
+
+
+def temperature(day: date) -> float:
+    """Mean temperature of a day: a yearly cosine, coldest mid-January."""
+    return round(12.0 - 9.0 * math.cos(2 * math.pi * (day.timetuple().tm_yday - 15) / 365), 1)
+
+
+def base_kwh(day: date) -> float:
+    """Consumption of a day: a base load plus heating below 18 °C."""
+    return round(20.0 + 3.0 * max(0.0, 18.0 - temperature(day)), 1)
+
+
+@dataclasses.dataclass
+class SimulatedSite:
+    """Stand-in for life.gazdebordeaux.fr whose data evolves with `now`."""
+
+    now: datetime
+    first_day: date
+    # Day -> (from when, kWh added): corrections of already published days.
+    revisions: dict[date, tuple[datetime, float]] = dataclasses.field(default_factory=dict)
+    # Day -> when it is published, for days the site publishes late.
+    late: dict[date, datetime] = dataclasses.field(default_factory=dict)
+    # Day -> from when it is priced; before, its price is null.
+    unpriced: dict[date, datetime] = dataclasses.field(default_factory=dict)
+    # Days without consumption (nobody home, heating off), priced 0.
+    idle: set[date] = dataclasses.field(default_factory=set)
+    # (start, end) spans where every request fails with a 503.
+    outages: list[tuple[datetime, datetime]] = dataclasses.field(default_factory=list)
+    requests: collections.Counter[str] = dataclasses.field(default_factory=collections.Counter)
+    # startDate of every daily request, in order.
+    daily_starts: list[date] = dataclasses.field(default_factory=list)
+
+    def published(self, day: date) -> bool:
+        since = self.late.get(day, datetime.combine(day, time.min) + PUBLICATION_DELAY)
+        return self.first_day <= day and since <= self.now
+
+    def kwh(self, day: date) -> float:
+        if day in self.idle:
+            return 0.0
+        kwh = base_kwh(day)
+        revision = self.revisions.get(day)
+        if revision is not None and revision[0] <= self.now:
+            kwh += revision[1]
+        return round(kwh, 1)
+
+    def price(self, day: date) -> float | None:
+        priced = self.unpriced.get(day)
+        if priced is not None and self.now < priced:
+            return None
+        return round(self.kwh(day) * KWH_PRICE, 2)
+
+    def last_published(self) -> date:
+        day = self.now.date()
+        while not self.published(day):
+            day -= timedelta(days=1)
+        return day
+
+    def _row(self, day: date) -> dict[str, Any]:
+        return {
+            "kwh": self.kwh(day),
+            "volumeOfEnergy": round(self.kwh(day) / RATIO, 2),
+            "price": self.price(day),
+            "ratio": RATIO,
+            "temperature": temperature(day),
+        }
+
+    def _days(self, start: date, end: date) -> dict[str, Any]:
+        days: dict[str, Any] = {}
+        day = max(start, self.first_day)
+        while day <= end:
+            if self.published(day):
+                days[day.isoformat()] = self._row(day)
+            day += timedelta(days=1)
+        return days
+
+    def _year_total(self) -> dict[str, Any]:
+        days = self._days(date(self.now.year, 1, 1), self.now.date()).values()
+        return {
+            "total": {
+                "kwh": round(sum(row["kwh"] for row in days), 1),
+                "volumeOfEnergy": round(sum(row["volumeOfEnergy"] for row in days), 2),
+                "price": round(sum(row["price"] or 0.0 for row in days), 2),
+            }
+        }
+
+    def _respond(self, url: str, params: Mapping[str, str]) -> tuple[str, Any]:
+        if url == LOGIN_URL:
+            return "login", {"token": "simulated-token"}
+        if url == ME_URL:
+            return "user", {"selectedHouse": None, "houses": [HOUSE]}
+        if url == HOUSE_URL:
+            return "house", {"contractType": {"category": "gas"}, "address": "1 rue du Test"}
+        if url == DATA_URL and params.get("scale") == "year":
+            return "total", self._year_total()
+        if url == DATA_URL:
+            start = date.fromisoformat(params.get("startDate", self.now.date().isoformat()))
+            end = date.fromisoformat(params.get("endDate", self.now.date().isoformat()))
+            self.daily_starts.append(start)
+            return "daily", self._days(start, end)
+        raise LookupError(f"No simulated endpoint for {url}")
+
+    async def send(
+        self, method: str, url: str, *, params: Mapping[str, str] | None = None, **kwargs: Any
+    ) -> RawResponse:
+        kind, payload = self._respond(url, params or {})
+        self.requests[kind] += 1
+        if any(start <= self.now < end for start, end in self.outages):
+            self.requests["failed"] += 1
+            return RawResponse(503, "<html>Service Unavailable</html>", "text/html")
+        return RawResponse(200, json.dumps(payload), "application/json")
+
+
+class FakeRecorder:
+    """External statistics kept in memory, behind the recorder functions the coordinator uses."""
+
+    def __init__(self) -> None:
+        self.rows: dict[str, dict[float, dict[str, Any]]] = collections.defaultdict(dict)
+
+    def add(self, hass: HomeAssistant, metadata: Mapping[str, Any], statistics: list) -> None:
+        for row in statistics:
+            start = row["start"]
+            # What async_add_external_statistics validates.
+            assert start.tzinfo is not None and (start.minute, start.second) == (0, 0), start
+            self.rows[metadata["statistic_id"]][start.timestamp()] = {
+                "start": start.timestamp(),
+                "state": row.get("state"),
+                "sum": row.get("sum"),
+            }
+
+    def series(self, statistic_id: str) -> list[dict[str, Any]]:
+        rows = self.rows.get(statistic_id, {})
+        return [rows[start] for start in sorted(rows)]
+
+    def last(self, hass: HomeAssistant, number: int, statistic_id: str, *args: Any) -> dict:
+        rows = self.series(statistic_id)
+        return {statistic_id: rows[-number:]} if rows else {}
+
+    def during(
+        self,
+        hass: HomeAssistant,
+        start: datetime,
+        end: datetime | None,
+        statistic_ids: set[str],
+        *args: Any,
+    ) -> dict[str, list[dict[str, Any]]]:
+        result = {}
+        for statistic_id in statistic_ids:
+            rows = [
+                row
+                for row in self.series(statistic_id)
+                if start.timestamp() <= row["start"]
+                and (end is None or row["start"] < end.timestamp())
+            ]
+            if rows:
+                result[statistic_id] = rows
+        return result
+
+    async def async_add_executor_job(self, target: Any, *args: Any) -> Any:
+        return target(*args)
+
+    async def async_block_till_done(self) -> None:
+        """Rows are stored as soon as they are added."""
+
+
+@dataclasses.dataclass
+class Refresh:
+    """One simulated refresh."""
+
+    at: datetime
+    requests: collections.Counter[str]
+    # Earliest day requested from the daily endpoint, if it was called.
+    fetched_from: date | None
+    seconds: float
+    stale: bool
+    next_in: timedelta
+
+
+class Simulation:
+    """A coordinator polling a SimulatedSite on a virtual clock."""
+
+    def __init__(self, hass: HomeAssistant, site: SimulatedSite) -> None:
+        self.site = site
+        self.recorder = FakeRecorder()
+        self.refreshes: list[Refresh] = []
+        # Real time spent in async_run.
+        self.wall_seconds = 0.0
+        self.coordinator = GdbCoordinator(
+            hass,
+            MappingProxyType(
+                {
+                    CONF_USERNAME: "sim@example.com",
+                    CONF_PASSWORD: "secret",
+                    # Prices the unpriced days until the site does.
+                    TARIFF_KWH_PRICE: KWH_PRICE,
+                }
+            ),
+        )
+        # Failures are retried by the coordinator's schedule, not by sleeping.
+        self.coordinator.api._retry = NO_RETRY
+        self.coordinator.api._transport = site
+
+    @contextlib.contextmanager
+    def _patched(self) -> Iterator[None]:
+        site = self.site
+
+        class VirtualDatetime(datetime):
+            @classmethod
+            def now(cls, tz: Any = None) -> datetime:  # type: ignore[override]
+                if tz is None:
+                    return site.now
+                return site.now.replace(tzinfo=PARIS).astimezone(tz)
+
+            @classmethod
+            def today(cls) -> datetime:  # type: ignore[override]
+                return site.now
+
+        with (
+            patch(f"{COORDINATOR}.datetime", VirtualDatetime),
+            patch(f"{COORDINATOR}.get_instance", return_value=self.recorder),
+            patch(f"{COORDINATOR}.get_last_statistics", self.recorder.last),
+            patch(f"{COORDINATOR}.statistics_during_period", self.recorder.during),
+            patch(f"{COORDINATOR}.async_add_external_statistics", self.recorder.add),
+        ):
+            yield
+
+    async def async_run(self, until: datetime) -> None:
+        """Refresh, then wait the coordinator's update interval, until `until`."""
+        started = walltime.perf_counter()
+        with self._patched():
+            while self.site.now < until:
+                before = self.site.requests.copy()
+                starts = len(self.site.daily_starts)
+                t0 = walltime.perf_counter()
+                await self.coordinator.async_refresh()
+                seconds = walltime.perf_counter() - t0
+                interval = self.coordinator.update_interval
+                assert interval is not None
+                self.refreshes.append(
+                    Refresh(
+                        at=self.site.now,
+                        requests=self.site.requests - before,
+                        fetched_from=min(self.site.daily_starts[starts:], default=None),
+                        seconds=seconds,
+                        stale=self.coordinator.stale,
+                        next_in=interval,
+                    )
+                )
+                self.site.now += interval
+        self.wall_seconds += walltime.perf_counter() - started
+
+    def days(self, statistic_id: str) -> list[tuple[date, float, float]]:
+        """(local day, state, sum) of every recorded row of `statistic_id`."""
+        return [
+            (datetime.fromtimestamp(row["start"], PARIS).date(), row["state"], row["sum"])
+            for row in self.recorder.series(statistic_id)
+        ]
@@ -9,10 +9,27 @@ from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 
-from custom_components.gazdebordeaux.const import DOMAIN
+from custom_components.gazdebordeaux.const import CATEGORY, DISCOVERY, DOMAIN, HOUSE
+from custom_components.gazdebordeaux.gazdebordeaux import Contract
 
 USERNAME = "user@example.com"
 PASSWORD = "secret"
+GAS = Contract("/api/houses/gas", "gas", "1 rue X 33000 Bordeaux")
+ELEC = Contract("/api/houses/elec", "electricity", "1 rue X 33000 Bordeaux")
+WATER = Contract("/api/houses/water", "water")
+
+
+def _patch_discovery(contracts: list[Contract]):
+    return (
+        patch(
+            "custom_components.gazdebordeaux.discovery.Gazdebordeaux.async_login",
+            return_value=None,
+        ),
+        patch(
+            "custom_components.gazdebordeaux.discovery.Gazdebordeaux.async_list_contracts",
+            return_value=contracts,
+        ),
+    )
 
 
 async def test_form_happy_path(hass: HomeAssistant) -> None:
@@ -24,9 +41,17 @@ async def test_form_happy_path(hass: HomeAssistant) -> None:
     assert result["step_id"] == "user"
     assert result["errors"] == {}
 
-    with patch(
-        "custom_components.gazdebordeaux.config_flow.Gazdebordeaux.async_login",
-        return_value=None,
+    handed_over = {}
+
+    async def setup_entry(hass: HomeAssistant, entry: config_entries.ConfigEntry) -> bool:
+        handed_over.update(hass.data.get(DISCOVERY, {}))
+        return True
+
+    login, list_contracts = _patch_discovery([GAS, WATER])
+    with (
+        login,
+        list_contracts,
+        patch("custom_components.gazdebordeaux.async_setup_entry", side_effect=setup_entry),
     ):
         result = await hass.config_entries.flow.async_configure(
             result["flow_id"],
@@ -37,6 +62,53 @@ async def test_form_happy_path(hass: HomeAssistant) -> None:
     assert result["type"] == FlowResultType.CREATE_ENTRY
     assert result["title"] == f"({USERNAME})"
     assert result["data"] == {CONF_USERNAME: USERNAME, CONF_PASSWORD: PASSWORD}
+    # The single supported contract is handed to the setup, not asked for.
+    assert handed_over[USERNAME].contracts == (GAS,)
+    # What the setup didn't take (its token) doesn't outlive the flow.
+    assert USERNAME not in hass.data.get(DISCOVERY, {})
+
+
+async def test_form_aborts_without_supported_contracts(hass: HomeAssistant) -> None:
+    """An account with no gas or electricity contract creates no entry."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    login, list_contracts = _patch_discovery([WATER])
+    with login, list_contracts:
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {CONF_USERNAME: USERNAME, CONF_PASSWORD: PASSWORD},
+        )
+
+    assert result["type"] == FlowResultType.ABORT
+    assert result["reason"] == "no_contracts"
+    assert not hass.config_entries.async_entries(DOMAIN)
+    assert USERNAME not in hass.data.get(DISCOVERY, {})
+
+
+async def test_form_house_picker(hass: HomeAssistant) -> None:
+    """With several contracts, the picked one is pinned with its category."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    login, list_contracts = _patch_discovery([GAS, ELEC])
+    with login as login_mock, list_contracts as list_mock:
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {CONF_USERNAME: USERNAME, CONF_PASSWORD: PASSWORD},
+        )
+        assert result["type"] == FlowResultType.FORM
+        assert result["step_id"] == "house"
+
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {HOUSE: ELEC.house}
+        )
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["data"][HOUSE] == ELEC.house
+    assert result["data"][CATEGORY] == "electricity"
+    assert login_mock.call_count == 1
+    assert list_mock.call_count == 1
 
 
 async def test_form_invalid_auth(hass: HomeAssistant) -> None:
@@ -46,7 +118,7 @@ async def test_form_invalid_auth(hass: HomeAssistant) -> None:
     )
 
     with patch(
-        "custom_components.gazdebordeaux.config_flow.Gazdebordeaux.async_login",
+        "custom_components.gazdebordeaux.discovery.Gazdebordeaux.async_login",
         side_effect=Exception("bad credentials"),
     ):
         result = await hass.config_entries.flow.async_configure(
@@ -0,0 +1,720 @@
+"""Tests for the gazdebordeaux coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime, time, timedelta
+from types import MappingProxyType
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from custom_components.gazdebordeaux.const import (
+    DISCOVERY,
+    EVENT_IMPORT_PROGRESS,
+    EVENT_NEW_DATA,
+    HOURLY_PROFILE,
+    HOUSE,
+    TARIFF_KWH_PRICE,
+)
+from custom_components.gazdebordeaux.coordinator import (
+    COMMODITIES,
+    IMPORT_BATCH,
+    OFFLINE_RETRY_INTERVAL,
+    REFETCH_LIMIT,
+    UPDATE_INTERVAL,
+    GdbCoordinator,
+)
+from custom_components.gazdebordeaux.dates import day_start
+from custom_components.gazdebordeaux.forecast import DegreeDayModel
+from custom_components.gazdebordeaux.gazdebordeaux import (
+    Contract,
+    DailyUsageRead,
+    Discovery,
+    TotalUsageRead,
+)
+from custom_components.gazdebordeaux.policy import GdbTransientError
+
+USERNAME = "user@example.com"
+PASSWORD = "secret"
+
+
+def _coordinator(hass: HomeAssistant) -> GdbCoordinator:
+    return GdbCoordinator(
+        hass, MappingProxyType({CONF_USERNAME: USERNAME, CONF_PASSWORD: PASSWORD})
+    )
+
+
+def _read(day: datetime) -> DailyUsageRead:
+    return DailyUsageRead(
+        date=day,
+        amountOfEnergy=10.0,
+        volumeOfEnergy=1.0,
+        price=1.5,
+        ratio=10.0,
+        temperature=8.0,
+    )
+
+
+async def test_windows_stop_at_deadline_and_keep_finished_ones(hass: HomeAssistant) -> None:
+    """A window still running at the deadline is dropped; earlier ones are kept."""
+    coordinator = _coordinator(hass)
+    start = datetime(2024, 1, 1)
+
+    async def daily_usage(
+        window_start: datetime, window_end: datetime, house: str | None = None
+    ) -> list[DailyUsageRead]:
+        if window_start > start:
+            await asyncio.sleep(3600)
+        return [_read(window_start + timedelta(days=i)) for i in range(3)]
+
+    coordinator.api.async_get_daily_usage = AsyncMock(side_effect=daily_usage)  # type: ignore[method-assign]
+
+    deadline = asyncio.get_running_loop().time() + 0.2
+    reads = await coordinator._async_get_windows(start, start + timedelta(days=365), deadline)
+
+    assert [r.date for r in reads] == [start + timedelta(days=i) for i in range(3)]
+    assert coordinator._partial_import
+
+
+async def test_windows_share_boundary_day_without_duplicates(hass: HomeAssistant) -> None:
+    """The boundary day returned by two consecutive windows is imported once."""
+    coordinator = _coordinator(hass)
+    start = datetime(2024, 1, 1)
+
+    async def daily_usage(
+        window_start: datetime, window_end: datetime, house: str | None = None
+    ) -> list[DailyUsageRead]:
+        days = (window_end - window_start).days
+        return [_read(window_start + timedelta(days=i)) for i in range(days + 1)]
+
+    coordinator.api.async_get_daily_usage = AsyncMock(side_effect=daily_usage)  # type: ignore[method-assign]
+
+    end = start + timedelta(days=200)
+    reads = await coordinator._async_get_windows(start, end, None)
+
+    assert len(reads) == 201
+    assert reads[-1].date == end
+    assert not coordinator._partial_import
+
+
+async def test_windows_keep_rows_returned_out_of_order(hass: HomeAssistant) -> None:
+    """Rows are sorted per window before the boundary duplicates are dropped."""
+    coordinator = _coordinator(hass)
+    start = datetime(2024, 1, 1)
+
+    async def daily_usage(
+        window_start: datetime, window_end: datetime, house: str | None = None
+    ) -> list[DailyUsageRead]:
+        days = (window_end - window_start).days
+        return [_read(window_start + timedelta(days=i)) for i in reversed(range(days + 1))]
+
+    coordinator.api.async_get_daily_usage = AsyncMock(side_effect=daily_usage)  # type: ignore[method-assign]
+
+    end = start + timedelta(days=200)
+    reads = await coordinator._async_get_windows(start, end, None)
+
+    assert [r.date for r in reads] == [start + timedelta(days=i) for i in range(201)]
+
+
+async def test_import_range_fetches_its_last_day_with_an_exclusive_end_date(
+    hass: HomeAssistant,
+) -> None:
+    """The last day is imported even if the API leaves endDate out."""
+    coordinator = _coordinator(hass)
+    coordinator.contracts = {"electricity": Contract(house="/api/houses/e", category="electricity")}
+    start, end = date(2024, 1, 1), date(2024, 6, 30)
+
+    async def daily_usage(
+        window_start: datetime, window_end: datetime, house: str | None = None
+    ) -> list[DailyUsageRead]:
+        days = (window_end - window_start).days
+        return [_read(window_start + timedelta(days=i)) for i in range(days)]
+
+    coordinator.api.async_get_daily_usage = AsyncMock(side_effect=daily_usage)  # type: ignore[method-assign]
+
+    with patch.object(coordinator, "_async_rewrite_days") as rewrite:
+        await coordinator.async_import_range(start, end)
+
+    by_day = rewrite.call_args.args[1]
+    assert min(by_day) == start
+    assert max(by_day) == end
+    assert len(by_day) == (end - start).days + 1
+
+
+async def test_import_range_recomputes_range_and_shifts_later_sums(hass: HomeAssistant) -> None:
+    """Re-importing a stretch rewrites it from the previous sum and shifts what follows."""
+    coordinator = _coordinator(hass)
+    coordinator.contracts = {"electricity": Contract(house="/api/houses/e", category="electricity")}
+    day = [datetime(2024, 3, d).astimezone() for d in range(1, 6)]
+
+    async def daily_usage(
+        window_start: datetime, window_end: datetime, house: str | None = None
+    ) -> list[DailyUsageRead]:
+        # Corrected values for March 2-3 (10 kWh each instead of 5).
+        return [_read(day[1]), _read(day[2])]
+
+    coordinator.api.async_get_daily_usage = AsyncMock(side_effect=daily_usage)  # type: ignore[method-assign]
+
+    def history_rows(per_day: float) -> list[dict]:
+        return [
+            {"start": d.timestamp(), "state": per_day, "sum": per_day * (i + 1)}
+            for i, d in enumerate(day)
+        ]
+
+    history = {
+        "gazdebordeaux:electricity_consumption": history_rows(5.0),
+        "gazdebordeaux:electricity_cost": history_rows(1.5),
+    }
+    events = []
+    hass.bus.async_listen(EVENT_IMPORT_PROGRESS, events.append)
+
+    with (
+        patch(
+            "custom_components.gazdebordeaux.coordinator.statistics_during_period",
+            return_value=history,
+        ),
+        patch(
+            "custom_components.gazdebordeaux.coordinator.async_add_external_statistics"
+        ) as add_statistics,
+    ):
+        await coordinator.async_import_range(day[1].date(), day[2].date())
+        await hass.async_block_till_done()
+
+    written = {call.args[1]["statistic_id"]: call.args[2] for call in add_statistics.call_args_list}
+    consumption = written["gazdebordeaux:electricity_consumption"]
+    # Baseline 5 (March 1), then 10 + 10, then March 4-5 shifted by +10.
+    assert [row["sum"] for row in consumption] == [15.0, 25.0, 30.0, 35.0]
+    assert [row["state"] for row in consumption] == [10.0, 10.0, 5.0, 5.0]
+    # Cost unchanged (1.5 per day both times): later sums aren't shifted.
+    assert [row["sum"] for row in written["gazdebordeaux:electricity_cost"]] == [
+        3.0,
+        4.5,
+        6.0,
+        7.5,
+    ]
+    assert [e.data["stage"] for e in events] == ["fetch", "done"]
+
+
+async def test_refresh_imports_each_day_once_at_local_midnight(hass: HomeAssistant) -> None:
+    """Days up to the last imported one are dropped; new ones land on local midnight."""
+    coordinator = _coordinator(hass)
+    days = [date(2024, 3, d) for d in range(29, 32)]  # DST starts on March 31
+    last_start = day_start(days[1]).timestamp()
+
+    async def daily_usage(
+        window_start: datetime, window_end: datetime, house: str | None = None
+    ) -> list[DailyUsageRead]:
+        # The boundary day is returned twice, as the API does across windows.
+        return [_read(datetime.combine(d, time.min)) for d in [*days, days[-1]]]
+
+    coordinator.api.async_get_daily_usage = AsyncMock(side_effect=daily_usage)  # type: ignore[method-assign]
+
+    with (
+        patch(
+            "custom_components.gazdebordeaux.coordinator.get_last_statistics",
+            return_value={"gazdebordeaux:energy_consumption": [{"start": last_start}]},
+        ),
+        patch(
+            "custom_components.gazdebordeaux.coordinator.statistics_during_period",
+            return_value={"gazdebordeaux:energy_consumption": [{"start": last_start, "sum": 50.0}]},
+        ),
+        patch(
+            "custom_components.gazdebordeaux.coordinator.async_add_external_statistics"
+        ) as add_statistics,
+    ):
+        await coordinator._insert_commodity_statistics(COMMODITIES["gas"], "/api/houses/gas", None)
+
+    written = {call.args[1]["statistic_id"]: call.args[2] for call in add_statistics.call_args_list}
+    consumption = written["gazdebordeaux:energy_consumption"]
+    assert [row["start"] for row in consumption] == [day_start(days[2])]
+    assert consumption[0]["start"].utcoffset() == timedelta(hours=1)
+    assert [row["sum"] for row in consumption] == [60.0]
+    # Statistics missing from the recorder start again from 0.
+    assert [row["sum"] for row in written["gazdebordeaux:energy_cost"]] == [1.5]
+
+
+async def _import_last_days(coordinator: GdbCoordinator, reads: list[DailyUsageRead]) -> None:
+    """Import `reads` after a recorded 2024-07-31, as an incremental refresh does."""
+    last_start = day_start(date(2024, 7, 31)).timestamp()
+    coordinator.api.async_get_daily_usage = AsyncMock(return_value=reads)  # type: ignore[method-assign]
+    with (
+        patch(
+            "custom_components.gazdebordeaux.coordinator.get_last_statistics",
+            return_value={"gazdebordeaux:energy_consumption": [{"start": last_start}]},
+        ),
+        patch(
+            "custom_components.gazdebordeaux.coordinator.statistics_during_period",
+            return_value={"gazdebordeaux:energy_consumption": [{"start": last_start, "sum": 50.0}]},
+        ),
+        patch("custom_components.gazdebordeaux.coordinator.async_add_external_statistics"),
+    ):
+        await coordinator._insert_commodity_statistics(COMMODITIES["gas"], "/api/houses/gas", None)
+
+
+@pytest.mark.parametrize(
+    ("kwh", "price", "tariff", "pinned"),
+    [
+        (0.0, 0.0, True, False),  # no consumption: a real 0
+        (10.0, None, False, True),  # a 0 placeholder without a tariff: fetched again too
+        (10.0, None, True, True),  # estimated: fetched again for the supplier's price
+        (10.0, 0.0, True, True),
+    ],
+)
+async def test_only_unpriced_days_are_fetched_again(
+    hass: HomeAssistant, kwh: float, price: float | None, tariff: bool, pinned: bool
+) -> None:
+    options = {TARIFF_KWH_PRICE: 0.1} if tariff else {}
+    coordinator = GdbCoordinator(
+        hass, MappingProxyType({CONF_USERNAME: USERNAME, CONF_PASSWORD: PASSWORD, **options})
+    )
+    day = datetime(2024, 8, 1)
+    read = _read(day)
+    read.amountOfEnergy, read.price, read.priced = kwh, price or 0.0, price is not None
+
+    await _import_last_days(coordinator, [read])
+
+    assert coordinator._refetch_from.get("gas") == (day.date() if pinned else None)
+
+
+async def test_refetch_stops_past_the_limit(hass: HomeAssistant) -> None:
+    """A day still unpriced a month later no longer drags every refresh back to it."""
+    coordinator = _coordinator(hass)
+    coordinator._refetch_from["gas"] = date(2024, 7, 31) - REFETCH_LIMIT - timedelta(days=1)
+
+    await _import_last_days(coordinator, [_read(datetime(2024, 8, 1))])
+
+    (window_start, *_), _ = coordinator.api.async_get_daily_usage.call_args_list[0]
+    assert window_start.date() == date(2024, 7, 31)
+    assert "gas" not in coordinator._refetch_from
+
+
+async def test_unreachable_site_serves_last_good_data_as_stale(hass: HomeAssistant) -> None:
+    """Transient failures keep the previous totals, flagged stale, and retry sooner."""
+    coordinator = _coordinator(hass)
+    coordinator.contracts = {"gas": Contract(house="/api/houses/gas", category="gas")}
+    total = TotalUsageRead(amountOfEnergy=1234.0, volumeOfEnergy=110.5, price=180.0)
+    coordinator.api.async_login = AsyncMock(return_value=None)  # type: ignore[method-assign]
+    coordinator.api.async_get_total_usage = AsyncMock(return_value=total)  # type: ignore[method-assign]
+
+    with patch.object(coordinator, "_insert_statistics", AsyncMock(return_value=None)):
+        await coordinator.async_refresh()
+        assert coordinator.data == {"gas": total}
+        assert not coordinator.stale
+
+        coordinator.api.async_login.side_effect = GdbTransientError("timeout")
+        await coordinator.async_refresh()
+        assert coordinator.last_update_success
+        assert coordinator.data == {"gas": total}
+        assert coordinator.stale
+        assert coordinator.update_interval == OFFLINE_RETRY_INTERVAL
+
+        await coordinator.async_refresh()
+        assert coordinator.update_interval == OFFLINE_RETRY_INTERVAL * 2
+
+        coordinator.api.async_login.side_effect = None
+        await coordinator.async_refresh()
+        assert not coordinator.stale
+        assert coordinator.update_interval == UPDATE_INTERVAL
+
+
+async def test_unreachable_site_without_previous_data_fails(hass: HomeAssistant) -> None:
+    """With nothing to fall back on, the refresh still fails."""
+    coordinator = _coordinator(hass)
+    coordinator.api.async_login = AsyncMock(side_effect=GdbTransientError("timeout"))  # type: ignore[method-assign]
+
+    await coordinator.async_refresh()
+
+    assert not coordinator.last_update_success
+    assert not coordinator.stale
+
+
+async def test_first_refresh_reuses_config_flow_discovery(hass: HomeAssistant) -> None:
+    """The token and contracts found by the config flow save a login and a discovery."""
+    gas = Contract(house="/api/houses/gas", category="gas")
+    elec = Contract(house="/api/houses/elec", category="electricity")
+    hass.data[DISCOVERY] = {USERNAME: Discovery(token="jwt", contracts=(gas, elec))}
+    coordinator = GdbCoordinator(
+        hass,
+        MappingProxyType({CONF_USERNAME: USERNAME, CONF_PASSWORD: PASSWORD, HOUSE: elec.house}),
+    )
+    total = TotalUsageRead(amountOfEnergy=1.0, volumeOfEnergy=0.0, price=1.0)
+    coordinator.api.async_login = AsyncMock(return_value=None)  # type: ignore[method-assign]
+    coordinator.api.async_list_contracts = AsyncMock(return_value=[])  # type: ignore[method-assign]
+    coordinator.api.async_get_total_usage = AsyncMock(return_value=total)  # type: ignore[method-assign]
+
+    with patch.object(coordinator, "_insert_statistics", AsyncMock(return_value=None)):
+        await coordinator.async_refresh()
+        assert coordinator.api.token == "jwt"
+        assert coordinator.contracts == {"electricity": elec}
+        coordinator.api.async_login.assert_not_called()
+        coordinator.api.async_list_contracts.assert_not_called()
+        assert USERNAME not in hass.data[DISCOVERY]
+
+        # Later refreshes log in again as before.
+        await coordinator.async_refresh()
+        coordinator.api.async_login.assert_called_once()
+
+
+async def test_reconcile_repairs_only_the_drifting_month(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """A year total off by one lost day re-imports that day's month only."""
+    freezer.move_to("2024-05-02 12:00:00")
+    coordinator = _coordinator(hass)
+    coordinator.contracts = {"electricity": Contract(house="/api/houses/e", category="electricity")}
+    coordinator.latest_day["electricity"] = date(2024, 4, 30)
+    days = [date(2024, 1, 1) + timedelta(days=i) for i in range(121)]
+    lost = date(2024, 3, 10)
+
+    def history_rows(per_day: float) -> list[dict]:
+        rows, running = [], 0.0
+        for d in days:
+            running += 0.0 if d == lost else per_day
+            rows.append({"start": day_start(d).timestamp(), "state": per_day, "sum": running})
+        return rows
+
+    history = {
+        "gazdebordeaux:electricity_consumption": history_rows(5.0),
+        "gazdebordeaux:electricity_cost": history_rows(1.5),
+    }
+
+    async def daily_usage(
+        window_start: datetime, window_end: datetime, house: str | None = None
+    ) -> list[DailyUsageRead]:
+        span = (window_end - window_start).days + 1
+        return [
+            DailyUsageRead(window_start + timedelta(days=i), 5.0, 0.0, 1.5, None, None)
+            for i in range(span)
+        ]
+
+    coordinator.api.async_get_daily_usage = AsyncMock(side_effect=daily_usage)  # type: ignore[method-assign]
+    total = TotalUsageRead(amountOfEnergy=5.0 * len(days), volumeOfEnergy=0.0, price=0.0)
+
+    with (
+        patch("custom_components.gazdebordeaux.coordinator.get_instance") as get_instance,
+        patch(
+            "custom_components.gazdebordeaux.coordinator.statistics_during_period",
+            return_value=history,
+        ),
+        patch(
+            "custom_components.gazdebordeaux.coordinator.async_add_external_statistics"
+        ) as add_statistics,
+    ):
+        get_instance.return_value.async_block_till_done = AsyncMock()
+        get_instance.return_value.async_add_executor_job = AsyncMock(return_value=history)
+        await coordinator._async_reconcile({"electricity": total})
+
+    fetched = [call.args[0].month for call in coordinator.api.async_get_daily_usage.call_args_list]
+    # January-February (left half), then March: April is known by subtraction.
+    assert fetched == [1, 2, 3]
+    written = {call.args[1]["statistic_id"]: call.args[2] for call in add_statistics.call_args_list}
+    consumption = written["gazdebordeaux:electricity_consumption"]
+    # March rewritten from February's sum, later days shifted by the lost 5 kWh.
+    assert consumption[0]["start"] == day_start(date(2024, 3, 1))
+    assert consumption[-1]["sum"] == 5.0 * len(days)
+
+
+async def test_reconcile_skips_refreshes_that_bring_nothing_new(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """A year total ahead of the daily data is bisected once, not on every refresh."""
+    freezer.move_to("2024-05-02 12:00:00")
+    coordinator = _coordinator(hass)
+    coordinator.contracts = {"gas": Contract(house="/api/houses/g", category="gas")}
+    coordinator.latest_day["gas"] = date(2024, 4, 30)
+    days = [date(2024, 1, 1) + timedelta(days=i) for i in range(121)]
+    history = {
+        "gazdebordeaux:energy_consumption": [
+            {"start": day_start(d).timestamp(), "state": 5.0, "sum": 5.0 * (i + 1)}
+            for i, d in enumerate(days)
+        ]
+    }
+
+    async def daily_usage(
+        window_start: datetime, window_end: datetime, house: str | None = None
+    ) -> list[DailyUsageRead]:
+        span = (window_end - window_start).days + 1
+        return [
+            DailyUsageRead(window_start + timedelta(days=i), 5.0, 0.0, 1.5, None, None)
+            for i in range(span)
+        ]
+
+    coordinator.api.async_get_daily_usage = AsyncMock(side_effect=daily_usage)  # type: ignore[method-assign]
+    # Counts days the site hasn't published day by day yet.
+    total = {"gas": TotalUsageRead(amountOfEnergy=5.0 * len(days) + 10, volumeOfEnergy=0, price=0)}
+
+    with patch("custom_components.gazdebordeaux.coordinator.get_instance") as get_instance:
+        get_instance.return_value.async_block_till_done = AsyncMock()
+        get_instance.return_value.async_add_executor_job = AsyncMock(return_value=history)
+        await coordinator._async_reconcile(total)
+        fetched = coordinator.api.async_get_daily_usage.await_count
+        await coordinator._async_reconcile(total)
+        assert coordinator.api.async_get_daily_usage.await_count == fetched
+        # A new day: compared again.
+        coordinator.latest_day["gas"] = date(2024, 5, 1)
+        await coordinator._async_reconcile(total)
+
+    assert fetched > 0
+    assert coordinator.api.async_get_daily_usage.await_count > fetched
+    await coordinator.async_shutdown()
+
+
+async def test_reconcile_waits_for_the_first_day_of_the_year(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """On January 2nd the year total is not compared with last year's days."""
+    freezer.move_to("2025-01-02 12:00:00")
+    coordinator = _coordinator(hass)
+    coordinator.contracts = {"gas": Contract(house="/api/houses/g", category="gas")}
+    coordinator.latest_day["gas"] = date(2024, 12, 31)
+    coordinator.api.async_get_daily_usage = AsyncMock(return_value=[])  # type: ignore[method-assign]
+
+    with patch("custom_components.gazdebordeaux.coordinator.get_instance") as get_instance:
+        await coordinator._async_reconcile(
+            {"gas": TotalUsageRead(amountOfEnergy=0.0, volumeOfEnergy=0.0, price=0.0)}
+        )
+
+    coordinator.api.async_get_daily_usage.assert_not_called()
+    get_instance.assert_not_called()
+
+
+async def test_refresh_out_of_time_while_reconciling_is_fresh(hass: HomeAssistant) -> None:
+    """The statistics were written: a reconciliation cut by the deadline doesn't make it stale."""
+    coordinator = _coordinator(hass)
+    coordinator.contracts = {"gas": Contract("/api/houses/gas", "gas")}
+    coordinator.latest_day["gas"] = date.today()
+    total = TotalUsageRead(amountOfEnergy=100.0, volumeOfEnergy=9.0, price=15.0)
+    coordinator.api.async_login = AsyncMock()  # type: ignore[method-assign]
+    coordinator.api.async_get_total_usage = AsyncMock(return_value=total)  # type: ignore[method-assign]
+
+    async def endless_reconcile(*args: object) -> None:
+        await asyncio.sleep(3600)
+
+    with (
+        patch.object(coordinator, "_insert_statistics", AsyncMock()),
+        patch.object(coordinator, "_async_reconcile_commodity", endless_reconcile),
+        patch(
+            "custom_components.gazdebordeaux.coordinator.REFRESH_TIMEOUT",
+            timedelta(seconds=0.1),
+        ),
+    ):
+        await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert not coordinator.stale
+    assert coordinator.data == {"gas": total}
+    assert "gas" not in coordinator._reconciled
+    await coordinator.async_shutdown()
+
+
+async def test_ten_year_first_import_yields_to_the_event_loop(hass: HomeAssistant) -> None:
+    """Building and queueing ten years of rows gives the loop a turn between batches."""
+    coordinator = _coordinator(hass)
+    days = [date(2015, 1, 1) + timedelta(days=i) for i in range(3653)]
+    reads = [_read(datetime.combine(day, time.min)) for day in days]
+    coordinator._async_get_all_data = AsyncMock(return_value=reads)  # type: ignore[method-assign]
+    ticks = 0
+    done = False
+
+    async def heartbeat() -> None:
+        nonlocal ticks
+        while not done:
+            await asyncio.sleep(0)
+            ticks += 1
+
+    with (
+        patch(
+            "custom_components.gazdebordeaux.coordinator.get_last_statistics",
+            return_value={},
+        ),
+        patch(
+            "custom_components.gazdebordeaux.coordinator.async_add_external_statistics"
+        ) as add_statistics,
+    ):
+        beat = asyncio.create_task(heartbeat())
+        await coordinator._insert_commodity_statistics(COMMODITIES["gas"], "/api/houses/gas", None)
+        done = True
+        await beat
+
+    batches = -(-len(days) // IMPORT_BATCH)
+    # Three statistics queued in batches, rows built in batches, forecast fed in batches.
+    assert add_statistics.call_count == 3 * batches
+    assert ticks >= 5 * (batches - 1)
+    assert coordinator.forecasts["gas"].days == len(days)
+
+
+async def test_hourly_profile_spreads_new_days_over_their_hours(hass: HomeAssistant) -> None:
+    """With a profile, each new day also lands as hourly rows ending on its daily sum."""
+    coordinator = GdbCoordinator(
+        hass,
+        MappingProxyType(
+            {CONF_USERNAME: USERNAME, CONF_PASSWORD: PASSWORD, HOURLY_PROFILE: "residential"}
+        ),
+    )
+    days = [date(2024, 3, 30), date(2024, 3, 31)]  # DST starts on March 31
+    last_start = day_start(days[0]).timestamp()
+
+    async def daily_usage(
+        window_start: datetime, window_end: datetime, house: str | None = None
+    ) -> list[DailyUsageRead]:
+        return [_read(datetime.combine(d, time.min)) for d in days]
+
+    coordinator.api.async_get_daily_usage = AsyncMock(side_effect=daily_usage)  # type: ignore[method-assign]
+
+    with (
+        patch(
+            "custom_components.gazdebordeaux.coordinator.get_last_statistics",
+            return_value={"gazdebordeaux:energy_consumption": [{"start": last_start}]},
+        ),
+        patch(
+            "custom_components.gazdebordeaux.coordinator.statistics_during_period",
+            return_value={"gazdebordeaux:energy_consumption": [{"start": last_start, "sum": 50.0}]},
+        ),
+        patch(
+            "custom_components.gazdebordeaux.coordinator.async_add_external_statistics"
+        ) as add_statistics,
+    ):
+        await coordinator._insert_commodity_statistics(COMMODITIES["gas"], "/api/houses/gas", None)
+
+    written = {call.args[1]["statistic_id"]: call.args[2] for call in add_statistics.call_args_list}
+    hourly = written["gazdebordeaux:energy_consumption_hourly"]
+    assert len(hourly) == 23
+    assert hourly[0]["start"] == day_start(days[1])
+    assert hourly[-1]["sum"] == written["gazdebordeaux:energy_consumption"][-1]["sum"] == 60.0
+    assert sum(row["state"] for row in hourly) == pytest.approx(10.0)
+
+
+async def test_new_data_event_carries_the_days_written_since_the_last_one(
+    hass: HomeAssistant,
+) -> None:
+    """Imports and later rewrites of the same days coalesce into one event per contract."""
+    coordinator = _coordinator(hass)
+    coordinator.contracts = {"gas": Contract("/api/houses/gas", "gas")}
+    days = [date(2024, 3, 30), date(2024, 3, 31)]
+    events: list = []
+    hass.bus.async_listen(EVENT_NEW_DATA, events.append)
+
+    async def daily_usage(
+        window_start: datetime, window_end: datetime, house: str | None = None
+    ) -> list[DailyUsageRead]:
+        return [_read(datetime.combine(d, time.min)) for d in days]
+
+    coordinator.api.async_get_daily_usage = AsyncMock(side_effect=daily_usage)  # type: ignore[method-assign]
+
+    with (
+        patch("custom_components.gazdebordeaux.coordinator.get_last_statistics", return_value={}),
+        patch("custom_components.gazdebordeaux.coordinator.async_add_external_statistics"),
+    ):
+        await coordinator._insert_commodity_statistics(COMMODITIES["gas"], "/api/houses/gas", None)
+        # The same days written again (as a correction would) replace the first values.
+        await coordinator._insert_commodity_statistics(COMMODITIES["gas"], "/api/houses/gas", None)
+    coordinator._async_fire_new_data()
+    coordinator._async_fire_new_data()
+    await hass.async_block_till_done()
+
+    assert len(events) == 1
+    data = events[0].data
+    assert data["category"] == "gas"
+    assert data["house"] == "/api/houses/gas"
+    assert data["days"] == ["2024-03-30", "2024-03-31"]
+    assert data["energy"] == [10.0, 10.0]
+    assert data["energy_sum"] == [10.0, 20.0]
+    assert data["volume_sum"] == [1.0, 2.0]
+    assert data["cost"] == [1.5, 1.5]
+
+
+async def test_overlapping_refreshes_share_one_import(hass: HomeAssistant) -> None:
+    """Imports triggered together run once, by the category's single worker."""
+    coordinator = _coordinator(hass)
+    coordinator.contracts = {"gas": Contract("/api/houses/gas", "gas")}
+
+    with patch.object(coordinator, "_insert_commodity_statistics", AsyncMock()) as insert:
+        await asyncio.gather(*(coordinator._insert_statistics() for _ in range(3)))
+        await coordinator._insert_statistics()
+
+    assert insert.await_count == 2
+    insert.assert_awaited_with(COMMODITIES["gas"], "/api/houses/gas", None)
+    await coordinator.async_shutdown()
+
+
+async def test_refresh_queued_behind_an_import_range_keeps_its_deadline(
+    hass: HomeAssistant,
+) -> None:
+    """A refresh waiting for a long import_range gives up at its deadline."""
+    coordinator = _coordinator(hass)
+    coordinator.contracts = {"gas": Contract("/api/houses/gas", "gas")}
+    release = asyncio.Event()
+
+    async def long_range(*args: object) -> None:
+        await release.wait()
+
+    with (
+        patch.object(coordinator, "_insert_commodity_statistics", AsyncMock()) as insert,
+        patch.object(coordinator, "_async_import_commodity_range", long_range),
+        patch("custom_components.gazdebordeaux.coordinator.WRITE_GRACE", timedelta(0)),
+    ):
+        ranged = hass.async_create_task(
+            coordinator.async_import_range(date(2024, 1, 1), date(2024, 12, 31))
+        )
+        await asyncio.sleep(0.01)
+        with pytest.raises(TimeoutError):
+            await coordinator._insert_statistics(asyncio.get_running_loop().time() + 0.05)
+        release.set()
+        await ranged
+
+    insert.assert_not_awaited()
+    await coordinator.async_shutdown()
+
+
+async def test_forecast_follows_days_rewritten_by_import_range(hass: HomeAssistant) -> None:
+    """A day rewritten twice by import_range leaves the forecast as if fitted once."""
+    coordinator = _coordinator(hass)
+    coordinator.contracts = {"gas": Contract("/api/houses/gas", "gas")}
+    gas = COMMODITIES["gas"]
+    days = [datetime(2024, 7, d).astimezone() for d in range(1, 32)]
+
+    def reads(kwh: float) -> list[DailyUsageRead]:
+        result = [_read(day) for day in days]
+        for i, read in enumerate(result):
+            read.temperature = 5.0 + i % 10
+        result[10].amountOfEnergy = kwh
+        result[10].price = kwh * 0.15
+        return result
+
+    # Imported as a refresh does: forecast first, then the series.
+    model = coordinator.forecasts["gas"] = DegreeDayModel()
+    await coordinator._async_fold_forecast(model, "gas", reads(10.0))
+    coordinator._async_update_series("gas", reads(10.0))
+    history = {
+        gas.consumption_statistic_id: [
+            {"start": day.timestamp(), "state": 10.0, "sum": 10.0 * (i + 1)}
+            for i, day in enumerate(days)
+        ]
+    }
+
+    for kwh in (25.0, 18.0):
+        revised = reads(kwh)[10]
+        coordinator.api.async_get_daily_usage = AsyncMock(return_value=[revised])  # type: ignore[method-assign]
+        with (
+            patch(
+                "custom_components.gazdebordeaux.coordinator.statistics_during_period",
+                return_value=history,
+            ),
+            patch("custom_components.gazdebordeaux.coordinator.async_add_external_statistics"),
+        ):
+            await coordinator.async_import_range(days[10].date(), days[10].date())
+
+    expected = DegreeDayModel()
+    expected.update(reads(18.0))
+    assert model.days == expected.days == 31
+    for fit, reference in ((model.energy, expected.energy), (model.cost, expected.cost)):
+        assert fit.w == pytest.approx(reference.w)
+        assert fit.xy == pytest.approx(reference.xy)
+        assert fit.yy == pytest.approx(reference.yy)
+    assert model.month_energy == pytest.approx(expected.month_energy)
+    assert model.month_cost == pytest.approx(expected.month_cost)
+    await coordinator.async_shutdown()
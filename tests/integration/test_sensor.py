@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, patch
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
 
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.gazdebordeaux.const import DOMAIN
-from custom_components.gazdebordeaux.gazdebordeaux import TotalUsageRead
+from custom_components.gazdebordeaux.const import DEDICATED_SESSION, DOMAIN
+from custom_components.gazdebordeaux.coordinator import GdbCoordinator
+from custom_components.gazdebordeaux.dates import PARIS
+from custom_components.gazdebordeaux.forecast import DegreeDayModel
+from custom_components.gazdebordeaux.gazdebordeaux import (
+    Contract,
+    DailyUsageRead,
+    TotalUsageRead,
+)
+from custom_components.gazdebordeaux.policy import GdbTransientError
 
 USERNAME = "user@example.com"
 PASSWORD = "secret"
@@ -30,6 +40,10 @@ async def test_sensors_expose_total_usage_values(hass: HomeAssistant) -> None:
             "custom_components.gazdebordeaux.coordinator.Gazdebordeaux.async_login",
             new=AsyncMock(return_value=None),
         ),
+        patch(
+            "custom_components.gazdebordeaux.coordinator.Gazdebordeaux.async_list_contracts",
+            new=AsyncMock(return_value=[Contract(house="/api/houses/gas", category="gas")]),
+        ),
         patch(
             "custom_components.gazdebordeaux.coordinator.Gazdebordeaux.async_get_total_usage",
             new=AsyncMock(return_value=canned),
@@ -50,3 +64,166 @@ async def test_sensors_expose_total_usage_values(hass: HomeAssistant) -> None:
     assert state_volume is not None and float(state_volume.state) == 110.5
     assert state_energy is not None and float(state_energy.state) == 1234.0
     assert state_cost is not None and float(state_cost.state) == 180.42
+
+
+async def test_electricity_contract_gets_its_own_sensors(hass: HomeAssistant) -> None:
+    """Gas and electricity contracts on one account each expose their totals."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_USERNAME: USERNAME, CONF_PASSWORD: PASSWORD},
+    )
+    entry.add_to_hass(hass)
+
+    totals = {
+        "/api/houses/gas": TotalUsageRead(amountOfEnergy=1234.0, volumeOfEnergy=110.5, price=180.0),
+        "/api/houses/elec": TotalUsageRead(amountOfEnergy=2500.0, volumeOfEnergy=0.0, price=420.0),
+    }
+    login = AsyncMock(return_value=None)
+
+    with (
+        patch("custom_components.gazdebordeaux.coordinator.Gazdebordeaux.async_login", new=login),
+        patch(
+            "custom_components.gazdebordeaux.coordinator.Gazdebordeaux.async_list_contracts",
+            new=AsyncMock(
+                return_value=[
+                    Contract(house="/api/houses/elec", category="electricity"),
+                    Contract(house="/api/houses/gas", category="gas"),
+                ]
+            ),
+        ),
+        patch(
+            "custom_components.gazdebordeaux.coordinator.Gazdebordeaux.async_get_total_usage",
+            new=AsyncMock(side_effect=lambda house: totals[house]),
+        ),
+        patch(
+            "custom_components.gazdebordeaux.coordinator.GdbCoordinator._insert_statistics",
+            new=AsyncMock(return_value=None),
+        ),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    # A single login serves both commodities.
+    assert login.await_count == 1
+
+    state_gas = hass.states.get("sensor.current_energy_usage_to_date")
+    state_elec = hass.states.get("sensor.current_electricity_usage_to_date")
+    state_elec_cost = hass.states.get("sensor.current_bill_electricity_cost_to_date")
+
+    assert state_gas is not None and float(state_gas.state) == 1234.0
+    assert state_elec is not None and float(state_elec.state) == 2500.0
+    assert state_elec_cost is not None and float(state_elec_cost.state) == 420.0
+
+
+async def test_freshness_sensors_read_coordinator_state(hass: HomeAssistant) -> None:
+    """Latest day, lag and refresh duration come from the last refresh."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_USERNAME: USERNAME, CONF_PASSWORD: PASSWORD},
+    )
+    entry.add_to_hass(hass)
+    latest = datetime.now(PARIS).date() - timedelta(days=2)
+
+    async def insert_statistics(coordinator: GdbCoordinator, deadline: float | None = None) -> None:
+        coordinator.latest_day["gas"] = latest
+
+    with (
+        patch(
+            "custom_components.gazdebordeaux.coordinator.Gazdebordeaux.async_login",
+            new=AsyncMock(return_value=None),
+        ),
+        patch(
+            "custom_components.gazdebordeaux.coordinator.Gazdebordeaux.async_list_contracts",
+            new=AsyncMock(return_value=[Contract(house="/api/houses/gas", category="gas")]),
+        ),
+        patch(
+            "custom_components.gazdebordeaux.coordinator.Gazdebordeaux.async_get_total_usage",
+            new=AsyncMock(return_value=TotalUsageRead(1.0, 1.0, 1.0)),
+        ),
+        patch.object(
+            GdbCoordinator, "_insert_statistics", autospec=True, side_effect=insert_statistics
+        ),
+        # No recorder here to reconcile against.
+        patch.object(GdbCoordinator, "_async_reconcile", AsyncMock(return_value=None)),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    state_day = hass.states.get("sensor.gaz_de_bordeaux_latest_data_day")
+    state_lag = hass.states.get("sensor.gaz_de_bordeaux_data_lag")
+    state_duration = hass.states.get("sensor.gaz_de_bordeaux_last_refresh_duration")
+
+    assert state_day is not None and state_day.state == latest.isoformat()
+    assert state_lag is not None and int(state_lag.state) == 2
+    assert state_duration is not None and float(state_duration.state) >= 0
+
+
+async def test_forecast_sensors_project_from_the_fit(hass: HomeAssistant) -> None:
+    """Forecast sensors show the projection and the fit quality."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_USERNAME: USERNAME, CONF_PASSWORD: PASSWORD},
+    )
+    entry.add_to_hass(hass)
+    reads = [
+        DailyUsageRead(
+            datetime(2024, 1, 1) + timedelta(days=i), 30.0 + i % 5, 0.0, 4.0, None, 10.0 - i % 5
+        )
+        for i in range(30)
+    ]
+
+    async def insert_statistics(coordinator: GdbCoordinator, deadline: float | None = None) -> None:
+        model = coordinator.forecasts.setdefault("gas", DegreeDayModel())
+        model.update(reads)
+
+    with (
+        patch(
+            "custom_components.gazdebordeaux.coordinator.Gazdebordeaux.async_login",
+            new=AsyncMock(return_value=None),
+        ),
+        patch(
+            "custom_components.gazdebordeaux.coordinator.Gazdebordeaux.async_list_contracts",
+            new=AsyncMock(return_value=[Contract(house="/api/houses/gas", category="gas")]),
+        ),
+        patch(
+            "custom_components.gazdebordeaux.coordinator.Gazdebordeaux.async_get_total_usage",
+            new=AsyncMock(return_value=TotalUsageRead(1.0, 1.0, 1.0)),
+        ),
+        patch.object(
+            GdbCoordinator, "_insert_statistics", autospec=True, side_effect=insert_statistics
+        ),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    state_month = hass.states.get("sensor.gaz_de_bordeaux_forecast_energy_end_of_month")
+    state_year = hass.states.get("sensor.gaz_de_bordeaux_forecast_cost_end_of_year")
+
+    # January 30: one more day of about 32 kWh.
+    assert state_month is not None and 990 < float(state_month.state) < 1000
+    assert state_month.attributes["r2"] == 1.0
+    assert state_month.attributes["fitted_days"] == 30
+    assert state_year is not None and float(state_year.state) > 30 * 4.0
+
+
+async def test_failed_first_refresh_closes_the_dedicated_session(hass: HomeAssistant) -> None:
+    """A setup retried later doesn't leave the failed attempt's session open."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_USERNAME: USERNAME, CONF_PASSWORD: PASSWORD, DEDICATED_SESSION: True},
+    )
+    entry.add_to_hass(hass)
+    session = MagicMock(close=AsyncMock())
+
+    with (
+        patch("custom_components.gazdebordeaux.coordinator.create_session", return_value=session),
+        patch(
+            "custom_components.gazdebordeaux.coordinator.Gazdebordeaux.async_login",
+            new=AsyncMock(side_effect=GdbTransientError("timeout")),
+        ),
+    ):
+        assert not await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.SETUP_RETRY
+    session.close.assert_awaited_once()
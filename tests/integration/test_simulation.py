@@ -0,0 +1,162 @@
+"""A year of 12-hour refreshes replayed on a simulated clock; see simulation.py."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.gazdebordeaux.coordinator import (
+    COMMODITIES,
+    OFFLINE_RETRY_INTERVAL,
+    RETRY_INTERVAL,
+    UPDATE_INTERVAL,
+)
+from custom_components.gazdebordeaux.dates import PARIS
+from custom_components.gazdebordeaux.forecast import DegreeDayModel
+from custom_components.gazdebordeaux.gazdebordeaux import DailyUsageRead
+
+from .simulation import RATIO, SimulatedSite, Simulation, temperature
+
+START = datetime(2024, 1, 15, 7, 0)
+# Spans both DST changes (March 31st, October 27th) and a new year.
+END = datetime(2025, 1, 15, 7, 0)
+REVISED = date(2024, 3, 5)
+REVISED_AT = datetime(2024, 3, 20, 12, 0)
+LATE = date(2024, 6, 10)
+LATE_AT = datetime(2024, 6, 25, 9, 0)
+UNPRICED = date(2024, 9, 3)
+PRICED_AT = datetime(2024, 9, 12, 10, 0)
+IDLE = {date(2024, 8, 5), date(2024, 8, 6)}
+OUTAGE = (datetime(2024, 10, 27, 0, 0), datetime(2024, 10, 27, 8, 0))
+GAS = COMMODITIES["gas"]
+
+
+@pytest.fixture
+async def simulation(hass: HomeAssistant):
+    site = SimulatedSite(
+        now=START,
+        first_day=date(2023, 1, 1),
+        revisions={REVISED: (REVISED_AT, 8.0)},
+        late={LATE: LATE_AT},
+        unpriced={UNPRICED: PRICED_AT},
+        idle=IDLE,
+        outages=[OUTAGE],
+    )
+    simulation = Simulation(hass, site)
+    try:
+        await simulation.async_run(END)
+        yield simulation
+    finally:
+        await simulation.coordinator.async_shutdown()
+
+
+async def test_a_year_of_refreshes_runs_in_seconds(simulation: Simulation) -> None:
+    refreshes = simulation.refreshes
+    # Two polls a day, plus the retries of the outage.
+    assert len(refreshes) == 2 * 366 + 4
+    assert simulation.wall_seconds < 30
+    # No refresh blocks the loop for long, the first import (two years) included.
+    assert max(refresh.seconds for refresh in refreshes) < 1.0
+
+
+async def test_requests_per_refresh(simulation: Simulation) -> None:
+    requests = simulation.site.requests
+    refreshes = simulation.refreshes
+    # A login per refresh; the contract is discovered once.
+    assert requests["login"] == len(refreshes)
+    assert (requests["user"], requests["house"]) == (1, 1)
+    assert refreshes[0].requests["daily"] == 5  # 2023-01-01 to now, in 92-day windows
+    # Afterwards one window per refresh, except where a drift is repaired:
+    # the revision, then the late day once it is published. New year's
+    # refreshes don't compare the new year's total with last year's days.
+    repairs = [r.at for r in refreshes[1:] if r.requests["daily"] > 1]
+    assert repairs == [datetime(2024, 3, 20, 19, 0), datetime(2024, 6, 25, 19, 0)]
+    assert all(r.requests["daily"] <= 1 + 12 for r in refreshes)
+
+
+async def test_refreshes_fetch_only_recent_days(simulation: Simulation) -> None:
+    """Idle days (a real 0 price) aren't fetched again; the unpriced one is, until priced."""
+    incremental = [r for r in simulation.refreshes[1:] if r.requests["daily"] == 1]
+    lag = {r.at: r.at.date() - r.fetched_from for r in incremental if r.fetched_from}
+    assert max(lag.values()) == PRICED_AT.date() - UNPRICED + timedelta(days=1)
+    assert all(days <= timedelta(days=3) for at, days in lag.items() if at > PRICED_AT)
+    assert not simulation.coordinator._refetch_from
+
+
+async def test_outage_backs_off_then_catches_up(simulation: Simulation) -> None:
+    during = [r for r in simulation.refreshes if OUTAGE[0] <= r.at < OUTAGE[1]]
+    assert all(r.stale for r in during)
+    assert [r.next_in for r in during] == [
+        OFFLINE_RETRY_INTERVAL,
+        OFFLINE_RETRY_INTERVAL * 2,
+        OFFLINE_RETRY_INTERVAL * 4,
+        RETRY_INTERVAL,
+    ]
+    after = simulation.refreshes[simulation.refreshes.index(during[-1]) + 1]
+    assert after.at == datetime(2024, 10, 27, 8, 5)
+    assert not after.stale
+    assert after.next_in == UPDATE_INTERVAL
+
+
+async def test_statistics_are_continuous_and_current(simulation: Simulation) -> None:
+    site = simulation.site
+    last = site.last_published()
+    expected_days = [
+        site.first_day + timedelta(days=i) for i in range((last - site.first_day).days + 1)
+    ]
+    expected = {
+        GAS.consumption_statistic_id: site.kwh,
+        GAS.cost_statistic_id: site.price,
+        GAS.volume_statistic_id: lambda day: round(site.kwh(day) / RATIO, 2),
+    }
+    assert all(site.kwh(day) == site.price(day) == 0.0 for day in IDLE)
+    for statistic_id, value in expected.items():
+        rows = simulation.recorder.series(statistic_id)
+        # One row per day, at local midnight, across both DST changes.
+        assert all(
+            datetime.fromtimestamp(row["start"], PARIS).time() == time.min for row in rows
+        ), statistic_id
+        days = simulation.days(statistic_id)
+        assert [day for day, _, _ in days] == expected_days, statistic_id
+        running = 0.0
+        for day, state, total in days:
+            # The supplier's current figures: revised, late, repriced and idle days included.
+            assert state == pytest.approx(value(day)), (statistic_id, day)
+            running += state
+            assert total == pytest.approx(running, abs=1e-6), (statistic_id, day)
+
+
+async def test_forecast_follows_revised_late_and_repriced_days(simulation: Simulation) -> None:
+    """Folded in day by day, the forecast ends up as if fitted once on the final figures."""
+    site = simulation.site
+    days = [
+        site.first_day + timedelta(days=i)
+        for i in range((site.last_published() - site.first_day).days + 1)
+    ]
+    expected = DegreeDayModel()
+    expected.update(
+        DailyUsageRead(
+            date=datetime.combine(day, time.min),
+            amountOfEnergy=site.kwh(day),
+            volumeOfEnergy=round(site.kwh(day) / RATIO, 2),
+            price=site.price(day) or 0.0,
+            ratio=RATIO,
+            temperature=temperature(day),
+        )
+        for day in days
+    )
+    model = simulation.coordinator.forecasts["gas"]
+
+    assert (model.days, model.fitted_days, model.last_day) == (
+        expected.days,
+        expected.fitted_days,
+        expected.last_day,
+    )
+    for fit, reference in ((model.energy, expected.energy), (model.cost, expected.cost)):
+        assert fit.w == pytest.approx(reference.w)
+        assert fit.xy == pytest.approx(reference.xy)
+        assert fit.yy == pytest.approx(reference.yy)
+    assert model.year_energy == pytest.approx(expected.year_energy)
+    assert model.month_hdd == pytest.approx(expected.month_hdd)
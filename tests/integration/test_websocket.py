@@ -0,0 +1,54 @@
+"""Tests for the gazdebordeaux websocket API."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from types import MappingProxyType
+
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.typing import WebSocketGenerator
+
+from custom_components.gazdebordeaux.const import DOMAIN
+from custom_components.gazdebordeaux.coordinator import GdbCoordinator
+from custom_components.gazdebordeaux.series import DailySeries
+
+USERNAME = "user@example.com"
+PASSWORD = "secret"
+
+
+async def test_series_query_by_month(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """A month query comes straight from the coordinator's series."""
+    assert await async_setup_component(hass, DOMAIN, {})
+    coordinator = GdbCoordinator(
+        hass, MappingProxyType({CONF_USERNAME: USERNAME, CONF_PASSWORD: PASSWORD})
+    )
+    series = coordinator.series["gas"] = DailySeries()
+    series.upsert(
+        (date(2024, 1, 1) + timedelta(days=i), (10.0, 1.0, 2.0, 5.0, 10.0)) for i in range(60)
+    )
+    hass.data[DOMAIN] = {"entry": coordinator}
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {
+            "type": f"{DOMAIN}/series",
+            "bucket": "month",
+            "fields": ["energy", "temperature"],
+            "start": "2024-02-10",
+        }
+    )
+    response = await client.receive_json()
+
+    assert response["success"]
+    # February from the 10th only.
+    assert response["result"] == {"start": ["2024-02-01"], "energy": [200.0], "temperature": [5.0]}
+
+    await client.send_json_auto_id({"type": f"{DOMAIN}/series", "category": "electricity"})
+    response = await client.receive_json()
+
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
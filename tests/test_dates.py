@@ -0,0 +1,58 @@
+"""Pure-Python tests for the Europe/Paris day helpers."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+
+from custom_components.gazdebordeaux.dates import day_start, format_day, local_day, parse_day
+
+
+@pytest.mark.parametrize(
+    ("key", "utc_start"),
+    [
+        ("2024-01-15", datetime(2024, 1, 14, 23, tzinfo=UTC)),
+        # DST starts at 02:00 on March 31: midnight is still CET.
+        ("2024-03-31", datetime(2024, 3, 30, 23, tzinfo=UTC)),
+        ("2024-04-01", datetime(2024, 3, 31, 22, tzinfo=UTC)),
+        # DST ends at 03:00 on October 27: midnight is still CEST.
+        ("2024-10-27", datetime(2024, 10, 26, 22, tzinfo=UTC)),
+        ("2024-10-28", datetime(2024, 10, 27, 23, tzinfo=UTC)),
+    ],
+)
+def test_parse_day_is_local_midnight_across_dst(key, utc_start):
+    parsed = parse_day(key)
+
+    assert parsed == utc_start
+    assert (parsed.hour, parsed.minute) == (0, 0)
+    # Hour-aligned in UTC too, unlike pytz's +00:09 LMT offset.
+    assert parsed.astimezone(UTC).minute == 0
+
+
+def test_day_start_matches_parse_day_and_is_memoized():
+    assert day_start(date(2024, 3, 31)) is parse_day("2024-03-31")
+
+
+def test_days_around_dst_change_are_23_and_25_hours_long():
+    # Same-zone subtraction is wall-clock time in Python; compare in UTC.
+    def length(key: str, next_key: str) -> timedelta:
+        return parse_day(next_key).astimezone(UTC) - parse_day(key).astimezone(UTC)
+
+    assert length("2024-03-31", "2024-04-01") == timedelta(hours=23)
+    assert length("2024-10-27", "2024-10-28") == timedelta(hours=25)
+
+
+@pytest.mark.parametrize("key", ["2024-03-31", "2024-10-27", "2024-10-28"])
+def test_local_day_round_trip(key):
+    assert format_day(local_day(parse_day(key).timestamp())) == key
+
+
+def test_format_day_accepts_datetimes():
+    assert format_day(datetime(2024, 1, 1, 13, 45)) == "2024-01-01"
+
+
+@pytest.mark.parametrize("key", ["total", "2024-02-30", ""])
+def test_parse_day_rejects_non_days(key):
+    with pytest.raises(ValueError):
+        parse_day(key)
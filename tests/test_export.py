@@ -0,0 +1,137 @@
+"""Pure-Python tests for the daily series export."""
+
+from __future__ import annotations
+
+import csv
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+from custom_components.gazdebordeaux.export import (
+    COLUMNS,
+    ExportError,
+    export,
+    export_rows,
+    last_csv_day,
+)
+
+
+def _days(count: int, first: date = date(2024, 1, 1)) -> list:
+    return [(first + timedelta(days=i), (10.0, 1.0, 2.0, 8.0, 10.0)) for i in range(count)]
+
+
+def _read(path: Path) -> list[list[str]]:
+    with path.open(newline="", encoding="utf-8") as file:
+        return list(csv.reader(file))
+
+
+def test_running_totals_start_on_the_first_series_day():
+    rows = list(export_rows(_days(10), start=date(2024, 1, 6), end=date(2024, 1, 7)))
+
+    assert [row[0] for row in rows] == [date(2024, 1, 6), date(2024, 1, 7)]
+    assert rows[0][len(COLUMNS) - 3 :] == (60.0, 6.0, 12.0)
+
+
+def test_repeated_csv_exports_append_only_new_days(tmp_path):
+    path = tmp_path / "export.csv"
+
+    first = export(path, "csv", _days(20))
+    again = export(path, "csv", _days(20))
+    later = export(path, "csv", _days(25))
+
+    assert (first.rows, again.rows, later.rows) == (20, 0, 5)
+    assert later.first == date(2024, 1, 21)
+    lines = _read(path)
+    assert lines[0] == list(COLUMNS)
+    assert len(lines) == 26
+    assert lines[-1][0] == "2024-01-25"
+    assert float(lines[-1][COLUMNS.index("energy_sum")]) == 250.0
+    assert last_csv_day(path) == date(2024, 1, 25)
+
+
+def _revise(days: list, day: date, energy: float) -> list:
+    return [(d, (energy, *values[1:]) if d == day else values) for d, values in days]
+
+
+def test_a_start_before_the_last_exported_day_rewrites_the_days_after_it(tmp_path):
+    path = tmp_path / "export.csv"
+    export(path, "csv", _days(20))
+
+    revised = _revise(_days(20), date(2024, 1, 5), 15.0)
+    result = export(path, "csv", revised, start=date(2024, 1, 5), end=date(2024, 1, 6))
+
+    assert (result.rows, result.first, result.last) == (16, date(2024, 1, 5), date(2024, 1, 20))
+    lines = _read(path)
+    assert [line[0] for line in lines[1:]] == [day.isoformat() for day, _ in _days(20)]
+    assert float(lines[5][COLUMNS.index("energy")]) == 15.0
+    assert float(lines[-1][COLUMNS.index("energy_sum")]) == 205.0
+
+
+def test_a_range_already_exported_without_a_start_is_refused(tmp_path):
+    path = tmp_path / "export.csv"
+    export(path, "csv", _days(20))
+
+    with pytest.raises(ExportError, match="2024-01-20"):
+        export(path, "csv", _days(20), end=date(2024, 1, 10))
+    assert len(_read(path)) == 21
+
+
+def test_a_rewrite_without_days_to_write_keeps_the_csv_export(tmp_path):
+    path = tmp_path / "export.csv"
+    export(path, "csv", _days(20))
+
+    result = export(path, "csv", _days(3), start=date(2024, 1, 5))
+
+    assert result.rows == 0
+    assert len(_read(path)) == 21
+
+
+def test_a_rewrite_without_days_to_write_keeps_the_parquet_parts(tmp_path):
+    path = tmp_path / "export.parquet"
+    path.mkdir()
+    # Parts are found by name; nothing is written, so pyarrow isn't needed.
+    parts = ["2024-01-01_2024-01-20.parquet", "2024-01-21_2024-01-25.parquet"]
+    for name in parts:
+        (path / name).touch()
+
+    result = export(path, "parquet", _days(3), start=date(2024, 1, 22))
+
+    assert result.rows == 0
+    assert sorted(part.name for part in path.iterdir()) == parts
+
+
+def test_parquet_exports_add_one_file_per_run(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "export.parquet"
+
+    export(path, "parquet", _days(20))
+    export(path, "parquet", _days(20))
+    export(path, "parquet", _days(25))
+
+    assert sorted(part.name for part in path.iterdir()) == [
+        "2024-01-01_2024-01-20.parquet",
+        "2024-01-21_2024-01-25.parquet",
+    ]
+    table = pq.read_table(path)
+    assert table.num_rows == 25
+    assert table.column_names == list(COLUMNS)
+
+
+def test_parquet_rewrites_replace_the_parts_holding_revised_days(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "export.parquet"
+    export(path, "parquet", _days(20))
+    export(path, "parquet", _days(25))
+
+    revised = _revise(_days(25), date(2024, 1, 22), 15.0)
+    result = export(path, "parquet", revised, start=date(2024, 1, 22))
+
+    assert (result.rows, result.first) == (5, date(2024, 1, 21))
+    assert sorted(part.name for part in path.iterdir()) == [
+        "2024-01-01_2024-01-20.parquet",
+        "2024-01-21_2024-01-25.parquet",
+    ]
+    table = pq.read_table(path).sort_by("day")
+    assert table.num_rows == 25
+    assert table.column("energy_sum")[-1].as_py() == 255.0
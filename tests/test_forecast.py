@@ -0,0 +1,132 @@
+"""Pure-Python tests for the degree-day forecast."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from custom_components.gazdebordeaux.forecast import MIN_FIT_DAYS, DegreeDayModel, degree_days
+
+
+@dataclass
+class Read:
+    date: datetime
+    amountOfEnergy: float  # noqa: N815
+    price: float
+    temperature: float | None
+
+
+def _reads(first: date, count: int) -> list[Read]:
+    """20 kWh a day plus 3 kWh per degree day; 0.5 €/day plus 0.1 €/kWh."""
+    reads = []
+    for i in range(count):
+        day = first + timedelta(days=i)
+        temperature = 5.0 + (i % 15)
+        kwh = 20.0 + 3.0 * degree_days(temperature)
+        reads.append(
+            Read(datetime.combine(day, datetime.min.time()), kwh, 0.5 + 0.1 * kwh, temperature)
+        )
+    return reads
+
+
+def test_fit_recovers_the_daily_model():
+    model = DegreeDayModel()
+    model.update(_reads(date(2024, 1, 1), 60))
+
+    assert model.energy.slope == pytest.approx(3.0)
+    assert model.energy.intercept == pytest.approx(20.0)
+    assert model.energy.r2 == pytest.approx(1.0)
+    assert model.cost.slope == pytest.approx(0.1)
+    assert model.quality()["fitted_days"] == 60
+
+
+def test_incremental_update_matches_a_single_pass():
+    reads = _reads(date(2024, 1, 1), 90)
+    batch = DegreeDayModel()
+    batch.update(reads)
+    incremental = DegreeDayModel()
+    incremental.update(reads[:40])
+    for i in range(40, 90, 3):
+        # Refreshes overlap the days already folded in; those are skipped.
+        incremental.update(reads[i - 2 : i + 3])
+
+    assert incremental.days == 90
+    assert incremental.energy.w == pytest.approx(batch.energy.w)
+    assert incremental.energy.xy == pytest.approx(batch.energy.xy)
+    expected, actual = batch.projection(), incremental.projection()
+    assert expected is not None and actual is not None
+    assert actual.year_energy == pytest.approx(expected.year_energy)
+    assert actual.year_cost == pytest.approx(expected.year_cost)
+
+
+def test_projection_adds_the_remaining_days():
+    model = DegreeDayModel()
+    model.update(_reads(date(2024, 1, 1), MIN_FIT_DAYS - 1))
+    assert model.projection() is None
+
+    model.update(_reads(date(2024, 1, 1), 60))
+    projection = model.projection()
+    assert projection is not None
+    assert projection.as_of == date(2024, 2, 29)
+    # Last day of the month: nothing left to add to February.
+    assert projection.month_energy == pytest.approx(model.month_energy)
+    assert projection.year_energy > model.year_energy + 300 * 20.0
+
+
+def test_state_round_trips():
+    reads = _reads(date(2023, 12, 20), 30)
+    model = DegreeDayModel()
+    model.update(reads)
+
+    restored = DegreeDayModel.from_dict(model.as_dict())
+
+    assert restored == model
+    # The year-to-date total restarted on January 1.
+    assert restored.year_energy == pytest.approx(sum(r.amountOfEnergy for r in reads[12:]))
+
+
+def _folded(read: Read) -> tuple[float, float, float | None]:
+    return read.amountOfEnergy, read.price, read.temperature
+
+
+def test_revised_and_late_days_match_a_single_pass():
+    reads = _reads(date(2024, 1, 1), 60)
+    revised = Read(reads[50].date, reads[50].amountOfEnergy + 8.0, 9.9, reads[50].temperature)
+    late = reads[55]
+    final = [*reads[:50], revised, *reads[51:]]
+    batch = DegreeDayModel()
+    batch.update(final)
+    incremental = DegreeDayModel()
+    incremental.update([read for read in reads if read is not late])
+
+    changed = incremental.update(
+        [reads[49], revised, late],
+        {
+            reads[49].date.date(): _folded(reads[49]),
+            revised.date.date(): _folded(reads[50]),
+            late.date.date(): None,
+        },
+    )
+
+    assert changed == 2  # the 49th day is unchanged
+    assert incremental.days == batch.days == 60
+    assert incremental.fitted_days == batch.fitted_days
+    for field in ("w", "x", "y", "xx", "xy", "yy"):
+        assert getattr(incremental.energy, field) == pytest.approx(getattr(batch.energy, field))
+        assert getattr(incremental.cost, field) == pytest.approx(getattr(batch.cost, field))
+    assert incremental.month_energy == pytest.approx(batch.month_energy)
+    assert incremental.year_cost == pytest.approx(batch.year_cost)
+    assert incremental.month_hdd == pytest.approx(batch.month_hdd)
+
+
+def test_days_already_folded_in_are_skipped_without_previous_values():
+    reads = _reads(date(2024, 1, 1), 30)
+    model = DegreeDayModel()
+    model.update(reads)
+    before = model.as_dict()
+
+    revised = Read(reads[20].date, 99.0, 9.9, reads[20].temperature)
+    assert model.update([revised]) == 0
+    assert model.as_dict() == before
@@ -1,29 +1,44 @@
 """Pure-Python tests for the Gazdebordeaux API client.
 
 These exercise the HTTP contract by mocking aiohttp via aioresponses; no
-Home Assistant fixtures are needed. We import `gazdebordeaux` as a
-top-level module to avoid pulling the package's `__init__.py`, which
-imports Home Assistant.
+Home Assistant fixtures are needed.
 """
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
+import asyncio
+import gc
+import json
+import time
+from datetime import date, datetime, timedelta
 
 import pytest
 from aiohttp import ClientSession
 from aioresponses import aioresponses
 
-sys.path.insert(
-    0, str(Path(__file__).resolve().parent.parent / "custom_components" / "gazdebordeaux")
-)
-from gazdebordeaux import (
+from custom_components.gazdebordeaux.gazdebordeaux import (
     DATA_URL,
     LOGIN_URL,
     ME_URL,
+    PARSE_CHUNK,
+    Contract,
     Gazdebordeaux,
+    parse_daily_usage,
+    parse_house_address,
+    parse_house_category,
+    parse_total_usage,
+    parse_user,
+)
+from custom_components.gazdebordeaux.policy import (
+    CircuitBreaker,
+    GdbAuthError,
+    GdbCircuitOpenError,
+    GdbError,
+    GdbTransientError,
+    GdbWafBlockedError,
+    RetryPolicy,
 )
+from custom_components.gazdebordeaux.transport import RawResponse
 
 USERNAME = "user@example.com"
 PASSWORD = "secret"
@@ -127,6 +142,63 @@ async def test_loadhouse_empty_houses_raises(http_mock, session):
         await api.loadHouse()
 
 
+# ---------- async_list_contracts --------------------------------------------
+
+
+async def test_list_contracts_returns_every_commodity(http_mock, session):
+    elec = "/api/houses/elec-uuid"
+    gas = "/api/houses/gas-uuid"
+
+    http_mock.get(ME_URL, payload={"selectedHouse": gas, "houses": [elec, gas]})
+    http_mock.get(f"{DATA_HOST}{elec}", payload={"contractType": {"category": "electricity"}})
+    http_mock.get(f"{DATA_HOST}{gas}", payload={"contractType": {"category": "gas"}})
+
+    api = Gazdebordeaux(session, USERNAME, PASSWORD, token=TOKEN)
+    contracts = await api.async_list_contracts()
+
+    assert contracts == [Contract(elec, "electricity"), Contract(gas, "gas")]
+
+
+async def test_list_contracts_labels_houses_by_category_and_address(http_mock, session):
+    gas = "/api/houses/gas-uuid"
+    http_mock.get(ME_URL, payload={"selectedHouse": gas, "houses": [gas]})
+    http_mock.get(
+        f"{DATA_HOST}{gas}",
+        payload={
+            "contractType": {"category": "gas"},
+            "address": {"street": "rue Sainte-Catherine", "zipCode": "33000", "city": "Bordeaux"},
+        },
+    )
+
+    api = Gazdebordeaux(session, USERNAME, PASSWORD, token=TOKEN)
+    [contract] = await api.async_list_contracts()
+
+    assert contract.address == "rue Sainte-Catherine 33000 Bordeaux"
+    assert contract.label == "gas - rue Sainte-Catherine 33000 Bordeaux"
+
+
+def test_house_address_falls_back_to_none():
+    assert parse_house_address({"address": "1 cours de l'Intendance"}) == "1 cours de l'Intendance"
+    assert parse_house_address({"address": {}}) is None
+    assert parse_house_address({}) is None
+    assert Contract("/api/houses/x", None).label == "? - /api/houses/x"
+
+
+async def test_total_usage_for_explicit_house(http_mock, session):
+    elec = "/api/houses/elec-uuid"
+    http_mock.get(
+        f"{DATA_URL.format(elec)}?scale=year",
+        payload={"total": {"kwh": 42, "volumeOfEnergy": None, "price": 7}},
+    )
+
+    # The selected (gas) house is ignored when a house is passed explicitly.
+    api = Gazdebordeaux(session, USERNAME, PASSWORD, token=TOKEN, house=HOUSE_PATH)
+    result = await api.async_get_total_usage(elec)
+
+    assert result.amountOfEnergy == 42
+    assert result.volumeOfEnergy == 0.0
+
+
 # ---------- async_get_data: house path normalization -----------------------
 
 
@@ -151,3 +223,301 @@ async def test_data_url_normalization(http_mock, session, house_in):
     assert result.amountOfEnergy == 100
     assert result.volumeOfEnergy == 10
     assert result.price == 50
+
+
+# ---------- headers ---------------------------------------------------------
+
+
+async def test_authenticated_headers_prebuilt_per_token(session):
+    api = Gazdebordeaux(session, USERNAME, PASSWORD, token=TOKEN)
+
+    first = api._authenticated_headers()
+    assert first is api._authenticated_headers()
+    assert first["Authorization"] == "Bearer " + TOKEN
+    assert "gzip" in first["Accept-Encoding"]
+
+    api._token = "refreshed"
+    assert api._authenticated_headers()["Authorization"] == "Bearer refreshed"
+
+
+# ---------- async_get_data: wire format -------------------------------------
+
+
+async def test_data_request_wire_format(http_mock, session):
+    url = DATA_URL.format(HOUSE_PATH)
+    http_mock.get(
+        f"{url}?scale=month&startDate=2024-01-01&endDate=2024-01-31",
+        payload={"total": {"kwh": 1, "volumeOfEnergy": 1, "price": 1}},
+    )
+
+    api = Gazdebordeaux(session, USERNAME, PASSWORD, token=TOKEN, house=HOUSE_PATH)
+    await api.async_get_data(datetime(2024, 1, 1), datetime(2024, 1, 31), "month")
+
+    ((_, sent_url), calls) = next(iter(http_mock.requests.items()))
+    assert str(sent_url.with_query(None)) == url
+    kwargs = calls[0].kwargs
+    assert kwargs.get("json") is None
+    assert kwargs.get("data") is None
+    assert kwargs["params"] == {
+        "scale": "month",
+        "startDate": "2024-01-01",
+        "endDate": "2024-01-31",
+    }
+    assert kwargs["headers"]["Authorization"] == "Bearer " + TOKEN
+    assert kwargs["headers"] is api._data_request(HOUSE_PATH, "month").headers
+    assert PASSWORD not in repr(kwargs)
+
+
+# ---------- payload parsing -------------------------------------------------
+
+
+def test_daily_usage_keeps_good_days_and_rejects_bad_ones():
+    day = {"kwh": 30, "volumeOfEnergy": 2.7, "price": 3.4, "ratio": 11.1, "temperature": 8}
+    reads, rejected = parse_daily_usage(
+        {
+            "2024-01-01": day,
+            # Optional fields may be missing or null.
+            "2024-01-02": {"kwh": 31.5, "price": None, "ratio": None},
+            "2024-01-03": {**day, "kwh": None},
+            "2024-01-04": {**day, "temperature": "8"},
+            "2024-01-05": [],
+            "not-a-day": day,
+            "total": {"kwh": 61.5},
+        }
+    )
+
+    assert [r.date.day for r in reads] == [1, 2]
+    assert reads[1].volumeOfEnergy == 0.0
+    assert reads[1].price == 0.0
+    # A null price is a placeholder, unlike the supplier's own 0.
+    assert reads[0].priced and not reads[1].priced
+    assert reads[1].ratio is None and reads[1].temperature is None
+    assert set(rejected) == {"2024-01-03", "2024-01-04", "2024-01-05", "not-a-day"}
+    assert "'kwh'" in rejected["2024-01-03"]
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [None, [], {"2024-01-01": {}}, {"total": {"kwh": "1", "price": 1}}, {"total": {"kwh": 1}}],
+)
+def test_total_usage_invalid_payload_raises(payload):
+    with pytest.raises(GdbError):
+        parse_total_usage(payload)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [None, {"selectedHouse": 3}, {"houses": "/api/houses/a"}, {"houses": [None]}],
+)
+def test_user_invalid_payload_raises(payload):
+    with pytest.raises(GdbError):
+        parse_user(payload)
+
+
+def test_house_without_contract_type_has_no_category():
+    assert parse_house_category({"contractType": None}) is None
+    assert parse_house_category({"contractType": {"category": "gas"}}) == "gas"
+
+
+async def test_rejected_days_are_kept_per_house(http_mock, session):
+    http_mock.get(
+        f"{DATA_URL.format(HOUSE_PATH)}?scale=month&startDate=2024-01-01&endDate=2024-01-02",
+        payload={"2024-01-01": {"kwh": 1.0}, "2024-01-02": {"price": 1.0}},
+    )
+    api = Gazdebordeaux(session, USERNAME, PASSWORD, token=TOKEN)
+
+    reads = await api.async_get_daily_usage(datetime(2024, 1, 1), datetime(2024, 1, 2), HOUSE_PATH)
+
+    assert len(reads) == 1
+    assert list(api.pop_rejected(HOUSE_PATH)) == ["2024-01-02"]
+    assert api.pop_rejected(HOUSE_PATH) == {}
+
+
+async def test_data_request_template_reused_until_token_changes(session):
+    api = Gazdebordeaux(session, USERNAME, PASSWORD, token=TOKEN)
+
+    first = api._data_request("houses/abc")
+    assert first.url == DATA_URL.format("/api/houses/abc")
+    assert first.params == {"scale": "day"}
+    assert api._data_request("houses/abc") is first
+    assert api._data_request("/api/houses/other") is not first
+    assert api._data_request("houses/abc", "month").params == {"scale": "month"}
+    assert api._data_request("houses/abc") is first
+
+    api._token = "refreshed"
+    assert api._data_request("houses/abc") is not first
+    assert api._data_request("houses/abc").headers["Authorization"] == "Bearer refreshed"
+
+
+# ---------- retry / circuit breaker -----------------------------------------
+
+FAST_RETRY = RetryPolicy(attempts=4, base_delay=0, max_delay=0, waf_threshold=2)
+TOTAL_URL = f"{DATA_HOST}{HOUSE_PATH}/consumptions?scale=year"
+TOTAL_PAYLOAD = {"total": {"kwh": 100, "volumeOfEnergy": 10, "price": 50}}
+WAF_PAGE = {"status": 403, "body": "<html>blocked</html>", "headers": {"Content-Type": "text/html"}}
+
+
+async def test_transient_errors_are_retried(http_mock, session):
+    http_mock.get(TOTAL_URL, status=503)
+    http_mock.get(TOTAL_URL, status=429, headers={"Retry-After": "0"})
+    http_mock.get(TOTAL_URL, payload=TOTAL_PAYLOAD)
+
+    api = Gazdebordeaux(
+        session, USERNAME, PASSWORD, token=TOKEN, house=HOUSE_PATH, retry=FAST_RETRY
+    )
+    result = await api.async_get_total_usage()
+
+    assert result.amountOfEnergy == 100
+
+
+async def test_transient_errors_give_up_after_attempts(http_mock, session):
+    http_mock.get(TOTAL_URL, status=500, repeat=True)
+
+    api = Gazdebordeaux(
+        session, USERNAME, PASSWORD, token=TOKEN, house=HOUSE_PATH, retry=FAST_RETRY
+    )
+    with pytest.raises(GdbTransientError, match="status=500"):
+        await api.async_get_total_usage()
+
+    assert len(next(iter(http_mock.requests.values()))) == FAST_RETRY.attempts
+
+
+async def test_expired_token_triggers_single_relogin(http_mock, session):
+    http_mock.get(TOTAL_URL, status=401)
+    http_mock.post(LOGIN_URL, payload={"token": "fresh"})
+    http_mock.get(TOTAL_URL, payload=TOTAL_PAYLOAD)
+
+    api = Gazdebordeaux(session, USERNAME, PASSWORD, token=TOKEN, house=HOUSE_PATH)
+    await api.async_get_total_usage()
+
+    assert api._token == "fresh"
+
+
+async def test_expired_token_twice_raises_auth_error(http_mock, session):
+    http_mock.get(TOTAL_URL, status=401, repeat=True)
+    http_mock.post(LOGIN_URL, payload={"token": "fresh"})
+
+    api = Gazdebordeaux(session, USERNAME, PASSWORD, token=TOKEN, house=HOUSE_PATH)
+    with pytest.raises(GdbAuthError):
+        await api.async_get_total_usage()
+
+
+async def test_waf_blocks_open_the_circuit(http_mock, session):
+    http_mock.get(TOTAL_URL, repeat=True, **WAF_PAGE)
+
+    api = Gazdebordeaux(
+        session, USERNAME, PASSWORD, token=TOKEN, house=HOUSE_PATH, retry=FAST_RETRY
+    )
+    with pytest.raises(GdbCircuitOpenError):
+        await api.async_get_total_usage()
+    sent = len(next(iter(http_mock.requests.values())))
+    assert sent == FAST_RETRY.waf_threshold
+
+    # While open, nothing reaches the network.
+    with pytest.raises(GdbCircuitOpenError):
+        await api.async_get_total_usage()
+    assert len(next(iter(http_mock.requests.values()))) == sent
+
+
+async def test_single_waf_block_without_retry_policy(http_mock, session):
+    http_mock.get(TOTAL_URL, **WAF_PAGE)
+
+    api = Gazdebordeaux(session, USERNAME, PASSWORD, token=TOKEN, house=HOUSE_PATH)
+    with pytest.raises(GdbWafBlockedError, match="Data response was not JSON"):
+        await api.async_get_total_usage()
+
+
+def test_circuit_breaker_half_opens_after_cooldown():
+    now = [0.0]
+    breaker = CircuitBreaker(threshold=2, cooldown=60, clock=lambda: now[0])
+
+    breaker.record_failure()
+    breaker.check()
+    breaker.record_failure()
+    with pytest.raises(GdbCircuitOpenError):
+        breaker.check()
+
+    now[0] = 61
+    breaker.check()  # half-open: one trial allowed
+    breaker.record_failure()
+    with pytest.raises(GdbCircuitOpenError):
+        breaker.check()
+
+    now[0] = 200
+    breaker.record_success()
+    breaker.check()
+
+
+def test_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(base_delay=2, max_delay=10)
+
+    for attempt in range(6):
+        cap = min(10, 2 * 2**attempt)
+        assert cap / 2 <= policy.delay(attempt) <= cap
+    assert policy.delay(0, retry_after=120) == 10
+
+
+# ---------- event loop responsiveness ---------------------------------------
+
+
+class _SlowTransport:
+    """Serves one body after a loop turn, like a network read would."""
+
+    def __init__(self, body: str) -> None:
+        self._body = body
+
+    async def send(self, method, url, **kwargs) -> RawResponse:
+        await asyncio.sleep(0)
+        return RawResponse(200, self._body, "application/json")
+
+
+async def test_ten_year_import_keeps_the_event_loop_responsive(session):
+    """Ten years of days are parsed in chunks: no stall comes near parsing them at once."""
+    days = [date(2015, 1, 1) + timedelta(days=i) for i in range(3653)]
+    body = json.dumps(
+        {
+            day.isoformat(): {
+                "kwh": 30.5,
+                "volumeOfEnergy": 2.8,
+                "price": 4.12,
+                "ratio": 10.9,
+                "temperature": 8.5,
+            }
+            for day in days
+        }
+    )
+    # Collector pauses depend on what the rest of the suite left allocated,
+    # not on chunking: keep them out of both measurements.
+    gc.collect()
+    gc.disable()
+    try:
+        t0 = time.perf_counter()
+        parse_daily_usage(json.loads(body))
+        blocking = time.perf_counter() - t0
+
+        api = Gazdebordeaux(
+            session, USERNAME, PASSWORD, token=TOKEN, transport=_SlowTransport(body)
+        )
+        stalls: list[float] = []
+        done = False
+
+        async def heartbeat() -> None:
+            last = time.perf_counter()
+            while not done:
+                await asyncio.sleep(0)
+                now = time.perf_counter()
+                stalls.append(now - last)
+                last = now
+
+        beat = asyncio.create_task(heartbeat())
+        await asyncio.sleep(0)
+        reads = await api.async_get_daily_usage(days[0], days[-1], HOUSE_PATH)
+        done = True
+        await beat
+    finally:
+        gc.enable()
+
+    assert len(reads) == len(days)
+    assert len(stalls) >= len(days) // PARSE_CHUNK
+    # The worst stall is the JSON decode plus one chunk.
+    assert max(stalls) < blocking * 0.75
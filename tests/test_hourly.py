@@ -0,0 +1,48 @@
+"""Pure-Python tests for the hourly disaggregation."""
+
+from __future__ import annotations
+
+import itertools
+from datetime import UTC, date, datetime
+
+import pytest
+
+from custom_components.gazdebordeaux.hourly import HEATING, RESIDENTIAL, day_hours, disaggregate
+
+
+def test_dst_days_have_23_and_25_hours():
+    spring, _ = day_hours(date(2024, 3, 31).toordinal())
+    autumn, hours = day_hours(date(2024, 10, 27).toordinal())
+
+    assert len(spring) == 23
+    assert spring[0] == datetime(2024, 3, 30, 23, tzinfo=UTC)
+    assert len(autumn) == 25
+    # 2 AM happens twice.
+    assert hours[:4] == (0, 1, 2, 2)
+
+
+def test_hourly_sums_meet_the_daily_sums():
+    days = [date(2024, 3, 30), date(2024, 3, 31), date(2024, 4, 1)]
+    rows = disaggregate(days, [10.0, 20.0, 30.0], [110.0, 130.0, 160.0], [None] * 3, "flat")
+
+    assert len(rows) == 24 + 23 + 24
+    assert rows[0][2] == pytest.approx(100.0 + 10.0 / 24)
+    assert [rows[i][2] for i in (23, 46, 70)] == [110.0, 130.0, 160.0]
+    assert sum(amount for _, amount, _ in rows) == pytest.approx(60.0)
+    assert all(a[2] <= b[2] for a, b in itertools.pairwise(rows))
+
+
+def test_residential_profile_follows_its_shape():
+    rows = disaggregate([date(2024, 6, 3)], [24.0], [24.0], [None], "residential")
+
+    amounts = [amount for _, amount, _ in rows]
+    assert amounts == pytest.approx([24.0 * w / sum(RESIDENTIAL) for w in RESIDENTIAL])
+
+
+def test_temperature_profile_shifts_to_heating_on_cold_days():
+    day = [date(2024, 1, 8)]
+    cold = [a for _, a, _ in disaggregate(day, [24.0], [24.0], [-2.0], "temperature")]
+    mild = [a for _, a, _ in disaggregate(day, [24.0], [24.0], [20.0], "temperature")]
+
+    assert cold == pytest.approx([24.0 * w / sum(HEATING) for w in HEATING])
+    assert mild == pytest.approx([24.0 * w / sum(RESIDENTIAL) for w in RESIDENTIAL])
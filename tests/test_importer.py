@@ -0,0 +1,154 @@
+"""Pure-Python tests for the serialized import worker."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+
+import pytest
+
+from custom_components.gazdebordeaux.importer import ImportWorker, merge_ranges
+
+
+class Recorder:
+    """Stand-in jobs recording their calls and checking they never overlap."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+        self.finished = 0
+        self.flushes = 0
+        self.active = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def _job(self, *call: object) -> None:
+        assert self.active == 0, "jobs overlap"
+        self.active += 1
+        self.calls.append(call)
+        try:
+            await self.release.wait()
+            self.finished += 1
+        finally:
+            self.active -= 1
+
+    async def incremental(self, deadline: float | None) -> None:
+        await self._job("refresh", deadline)
+
+    async def ranged(self, start: date, end: date) -> None:
+        await self._job("range", start, end)
+
+    async def flush(self) -> None:
+        self.flushes += 1
+
+    def worker(self) -> ImportWorker:
+        return ImportWorker("gas", self.incremental, self.ranged, self.flush)
+
+
+def test_ranges_merge_when_they_overlap_or_touch():
+    assert merge_ranges(
+        [
+            (date(2024, 3, 1), date(2024, 3, 10)),
+            (date(2024, 1, 1), date(2024, 1, 31)),
+            (date(2024, 2, 1), date(2024, 2, 15)),
+            (date(2024, 3, 5), date(2024, 3, 7)),
+        ]
+    ) == [(date(2024, 1, 1), date(2024, 2, 15)), (date(2024, 3, 1), date(2024, 3, 10))]
+
+
+async def test_simultaneous_triggers_collapse_into_one_import():
+    jobs = Recorder()
+    worker = jobs.worker()
+
+    await asyncio.gather(*(worker.request_refresh(deadline) for deadline in (30.0, 10.0, None)))
+
+    assert jobs.calls == [("refresh", 10.0)]
+
+
+async def test_requests_during_a_job_are_merged_into_the_next_one():
+    jobs = Recorder()
+    worker = jobs.worker()
+    jobs.release.clear()
+    first = worker.request_refresh()
+    await asyncio.sleep(0.01)
+
+    later = [
+        worker.request_refresh(),
+        worker.request_range(date(2024, 1, 10), date(2024, 1, 20)),
+        worker.request_range(date(2024, 1, 1), date(2024, 1, 9)),
+        worker.request_refresh(),
+    ]
+    jobs.release.set()
+    await asyncio.gather(first, *later)
+
+    # Ranges first, then one refresh for both triggers; the queued rows are
+    # flushed before each job reads the sums back.
+    assert jobs.calls == [
+        ("refresh", None),
+        ("range", date(2024, 1, 1), date(2024, 1, 20)),
+        ("refresh", None),
+    ]
+    assert jobs.flushes == 2
+    assert worker.runs == {"refresh": 2, "range": 1, "job": 0}
+
+
+async def test_a_failure_reaches_only_the_callers_of_that_job():
+    jobs = Recorder()
+    worker = jobs.worker()
+
+    async def failing() -> None:
+        raise RuntimeError("boom")
+
+    failed = worker.run(failing)
+    refreshed = worker.request_refresh()
+
+    with pytest.raises(RuntimeError):
+        await failed
+    await refreshed
+    assert jobs.calls == [("refresh", None)]
+
+
+async def test_a_job_every_caller_gave_up_on_is_cancelled():
+    jobs = Recorder()
+    worker = jobs.worker()
+    jobs.release.clear()
+
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(0.01):
+            await worker.request_range(date(2024, 1, 1), date(2024, 1, 31))
+    await asyncio.sleep(0.01)
+
+    assert jobs.calls == [("range", date(2024, 1, 1), date(2024, 1, 31))]
+    assert (jobs.active, jobs.finished) == (0, 0)
+    jobs.release.set()
+    await worker.request_refresh()
+    assert jobs.calls[-1] == ("refresh", None)
+
+
+async def test_a_job_cancelled_from_inside_releases_its_callers():
+    jobs = Recorder()
+    worker = jobs.worker()
+
+    async def cancelled() -> None:
+        raise asyncio.CancelledError
+
+    waiting = worker.run(cancelled)
+    await asyncio.wait([waiting], timeout=1)
+
+    assert waiting.cancelled()
+    await worker.request_refresh()
+    assert jobs.calls == [("refresh", None)]
+
+
+async def test_stopping_during_a_job_cancels_its_callers():
+    jobs = Recorder()
+    worker = jobs.worker()
+    jobs.release.clear()
+
+    imported = worker.request_range(date(2024, 1, 1), date(2024, 1, 31))
+    await asyncio.sleep(0.01)
+    assert jobs.active == 1
+    await worker.async_stop()
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(imported, timeout=1)
+    assert (jobs.active, jobs.finished) == (0, 0)
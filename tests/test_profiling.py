@@ -0,0 +1,38 @@
+"""Pure-Python tests for the refresh profiler."""
+
+from __future__ import annotations
+
+import asyncio
+import pstats
+import tracemalloc
+
+from custom_components.gazdebordeaux.profiling import PhaseTimer, async_profile, timed
+
+
+async def _fake_refresh(timer: PhaseTimer) -> None:
+    for _ in range(2):
+        with timed(timer, "network"):
+            await asyncio.sleep(0.01)
+        with timed(timer, "parse"):
+            _ = [str(i) for i in range(10_000)]
+
+
+async def test_profile_times_phases_and_writes_files(tmp_path):
+    result = await async_profile(_fake_refresh, top=5)
+
+    assert result.timer.counts == {"network": 2, "parse": 2}
+    assert result.timer.totals["network"] >= 0.02
+    assert result.wall >= result.timer.totals["network"]
+    assert 0 < len(result.allocations) <= 5
+    assert not tracemalloc.is_tracing()
+
+    profile_path, summary_path = result.write(tmp_path, "profile")
+    assert pstats.Stats(str(profile_path)).total_calls > 0
+    summary = summary_path.read_text(encoding="utf-8")
+    assert "network" in summary
+    assert "_fake_refresh" in summary
+
+
+def test_timed_without_timer_is_a_no_op():
+    with timed(None, "network"):
+        pass
@@ -0,0 +1,84 @@
+"""Pure-Python tests for the drift bisection and the sum rewriting."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from custom_components.gazdebordeaux.reconcile import (
+    Row,
+    SumIndex,
+    find_divergent,
+    month_windows,
+    resum,
+)
+
+
+def _rows(values: list[float], first: date = date(2024, 1, 1)) -> list[Row]:
+    rows, running = [], 0.0
+    for i, value in enumerate(values):
+        running += value
+        rows.append(Row(first + timedelta(days=i), value, running, start=float(i)))
+    return rows
+
+
+def test_month_windows_clip_to_the_period():
+    assert month_windows(date(2024, 11, 15), date(2025, 1, 10)) == [
+        (date(2024, 11, 15), date(2024, 11, 30)),
+        (date(2024, 12, 1), date(2024, 12, 31)),
+        (date(2025, 1, 1), date(2025, 1, 10)),
+    ]
+
+
+def test_sum_index_changes_over_windows():
+    index = SumIndex(_rows([1.0] * 60))
+    assert index.through(date(2023, 12, 31)) == 0.0
+    assert index.change((date(2024, 1, 1), date(2024, 1, 31))) == 31.0
+    assert index.change((date(2024, 2, 1), date(2024, 3, 31))) == 29.0
+
+
+async def test_bisection_fetches_only_left_halves():
+    windows = month_windows(date(2024, 1, 1), date(2024, 12, 31))
+    supplier_months = {window: 100.0 for window in windows}
+    recorded_months = dict(supplier_months)
+    recorded_months[windows[8]] = 90.0  # September lost 10 kWh
+    fetched: list[tuple[date, date]] = []
+
+    def recorded(span: tuple[date, date]) -> float:
+        return sum(v for w, v in recorded_months.items() if span[0] <= w[0] and w[1] <= span[1])
+
+    async def supplier(window: tuple[date, date]) -> float:
+        fetched.append(window)
+        return supplier_months[window]
+
+    divergent = await find_divergent(windows, 1200.0, recorded, supplier, 0.5)
+
+    assert divergent == [windows[8]]
+    # January-June, then July-September, then July and August: October to
+    # December are only ever known by subtraction.
+    assert set(fetched) == set(windows[:9])
+
+
+async def test_bisection_stops_when_totals_agree():
+    windows = month_windows(date(2024, 1, 1), date(2024, 3, 31))
+
+    async def supplier(window: tuple[date, date]) -> float:
+        raise AssertionError("nothing to fetch")
+
+    assert await find_divergent(windows, 30.0, lambda span: 30.4, supplier, 0.5) == []
+
+
+def test_resum_replaces_days_and_shifts_the_rest():
+    existing = _rows([5.0, 5.0, 5.0, 5.0, 5.0])
+    rows = resum(existing, {date(2024, 1, 2): 10.0, date(2024, 1, 4): 0.0})
+
+    assert [row.day.day for row in rows] == [2, 3, 4, 5]
+    assert [row.state for row in rows] == [10.0, 5.0, 0.0, 5.0]
+    assert [row.sum for row in rows] == [15.0, 20.0, 20.0, 25.0]
+    assert [row.start for row in rows] == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_resum_adds_missing_days():
+    existing = [Row(date(2024, 1, 1), 1.0, 1.0, 0.0), Row(date(2024, 1, 3), 1.0, 2.0, 2.0)]
+    rows = resum(existing, {date(2024, 1, 2): 2.0})
+
+    assert [(row.day.day, row.sum, row.start) for row in rows] == [(2, 3.0, None), (3, 4.0, 2.0)]
@@ -0,0 +1,78 @@
+"""Pure-Python tests for the in-memory daily series."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from custom_components.gazdebordeaux.series import DailySeries, bucket_end, bucket_start
+
+
+def _series(days: int, first: date = date(2024, 1, 1)) -> DailySeries:
+    series = DailySeries()
+    series.upsert(
+        (first + timedelta(days=i), (10.0, 1.0, 2.0, float(i % 10), 10.0)) for i in range(days)
+    )
+    return series
+
+
+def test_buckets_start_on_monday_and_first_of_month():
+    assert bucket_start(date(2024, 3, 14), "week") == date(2024, 3, 11)
+    assert bucket_start(date(2024, 3, 14), "month") == date(2024, 3, 1)
+    assert bucket_start(date(2024, 3, 14), "day") == date(2024, 3, 14)
+    assert bucket_end(date(2024, 2, 1), "month") == date(2024, 2, 29)
+    assert bucket_end(date(2024, 12, 1), "month") == date(2024, 12, 31)
+    assert bucket_end(date(2024, 3, 11), "week") == date(2024, 3, 17)
+
+
+def test_month_buckets_sum_and_average():
+    result = _series(60).query("month", ["energy", "temperature"])
+
+    assert result["start"] == ["2024-01-01", "2024-02-01"]
+    assert result["energy"] == [310.0, 290.0]
+    january, february = range(31), range(31, 60)
+    assert result["temperature"] == [
+        round(sum(i % 10 for i in january) / 31, 3),
+        round(sum(i % 10 for i in february) / 29, 3),
+    ]
+
+
+def test_edge_buckets_only_count_the_days_in_the_range():
+    result = _series(60).query("week", ["cost"], date(2024, 1, 10), date(2024, 1, 22))
+
+    # Weeks of January 8 (from the 10th), 15 and 22 (its first day only).
+    assert result["start"] == ["2024-01-08", "2024-01-15", "2024-01-22"]
+    assert result["cost"] == [10.0, 14.0, 2.0]
+
+
+def test_a_range_inside_one_bucket_is_clipped_on_both_sides():
+    series = _series(60)
+    result = series.query("month", ["energy", "temperature"], date(2024, 2, 3), date(2024, 2, 5))
+
+    assert result["start"] == ["2024-02-01"]
+    assert result["energy"] == [30.0]
+    assert result["temperature"] == [round((33 % 10 + 34 % 10 + 35 % 10) / 3, 3)]
+    # The cached table still holds whole months.
+    assert series.query("month", ["energy"])["energy"] == [310.0, 290.0]
+
+
+def test_tables_are_cached_until_days_change():
+    series = _series(30)
+    table = series.table("month")
+    assert series.table("month") is table
+
+    assert series.upsert([(date(2024, 1, 5), (10.0, 1.0, 2.0, 4.0, 10.0))]) == 0
+    assert series.table("month") is table
+
+    assert series.upsert([(date(2024, 1, 31), (10.0, 1.0, 2.0, None, 10.0))]) == 1
+    assert series.table("month") is not table
+    assert series.query("month", ["energy"])["energy"] == [310.0]
+
+
+def test_state_round_trips():
+    series = _series(45)
+    restored = DailySeries.from_dict(series.as_dict())
+
+    assert len(restored) == 45
+    assert restored.query("week", ["energy", "temperature"]) == series.query(
+        "week", ["energy", "temperature"]
+    )
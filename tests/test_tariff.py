@@ -0,0 +1,125 @@
+"""Pure-Python tests for the local tariff model."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+
+import pytest
+
+from custom_components.gazdebordeaux.const import (
+    TARIFF_KWH_PRICE,
+    TARIFF_PERIODS,
+    TARIFF_START,
+    TARIFF_SUBSCRIPTION,
+)
+from custom_components.gazdebordeaux.gazdebordeaux import DailyUsageRead
+from custom_components.gazdebordeaux.tariff import Tariff, TariffPeriod
+
+
+def _read(day: str, kwh: float, price: float | None) -> DailyUsageRead:
+    return DailyUsageRead(
+        date=datetime.fromisoformat(day),
+        amountOfEnergy=kwh,
+        volumeOfEnergy=kwh / 11,
+        price=price,  # type: ignore[arg-type]
+        ratio=11.0,
+        temperature=10.0,
+    )
+
+
+TARIFF = Tariff(
+    [
+        TariffPeriod(start=date(2024, 1, 1), kwh_price=0.10, subscription_per_day=0.5),
+        TariffPeriod(start=date(2024, 7, 1), kwh_price=0.20, subscription_per_day=0.5),
+    ]
+)
+
+
+def test_supplier_price_is_kept():
+    reads = [_read("2024-03-01", 10, 1.23)]
+
+    assert TARIFF.apply(reads) == 0
+    assert reads[0].price == 1.23
+    assert not reads[0].estimated
+
+
+@pytest.mark.parametrize("missing", [None, 0, 0.0])
+def test_missing_price_is_estimated(missing):
+    reads = [_read("2024-03-01", 10, missing)]
+
+    assert TARIFF.apply(reads) == 1
+    assert reads[0].price == pytest.approx(0.5 + 10 * 0.10)
+    assert reads[0].estimated
+
+
+def test_effective_dates_pick_the_right_period():
+    # Deliberately out of order: apply() must not depend on input ordering.
+    reads = [
+        _read("2024-07-01", 10, None),
+        _read("2024-06-30", 10, None),
+        _read("2025-01-01", 1, None),
+    ]
+
+    TARIFF.apply(reads)
+
+    assert reads[0].price == pytest.approx(0.5 + 10 * 0.20)
+    assert reads[1].price == pytest.approx(0.5 + 10 * 0.10)
+    assert reads[2].price == pytest.approx(0.5 + 1 * 0.20)
+
+
+def test_day_before_first_period_is_flagged_only():
+    reads = [_read("2023-12-31", 10, None)]
+
+    assert TARIFF.apply(reads) == 1
+    assert reads[0].price == 0.0
+    assert reads[0].estimated
+
+
+def test_empty_tariff_only_flags():
+    reads = [_read("2024-03-01", 10, None), _read("2024-03-02", 10, 2.0)]
+
+    assert Tariff().apply(reads) == 1
+    assert [r.price for r in reads] == [0.0, 2.0]
+    assert [r.estimated for r in reads] == [True, False]
+
+
+def test_zero_consumption_day_keeps_its_zero_price():
+    # Gas in summer: nothing used, nothing owed beyond what the supplier says.
+    reads = [_read("2024-08-01", 0, 0.0)]
+
+    assert TARIFF.apply(reads) == 0
+    assert reads[0].price == 0.0
+    assert not reads[0].estimated
+
+
+def test_zero_consumption_day_without_price_is_estimated():
+    reads = [_read("2024-08-01", 0, None), _read("2024-08-02", 0, 0.0)]
+    reads[1].priced = False  # null in the payload, parsed as a 0 placeholder
+
+    assert TARIFF.apply(reads) == 2
+    assert [r.price for r in reads] == [pytest.approx(0.5), pytest.approx(0.5)]
+    assert all(r.estimated for r in reads)
+
+
+def test_flat_from_options():
+    assert not Tariff.flat(None, 200)
+    flat = Tariff.flat(0.12, 365)
+    assert flat.cost(date(2024, 3, 1), 10) == pytest.approx(1.0 + 1.2)
+
+
+def test_a_new_tariff_keeps_the_one_it_replaced_before_its_start():
+    old = Tariff.from_entry({TARIFF_KWH_PRICE: 0.10, TARIFF_SUBSCRIPTION: 365})
+    data = {
+        TARIFF_KWH_PRICE: 0.20,
+        TARIFF_SUBSCRIPTION: 365,
+        TARIFF_START: "2024-07-01",
+        TARIFF_PERIODS: [p.as_dict() for p in old.periods_before(date(2024, 7, 1))],
+    }
+
+    tariff = Tariff.from_entry(data)
+
+    assert tariff.cost(date(2024, 6, 30), 10) == pytest.approx(1.0 + 1.0)
+    assert tariff.cost(date(2024, 7, 1), 10) == pytest.approx(1.0 + 2.0)
+    # Saved again from an earlier day, the new rates replace the old ones from there.
+    assert [p.kwh_price for p in tariff.periods_before(date(2024, 1, 1))] == [0.10]
+    assert tariff.periods_before(None) == []
@@ -0,0 +1,145 @@
+"""Pure-Python tests for the recording and replay transports."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+
+import pytest
+from aiohttp import ClientConnectionError, ClientSession
+from aioresponses import aioresponses
+
+from custom_components.gazdebordeaux.gazdebordeaux import DATA_URL, LOGIN_URL, Gazdebordeaux
+from custom_components.gazdebordeaux.policy import GdbTransientError
+from custom_components.gazdebordeaux.transport import (
+    REDACTED,
+    RecordingTransport,
+    ReplayTransport,
+    SessionTransport,
+)
+
+USERNAME = "user@example.com"
+PASSWORD = "secret"
+TOKEN = "fake-jwt-token"
+HOUSE_PATH = "/api/houses/abc"
+DAILY = {
+    "2024-01-01": {
+        "kwh": 30.0,
+        "volumeOfEnergy": 2.7,
+        "price": 3.4,
+        "ratio": 11.1,
+        "temperature": 8,
+    },
+    "2024-01-02": {
+        "kwh": 31.0,
+        "volumeOfEnergy": 2.8,
+        "price": 3.5,
+        "ratio": 11.1,
+        "temperature": 7,
+    },
+    "total": {"kwh": 61.0, "volumeOfEnergy": 5.5, "price": 6.9},
+}
+
+
+@pytest.fixture
+def http_mock():
+    with aioresponses() as m:
+        yield m
+
+
+@pytest.fixture
+async def session():
+    async with ClientSession() as s:
+        yield s
+
+
+async def _record(http_mock, session, size: int = 20) -> RecordingTransport:
+    http_mock.post(LOGIN_URL, payload={"token": TOKEN})
+    http_mock.get(
+        f"{DATA_URL.format(HOUSE_PATH)}?scale=month&startDate=2024-01-01&endDate=2024-01-02",
+        payload=DAILY,
+    )
+    recorder = RecordingTransport(SessionTransport(session), size)
+    api = Gazdebordeaux(session, USERNAME, PASSWORD, house=HOUSE_PATH, transport=recorder)
+    await api.async_login()
+    await api.async_get_daily_usage(datetime(2024, 1, 1), datetime(2024, 1, 2))
+    return recorder
+
+
+async def test_recording_is_redacted(http_mock, session):
+    har = json.dumps((await _record(http_mock, session)).to_har())
+
+    assert PASSWORD not in har
+    assert USERNAME not in har
+    assert TOKEN not in har
+    assert REDACTED in har
+    # The consumption payload itself is kept as-is.
+    assert '"2024-01-02"' in har
+
+
+async def test_recording_redacts_the_customer_and_the_contract_address(http_mock, session):
+    http_mock.get(
+        "https://life.gazdebordeaux.fr/api/users/me",
+        payload={"firstName": "Jeanne", "lastName": "Dupont", "houses": [HOUSE_PATH]},
+    )
+    http_mock.get(
+        f"https://life.gazdebordeaux.fr{HOUSE_PATH}",
+        payload={
+            "contractType": {"category": "gas"},
+            "name": "Jeanne Dupont",
+            "address": {"streetNumber": "12", "street": "rue Sainte-Catherine", "city": "Bordeaux"},
+            "billing": {"zipCode": "33000"},
+        },
+    )
+    recorder = RecordingTransport(SessionTransport(session))
+    api = Gazdebordeaux(session, USERNAME, PASSWORD, token=TOKEN, transport=recorder)
+    (contract,) = await api.async_list_contracts()
+    entries = recorder.to_har()["log"]["entries"]
+    har = json.dumps(entries, ensure_ascii=False)
+
+    # The live client still sees the address; the recording doesn't.
+    assert contract.address == "12 rue Sainte-Catherine Bordeaux"
+    for personal in ("Jeanne", "Dupont", "Sainte-Catherine", "Bordeaux", "33000"):
+        assert personal not in har
+    house = json.loads(entries[-1]["response"]["content"]["text"])
+    assert house["contractType"] == {"category": "gas"}
+    assert house["address"] == REDACTED
+
+
+async def test_ring_keeps_only_the_last_exchanges(http_mock, session):
+    recorder = await _record(http_mock, session, size=1)
+
+    entries = recorder.to_har()["log"]["entries"]
+    assert len(recorder) == 1
+    assert entries[0]["request"]["method"] == "GET"
+
+
+async def test_replay_serves_recorded_payloads(http_mock, session):
+    har = (await _record(http_mock, session)).to_har()
+    live = await Gazdebordeaux(
+        session, USERNAME, PASSWORD, token=TOKEN, house=HOUSE_PATH, transport=ReplayTransport(har)
+    ).async_get_daily_usage(datetime(2024, 1, 1), datetime(2024, 1, 2))
+
+    assert [r.amountOfEnergy for r in live] == [30.0, 31.0]
+    assert str(live[0].date.date()) == "2024-01-01"
+
+
+async def test_replay_recorded_failure_is_transient(http_mock, session):
+    http_mock.post(LOGIN_URL, exception=ClientConnectionError("reset"))
+    recorder = RecordingTransport(SessionTransport(session))
+    with pytest.raises(GdbTransientError):
+        await Gazdebordeaux(session, USERNAME, PASSWORD, transport=recorder).async_login()
+
+    replayed = Gazdebordeaux(
+        session, USERNAME, PASSWORD, transport=ReplayTransport(recorder.to_har())
+    )
+    with pytest.raises(GdbTransientError):
+        await replayed.async_login()
+
+
+async def test_replay_unknown_request_raises(session):
+    replay = ReplayTransport({"log": {"entries": []}})
+    with pytest.raises(LookupError):
+        await Gazdebordeaux(
+            session, USERNAME, PASSWORD, token=TOKEN, house=HOUSE_PATH, transport=replay
+        ).async_get_total_usage()